@@ -1,12 +1,12 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
-                           QHBoxLayout, QLabel, QSlider, QComboBox, QPushButton, QCheckBox,
-                           QTextEdit, QSpinBox, QColorDialog, QGroupBox, QGridLayout)
+                           QHBoxLayout, QLabel, QPushButton,
+                           QTextEdit, QColorDialog, QGroupBox, QGridLayout)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor
 
 from src.core.audio_processing import AudioProcessor
-from src.ui.widgets import VisualizationWidget, FrequencyDisplayWidget
+from src.ui.widgets import create_visualization_widget, FrequencyDisplayWidget
 from src.ui.control_panel import ControlPanel
 from src.ui.debug_console import DebugConsole
 
@@ -32,12 +32,14 @@ class MainWindow(QMainWindow):
         self.viz_layout = QVBoxLayout()
 
         # Create visualization widget
-        self.visualization = VisualizationWidget()
+        self.visualization = create_visualization_widget()
         self.viz_layout.addWidget(self.visualization)
 
         # Add frequency display
         self.freq_display = FrequencyDisplayWidget()
         self.freq_display.setMinimumHeight(150)
+        # Height last set from the control panel
+        self._freq_display_height = 150
         self.viz_layout.addWidget(self.freq_display)
 
         self.viz_widget.setLayout(self.viz_layout)
@@ -53,7 +55,13 @@ class MainWindow(QMainWindow):
 
         # Initialize audio processing
         self.audio_processor = AudioProcessor()
-        self.audio_processor.audio_data.connect(self.process_audio)
+        self.audio_processor.audio_data.connect(self.process_audio, Qt.QueuedConnection)
+        # Pace audio updates to the display: at most one per animation
+        # frame, and at most one per chunk of audio so the engine steps at
+        # the rate its speeds are tuned for. The processor emits nothing
+        # until the next request_data, so at most one update is ever
+        # queued and no stale backlog can build up
+        self.visualization.timer.timeout.connect(self.audio_processor.request_data)
         self.audio_processor.start()
 
         # Apply default settings
@@ -62,6 +70,16 @@ class MainWindow(QMainWindow):
             self.audio_processor
         )
 
+        # Control changes are applied once the user pauses, so dragging a
+        # slider doesn't push every intermediate value to the engine
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(75)
+        self._apply_timer.timeout.connect(self.apply_settings)
+
+        # Connected screens, refreshed when one is added or removed
+        self._screens = QApplication.screens()
+
         # Connect control panel signals
         self.connect_signals()
 
@@ -75,37 +93,19 @@ class MainWindow(QMainWindow):
         # Connect FPS control
         self.control_panel.fps_spin.valueChanged.connect(self.visualization.set_fps)
 
-        # Connect fullscreen toggle
+        # Connect fullscreen toggle, keeping the screen list current
         self.control_panel.fullscreen_check.stateChanged.connect(self.toggle_fullscreen)
+        app = QApplication.instance()
+        app.screenAdded.connect(self._refresh_screens)
+        app.screenRemoved.connect(self._refresh_screens)
 
-        # Connect frequency display toggle and height
+        # Connect frequency display toggle (its height is set with the
+        # other settings in apply_settings)
         self.control_panel.freq_display_check.stateChanged.connect(self.toggle_freq_display)
-        self.control_panel.freq_height_slider.valueChanged.connect(self.set_freq_display_height)
-
-        # Connect all controls including wireframe controls
-        for obj in self.control_panel.findChildren(QSlider) + \
-                  self.control_panel.findChildren(QComboBox) + \
-                  self.control_panel.findChildren(QSpinBox) + \
-                  self.control_panel.findChildren(QCheckBox):
-            if isinstance(obj, QSlider):
-                obj.valueChanged.connect(self.apply_settings)
-            elif isinstance(obj, QComboBox):
-                obj.currentIndexChanged.connect(self.apply_settings)
-            elif isinstance(obj, QSpinBox):
-                obj.valueChanged.connect(self.apply_settings)
-            elif isinstance(obj, QCheckBox):
-                obj.stateChanged.connect(self.apply_settings)
-
-        # Connect color buttons
-        self.control_panel.base_color_btn.clicked.connect(
-            lambda: self.apply_settings_after_delay())
-        self.control_panel.secondary_color_btn.clicked.connect(
-            lambda: self.apply_settings_after_delay())
-
-        # Connect wireframe color button
-        if hasattr(self.control_panel, 'cube_color_btn'):
-            self.control_panel.cube_color_btn.clicked.connect(
-                lambda: self.apply_settings_after_delay())
+
+        # Any control change, including the wireframe controls and the
+        # colors picked with the color buttons
+        self.control_panel.settingsChanged.connect(self.schedule_apply_settings)
 
     def toggle_freq_display(self, state):
         """Toggle visibility of the frequency display"""
@@ -114,8 +114,10 @@ class MainWindow(QMainWindow):
 
     def set_freq_display_height(self, height):
         """Set the height of the frequency display"""
-        self.freq_display.setMinimumHeight(height)
-        self.freq_display.setMaximumHeight(height)
+        if height == self._freq_display_height:
+            return
+        self._freq_display_height = height
+        self.freq_display.setFixedHeight(height)
         self.debug_console.log(f"Frequency display height set to {height}px")
 
     def apply_settings(self):
@@ -124,23 +126,39 @@ class MainWindow(QMainWindow):
             self.visualization.engine,
             self.audio_processor
         )
+        # Redraw even if no audio arrives to update the frame
+        if self.visualization.engine:
+            self.visualization.engine.invalidate()
+        self.set_freq_display_height(self.control_panel.freq_height_slider.value())
         self.debug_console.log("Settings applied")
 
-    def apply_settings_after_delay(self):
-        """Apply settings after a short delay (for color dialog)"""
-        QTimer.singleShot(100, self.apply_settings)
+    def schedule_apply_settings(self, *args):
+        """Apply settings once the controls have been still for a moment"""
+        self._apply_timer.start()
+
+    def _refresh_screens(self, *args):
+        """Update the list of connected screens"""
+        self._screens = QApplication.screens()
 
     def toggle_fullscreen(self, state):
         """Toggle fullscreen mode based on checkbox state"""
         monitor = self.control_panel.monitor_combo.currentIndex()
-        self.visualization.toggle_fullscreen(state == Qt.Checked, monitor)
+        geometry = None
+        if 0 <= monitor < len(self._screens):
+            geometry = self._screens[monitor].geometry()
+        self.visualization.toggle_fullscreen(state == Qt.Checked, monitor, geometry)
         if state == Qt.Checked:
             self.debug_console.log(f"Entered fullscreen mode on monitor {monitor+1}")
         else:
             self.debug_console.log("Exited fullscreen mode")
 
     def process_audio(self, spectrum, bands, volume, raw_audio):
-        """Process audio data from audio processor"""
+        """Process audio data from audio processor
+
+        Runs at most once per animation frame and once per audio chunk:
+        the audio processor only emits after the visualization timer has
+        called request_data and a full chunk of samples has arrived.
+        """
         # Update visualizations with raw audio data
         self.visualization.process_audio(spectrum, bands, volume, raw_audio)
         self.freq_display.update_data(spectrum, bands, volume)
@@ -0,0 +1,76 @@
+import threading
+import numpy as np
+
+# =============================================================================
+# Core Module: Audio Ring Buffer
+# =============================================================================
+
+class AudioRingBuffer:
+    """Single-producer/single-consumer ring buffer of int16 audio samples
+
+    The audio driver's callback thread pushes samples and the processing
+    thread pops fixed-size chunks. Neither side takes a lock: each side only
+    advances its own position counter, so the real-time callback never
+    blocks on the Python processing thread. If the consumer falls more than
+    a full buffer behind, it skips ahead to the newest audio.
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+
+        # Total samples written/read so far (only ever increase)
+        self._write_pos = 0
+        self._read_pos = 0
+
+        self._data_ready = threading.Event()
+
+    def available(self):
+        """Number of samples waiting to be read"""
+        return self._write_pos - self._read_pos
+
+    def push(self, samples):
+        """Append samples, overwriting the oldest data when full"""
+        count = len(samples)
+        if count > self.capacity:
+            samples = samples[-self.capacity:]
+            self._write_pos += count - self.capacity
+            count = self.capacity
+
+        start = self._write_pos % self.capacity
+        first = min(count, self.capacity - start)
+        self._buffer[start:start + first] = samples[:first]
+        self._buffer[:count - first] = samples[first:]
+
+        self._write_pos += count
+        self._data_ready.set()
+
+    def pop(self, out, timeout=None):
+        """Fill ``out`` with the next ``len(out)`` samples
+
+        Blocks until enough samples are available. Returns False if the
+        timeout expires first, leaving ``out`` untouched.
+        """
+        count = len(out)
+        while self.available() < count:
+            self._data_ready.clear()
+            # Re-check after clearing so a push in between isn't missed
+            if self.available() >= count:
+                break
+            if not self._data_ready.wait(timeout):
+                return False
+
+        # Skip to the most recent chunk if the producer lapped us
+        if self.available() > self.capacity:
+            self._read_pos = self._write_pos - count
+
+        start = self._read_pos % self.capacity
+        first = min(count, self.capacity - start)
+        out[:first] = self._buffer[start:start + first]
+        out[first:] = self._buffer[:count - first]
+
+        self._read_pos += count
+        return True
+
+    def clear(self):
+        """Discard all buffered samples"""
+        self._read_pos = self._write_pos
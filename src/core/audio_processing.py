@@ -2,18 +2,32 @@ import numpy as np
 import pyaudio
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from src.core.audio_buffer import AudioRingBuffer
+
+# pyFFTW is optional; without it the FFT falls back to np.fft.rfft
+try:
+    import pyfftw
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
 # =============================================================================
 # Core Module: Audio Processing
 # =============================================================================
 
 class AudioProcessor(QThread):
     """Thread for capturing and processing audio input"""
-    # Update the signal definition to include raw audio data
+    # (spectrum, bands, volume, raw audio). The arrays are passed across
+    # threads by reference, not serialized, and are fresh copies owned by
+    # the receiver, so the analysis buffers can be reused right away
     audio_data = pyqtSignal(np.ndarray, np.ndarray, float, np.ndarray)
 
     def __init__(self):
         super().__init__()
         self.chunk_size = 1024 * 2
+        # The analysis window advances by hop_size samples per update, so
+        # consecutive FFTs overlap by chunk_size - hop_size samples
+        self.hop_size = 512
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = 44100
@@ -23,13 +37,69 @@ class AudioProcessor(QThread):
 
         # Audio processing variables - initialize with correct size
         # The FFT output size will be (chunk_size // 2) + 1 for real input
-        self.fft_data = np.zeros((self.chunk_size // 2) + 1)
-        self.prev_fft = np.zeros((self.chunk_size // 2) + 1)
+        fft_size = (self.chunk_size // 2) + 1
+        # Smoothed spectrum, updated in place every hop
+        self.fft_data = np.zeros(fft_size, dtype=np.float32)
         self.rms_volume = 0
         self.prev_volume = 0
 
         # Store the last raw audio chunk for waveform visualization
-        self.last_raw_audio = np.zeros(self.chunk_size)
+        self.last_raw_audio = np.zeros(self.chunk_size, dtype=np.float32)
+
+        # Set by the GUI (see request_data) when it is ready for another
+        # update; analysis keeps running but audio_data is only emitted
+        # while this is set, so signals never pile up in the event loop
+        self._consumer_ready = True
+
+        # The engine and effects advance one step per update, with their
+        # speeds tuned for one update per chunk_size samples; samples
+        # analysed since the last update, so updates keep that rate
+        self._samples_since_emit = 0
+
+        # Captured audio is handed over from the stream callback through a
+        # ring buffer; 4 chunks of headroom absorb GIL and GC pauses
+        self.ring_buffer = AudioRingBuffer(self.chunk_size * 4)
+
+        # Sliding analysis window of the latest chunk_size samples
+        self._window = np.zeros(self.chunk_size, dtype=np.int16)
+
+        # Hann taper for the FFT, scaled so a pure tone keeps the same peak
+        # magnitude as without windowing
+        hann = np.hanning(self.chunk_size).astype(np.float32)
+        self._hann = hann / hann.mean()
+
+        # Work buffers reused for every hop to avoid per-hop allocations
+        self._hop = np.empty(self.hop_size, dtype=np.int16)
+        self._samples = np.empty(self.chunk_size, dtype=np.float32)
+        self._fft_buf = np.empty(fft_size, dtype=np.float32)
+
+        # With pyFFTW the FFT runs through a plan made once for aligned
+        # buffers, reading the windowed samples and writing _fft_out
+        self._fft_plan = None
+        if PYFFTW_AVAILABLE:
+            self._windowed = pyfftw.empty_aligned(self.chunk_size, dtype='float32')
+            self._fft_out = pyfftw.empty_aligned(fft_size, dtype='complex64')
+            self._fft_plan = pyfftw.FFTW(self._windowed, self._fft_out, flags=('FFTW_MEASURE',))
+        else:
+            self._windowed = np.empty(self.chunk_size, dtype=np.float32)
+
+        # Twelve log-spaced bin ranges from bin 1 up, closer to how pitch is
+        # perceived than linear ranges; with the bin count of each
+        self._log_edges = np.unique(np.rint(np.geomspace(1, fft_size, 13)[:-1]).astype(np.intp))
+        self._log_sizes = np.diff(np.append(self._log_edges, fft_size)).astype(np.float64)
+
+        # The low, mid and high bands each average a third of the log bins
+        bins = len(self._log_edges)
+        self._band_edges = np.array([0, bins // 3, 2 * bins // 3], dtype=np.intp)
+        self._band_sizes = np.diff(np.append(self._band_edges, bins)).astype(np.float64)
+
+        # Bins of the visualized spectrum
+        self._spectrum_bins = slice(1, 100)
+
+    def _stream_callback(self, in_data, frame_count, time_info, status):
+        """PyAudio callback: queue captured samples for the processing loop"""
+        self.ring_buffer.push(np.frombuffer(in_data, dtype=np.int16))
+        return (None, pyaudio.paContinue)
 
     def run(self):
         p = pyaudio.PyAudio()
@@ -37,56 +107,15 @@ class AudioProcessor(QThread):
                         channels=self.channels,
                         rate=self.rate,
                         input=True,
-                        frames_per_buffer=self.chunk_size)
+                        frames_per_buffer=self.hop_size,
+                        stream_callback=self._stream_callback)
+        stream.start_stream()
 
         while self.running:
             try:
-                # Read audio data
-                data = np.frombuffer(stream.read(self.chunk_size, exception_on_overflow=False), dtype=np.int16)
-
-                # Store normalized raw audio for waveform visualization
-                if len(data) > 0:
-                    self.last_raw_audio = data / 32768.0  # Normalize to [-1, 1] range
-
-                # Calculate volume/amplitude (RMS)
-                # Avoid NaN by ensuring there's valid data
-                if len(data) > 0 and np.any(data):
-                    self.rms_volume = np.sqrt(np.mean(data**2)) / 32768.0 * self.sensitivity
-                    self.rms_volume = self.prev_volume * self.smoothing + self.rms_volume * (1 - self.smoothing)
-                    self.prev_volume = self.rms_volume
-                else:
-                    # Use previous volume if no data is available
-                    self.rms_volume = self.prev_volume
-
-                # Compute FFT
-                if len(data) > 0:
-                    fft = np.abs(np.fft.rfft(data / 32768.0))
-
-                    # Make sure the arrays have the same shape
-                    if len(fft) != len(self.prev_fft):
-                        self.prev_fft = np.zeros_like(fft)
-
-                    self.fft_data = self.prev_fft * self.smoothing + fft * (1 - self.smoothing) * self.sensitivity
-                    self.prev_fft = self.fft_data.copy()  # Use .copy() to avoid reference issues
-
-                    # Replace any NaN values with zeros
-                    self.fft_data = np.nan_to_num(self.fft_data)
-
-                    # Prepare frequency bands (low, mid, high)
-                    bass = np.mean(self.fft_data[1:20])
-                    mids = np.mean(self.fft_data[20:100])
-                    highs = np.mean(self.fft_data[100:])
-
-                    # Calculate spectrum for visualization
-                    spectrum = self.fft_data[1:100]  # Take most relevant frequencies for visualization
-
-                    # Replace any remaining NaN values with zeros
-                    spectrum = np.nan_to_num(spectrum)
-                    bands = np.nan_to_num(np.array([bass, mids, highs]))
-                    volume = 0.0 if np.isnan(self.rms_volume) else self.rms_volume
-
-                    # Emit signal with raw audio data
-                    self.audio_data.emit(spectrum, bands, volume, self.last_raw_audio)
+                # Wait for the next hop of audio data
+                if self.ring_buffer.pop(self._hop, timeout=0.1):
+                    self._process(self._hop)
             except Exception as e:
                 print(f"Audio processing error: {e}")
                 import traceback
@@ -96,6 +125,82 @@ class AudioProcessor(QThread):
         stream.close()
         p.terminate()
 
+    def _process(self, hop):
+        """Analyse one hop of samples and emit the results if requested
+
+        Slides ``hop`` into the analysis window, updates the smoothed
+        volume and spectrum, and emits audio_data once the GUI has asked
+        for new data (see request_data) and at least chunk_size samples
+        have been analysed since the last emit.
+        """
+        # Slide the hop into the analysis window
+        data = self._window
+        data[:-self.hop_size] = data[self.hop_size:]
+        data[-self.hop_size:] = hop
+
+        # Smoothing is given per chunk; spread it over the hops so
+        # the decay time doesn't depend on the hop size
+        smoothing = self.smoothing ** (self.hop_size / self.chunk_size)
+
+        # Normalize to [-1, 1] range in the reusable sample buffer
+        samples = np.divide(data, 32768.0, out=self._samples)
+
+        # Calculate volume/amplitude (RMS); the sum of squares is a
+        # single dot product pass and is only zero for silent input
+        sum_squares = np.dot(samples, samples)
+        if sum_squares > 0:
+            self.rms_volume = np.sqrt(sum_squares / len(samples)) * self.sensitivity
+            self.rms_volume = self.prev_volume * smoothing + self.rms_volume * (1 - smoothing)
+            self.prev_volume = self.rms_volume
+        else:
+            # Use previous volume if no data is available
+            self.rms_volume = self.prev_volume
+
+        # Compute FFT magnitudes of the tapered window
+        windowed = np.multiply(samples, self._hann, out=self._windowed)
+        if self._fft_plan is not None:
+            self._fft_plan()
+            fft = np.abs(self._fft_out, out=self._fft_buf)
+        else:
+            fft = np.abs(np.fft.rfft(windowed), out=self._fft_buf)
+
+        # Exponential smoothing, in place. The int16 input is always
+        # finite, so the spectrum can't pick up NaNs
+        self.fft_data *= smoothing
+        fft *= (1 - smoothing) * self.sensitivity
+        self.fft_data += fft
+
+        # Keep analysing every hop, but only hand results to the GUI
+        # once it has asked for them and a chunk of audio has passed
+        self._samples_since_emit += self.hop_size
+        if not self._consumer_ready or self._samples_since_emit < self.chunk_size:
+            return
+        self._consumer_ready = False
+        self._samples_since_emit = 0
+
+        # Store normalized raw audio for waveform visualization
+        self.last_raw_audio = samples.copy()
+
+        # Frequency band means (low, mid, high) from one pass over
+        # the spectrum into the log bins. The band values are
+        # float64 because receivers accumulate them into rotation
+        # angles, which would lose precision as float32 over time
+        log_bins = np.add.reduceat(self.fft_data, self._log_edges, dtype=np.float64)
+        log_bins /= self._log_sizes
+        bands = np.add.reduceat(log_bins, self._band_edges)
+        bands /= self._band_sizes
+
+        # Copy out the most relevant frequencies for visualization
+        spectrum = self.fft_data[self._spectrum_bins].copy()
+        volume = 0.0 if np.isnan(self.rms_volume) else float(self.rms_volume)
+
+        # Emit signal with raw audio data
+        self.audio_data.emit(spectrum, bands, volume, self.last_raw_audio)
+
+    def request_data(self):
+        """Allow the next analysis result to be emitted via audio_data"""
+        self._consumer_ready = True
+
     def set_sensitivity(self, value):
         self.sensitivity = value
 
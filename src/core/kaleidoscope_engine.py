@@ -1,13 +1,14 @@
 import math
-import random
+from collections import deque
 import numpy as np
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, QTime, QRect, QPoint, QObject
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTime, QRect, QPoint, QObject
 from PyQt5.QtGui import QColor, QPainter, QImage, QBrush, QPen
 
 from src.core.visualization_components import (
-    Particle, ShapeRenderer, ColorGenerator, SymmetryRenderer, EffectProcessor, WireframeCube,
-    CircularWaveform, WireframeManager
+    ParticleSystem, ShapeRenderer, ColorGenerator, SymmetryRenderer, EffectProcessor, WireframeCube,
+    CircularWaveform, WireframeManager, rotate_3d
 )
+from src.core.numba_support import NUMBA_AVAILABLE
 
 from src.core.particle_effects import EffectsManager
 from src.experimental.experimental_manager import ExperimentalEffectsManager
@@ -40,7 +41,7 @@ class KaleidoscopeEngine(QObject):
         self.symmetry_mode = "radial"  # "radial", "mirror", "spiral"
 
         # Animation variables
-        self.particles = []
+        self.particles = None
         self.max_particles = 100
         self.particle_size = 10
         self.trail_length = 5
@@ -49,7 +50,7 @@ class KaleidoscopeEngine(QObject):
         self.bass_influence = 1.0
         self.mids_influence = 1.0
         self.highs_influence = 1.0
-        self.spectrum_data = np.zeros(100)
+        self.spectrum_data = np.zeros(100, dtype=np.float32)
         self.bands = np.zeros(3)
         self.volume = 0
 
@@ -77,13 +78,16 @@ class KaleidoscopeEngine(QObject):
         self.prev_bass = 0
         self.is_beat = False
         self.beat_cooldown = 0
-        self.beat_history = []  # For calculating average and threshold
+        # Last 30 bass values and their running sum, for the average
+        self.beat_history = deque(maxlen=30)
+        self._beat_sum = 0.0
 
         # Create rendering buffers
-        self.buffer_image = QImage(width, height, QImage.Format_ARGB32)
-        self.buffer_image.fill(Qt.transparent)
-        self.final_image = QImage(width, height, QImage.Format_ARGB32)
-        self.final_image.fill(Qt.black)
+        self._create_buffers(width, height)
+
+        # Whether anything changed since the last rendered frame; frames
+        # depend only on engine state, so an unchanged state is not redrawn
+        self.needs_render = True
 
         # Wireframe cube settings
         self.enable_wireframe = True
@@ -96,25 +100,25 @@ class KaleidoscopeEngine(QObject):
         self.circular_waveform = CircularWaveform(radius=min(width, height) // 2)
 
         # Store raw audio data for waveform
-        self.raw_audio_data = np.zeros(1024)
+        self.raw_audio_data = np.zeros(1024, dtype=np.float32)
 
         # Particle effects system
         self.effects_manager = EffectsManager(width, height)
 
-        # Initialize particles
+        # Initialize particles and how they are drawn
         self.init_particles()
+        self._update_particle_drawing()
 
         # Initialize experimental effects
         self.experimental_effects = ExperimentalEffectsManager(width, height)
 
     def init_particles(self):
         """Initialize particles for animation"""
-        self.particles = []
-        for _ in range(self.max_particles):
-            self.particles.append(Particle(self.radius, self.particle_size, self.trail_length))
+        self.particles = ParticleSystem(self.max_particles, self.radius, self.particle_size, self.trail_length)
 
     def update(self, spectrum, bands, volume, raw_audio=None):
         """Update visualization parameters based on audio data"""
+        self.needs_render = True
 
         if raw_audio is not None and len(raw_audio) > 0:
             self.raw_audio_data = raw_audio
@@ -140,29 +144,21 @@ class KaleidoscopeEngine(QObject):
         # Update pulse effect
         self.update_pulse()
 
-        # Update particles
-        for p in self.particles:
-            # Apply audio influence to particle movement
-            speed_mod = 1.0 + self.bands[1] * self.mids_influence
-            size_mod = 1.0 + self.volume * 4
+        # Update particles, applying audio influence to their movement
+        speed_mod = 1.0 + self.bands[1] * self.mids_influence
+        size_mod = 1.0 + self.volume * 4
 
-            # Apply pulse effect to size
-            if self.enable_pulse:
-                size_mod *= self.current_pulse
+        # Apply pulse effect to size
+        if self.enable_pulse:
+            size_mod *= self.current_pulse
 
-            # Apply Z-axis influence if 3D is enabled
-            z_mod = self.bands[2] * self.depth_influence if self.enable_3d else 1.0
+        # Apply Z-axis influence if 3D is enabled
+        z_mod = self.bands[2] * self.depth_influence if self.enable_3d else 1.0
 
-            p.update(speed_mod, size_mod, z_mod)
+        self.particles.update(speed_mod, size_mod, z_mod)
 
-            # Reset particles that go out of bounds
-            dist = math.sqrt(p.x**2 + p.y**2)
-            if dist > self.radius * 0.8:
-                angle = random.uniform(0, math.pi * 2)
-                dist = random.uniform(0, self.radius * 0.3)
-                p.x = math.cos(angle) * dist
-                p.y = math.sin(angle) * dist
-                p.trail = []
+        # Reset particles that go out of bounds
+        self.particles.respawn_outside(self.radius * 0.8, self.radius * 0.3)
 
         # Detect beat for wireframe effects
         beat_detected = self.is_beat  # Use the beat detection from kaleidoscope engine
@@ -190,22 +186,22 @@ class KaleidoscopeEngine(QObject):
         self.effects_manager.update(spectrum, bands, volume, self.is_beat)
 
         # Update experimental effects
-        if hasattr(self, 'experimental_effects'):
-            self.experimental_effects.update(spectrum, bands, volume, self.is_beat)
+        self.experimental_effects.update(spectrum, bands, volume, self.is_beat)
 
     def detect_beat(self):
         """Simple beat detection based on bass energy"""
         # Get current bass energy
         bass = self.bands[0]
 
-        # Add to history (keep last 30 samples)
+        # Add to history (keep last 30 samples), updating the running sum
+        if len(self.beat_history) == self.beat_history.maxlen:
+            self._beat_sum -= self.beat_history[0]
         self.beat_history.append(bass)
-        if len(self.beat_history) > 30:
-            self.beat_history.pop(0)
+        self._beat_sum += bass
 
         # Calculate dynamic threshold based on history
         if len(self.beat_history) > 5:
-            avg_bass = sum(self.beat_history) / len(self.beat_history)
+            avg_bass = self._beat_sum / len(self.beat_history)
             # Beat is detected when bass exceeds average by a threshold factor
             # and is increasing from previous sample
             if bass > avg_bass * 1.5 and bass > self.prev_bass and self.beat_cooldown <= 0:
@@ -232,92 +228,46 @@ class KaleidoscopeEngine(QObject):
             self.current_pulse = 1.0
             return
 
-        # Move current_pulse toward target_pulse
-        if self.current_pulse < self.target_pulse:
-            # Attack phase (grow quickly)
-            self.current_pulse += (self.target_pulse - self.current_pulse) * self.pulse_attack
-        else:
-            # Decay phase (shrink more slowly)
-            self.current_pulse += (1.0 - self.current_pulse) * self.pulse_decay
+        # Move current_pulse toward target_pulse while below it (attack,
+        # grow quickly), otherwise back toward 1 (decay, shrink more slowly)
+        attacking = self.current_pulse < self.target_pulse
+        goal = self.target_pulse if attacking else 1.0
+        rate = self.pulse_attack if attacking else self.pulse_decay
+        self.current_pulse += (goal - self.current_pulse) * rate
 
         # Reset target if we've mostly decayed
         if abs(self.current_pulse - 1.0) < 0.05:
-            self.current_pulse = 1.0
-            self.target_pulse = 1.0
+            self.current_pulse = self.target_pulse = 1.0
+
 
+    def invalidate(self):
+        """Mark the current frame as outdated after a settings change"""
+        self.needs_render = True
 
     def render(self):
-        """Render the current state of the kaleidoscope"""
-        # Clear buffers
-        self.buffer_image.fill(Qt.transparent)
+        """Render the current state of the kaleidoscope
+
+        Returns the previous frame unchanged if nothing was updated or
+        invalidated since it was rendered.
+        """
+        if not self.needs_render:
+            return self.final_image
+        self.needs_render = False
+
+        # Clear buffers; the particle buffer only needs clearing where
+        # particles were drawn last frame
         self.final_image.fill(Qt.black)
 
         # Setup painters
         buffer_painter = QPainter(self.buffer_image)
+        if not self._dirty_rect.isEmpty():
+            buffer_painter.setCompositionMode(QPainter.CompositionMode_Source)
+            buffer_painter.fillRect(self._dirty_rect, Qt.transparent)
+            buffer_painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
         buffer_painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Draw particles to buffer
-        for p in self.particles:
-            if not p.trail:
-                continue
-
-            # Apply 3D projection for each point in the trail
-            projected_trail = []
-            for i, (tx, ty, tz) in enumerate(p.trail):
-                if self.enable_3d:
-                    # Apply 3D rotations
-                    rx, ry, rz = self.apply_3d_rotation(tx, ty, tz)
-
-                    # Apply perspective projection
-                    scale = self.perspective / (self.perspective + rz)
-                    px = rx * scale
-                    py = ry * scale
-
-                    # Store projected coordinates and scale
-                    projected_trail.append((px, py, scale))
-                else:
-                    # 2D mode - just pass through coordinates with a default scale
-                    projected_trail.append((tx, ty, 1.0))
-
-            # Draw trail with fading opacity
-            for i, (px, py, scale) in enumerate(projected_trail):
-                alpha = int(255 * (i / len(projected_trail)))
-                size = p.current_size * (i / len(projected_trail)) * scale
-
-                # Get color based on mode
-                if self.color_mode == "spectrum":
-                    # Map particle position to spectrum colors
-                    freq_index = min(int(abs(px / self.radius) * len(self.spectrum_data)), len(self.spectrum_data) - 1)
-                    intensity = min(1.0, self.spectrum_data[freq_index] * 2)
-                    color = ColorGenerator.get_color("spectrum", {
-                        'freq_index': freq_index,
-                        'intensity': intensity,
-                        'spectrum_length': len(self.spectrum_data),
-                        'alpha': alpha
-                    })
-                elif self.color_mode == "solid":
-                    color = ColorGenerator.get_color("solid", {
-                        'base_color': self.base_color,
-                        'alpha': alpha
-                    })
-                else:  # gradient
-                    ratio = (math.sin(self.rotation * 2 + i / len(p.trail) * math.pi) + 1) / 2
-                    color = ColorGenerator.get_color("gradient", {
-                        'base_color': self.base_color,
-                        'secondary_color': self.secondary_color,
-                        'ratio': ratio,
-                        'alpha': alpha
-                    })
-
-                # Draw the shape
-                ShapeRenderer.render_shape(
-                    buffer_painter,
-                    self.shape_type,
-                    self.center_x + px,
-                    self.center_y + py,
-                    size,
-                    color
-                )
+        self._render_particles(buffer_painter)
 
         buffer_painter.end()
 
@@ -333,7 +283,9 @@ class KaleidoscopeEngine(QObject):
                 'segments': self.segments,
                 'rotation': self.rotation,
                 'center_x': self.center_x,
-                'center_y': self.center_y
+                'center_y': self.center_y,
+                'mirror_tile': self._mirror_tile,
+                'content_rect': self._dirty_rect
             }
         )
 
@@ -345,12 +297,11 @@ class KaleidoscopeEngine(QObject):
                 self.center_y
             )
 
-        # Render particle effects - MOVED BEFORE the end of painter
-        if hasattr(self, 'effects_manager') and self.effects_manager:
-            try:
-                self.effects_manager.render(final_painter)
-            except Exception as e:
-                print(f"Error rendering effects: {e}")
+        # Render particle effects
+        try:
+            self.effects_manager.render(final_painter)
+        except Exception as e:
+            print(f"Error rendering effects: {e}")
 
         # Render wireframe shapes if enabled
         if self.enable_wireframe:
@@ -362,57 +313,156 @@ class KaleidoscopeEngine(QObject):
             )
 
         # Render experimental effects
-        if hasattr(self, 'experimental_effects'):
-            try:
-                self.experimental_effects.render(final_painter)
-            except Exception as e:
-                print(f"Error rendering experimental effects: {e}")
-                import traceback
-                traceback.print_exc()
-
+        try:
+            self.experimental_effects.render(final_painter)
+        except Exception as e:
+            print(f"Error rendering experimental effects: {e}")
+            import traceback
+            traceback.print_exc()
 
         # End painter after all rendering is done
         final_painter.end()
 
         # Apply post-processing effects
         if self.blur_amount > 0:
-            self.final_image = EffectProcessor.apply_blur(self.final_image, self.blur_amount)
+            EffectProcessor.apply_blur(self.final_image, self.blur_amount, self._blur_scratch)
 
         if self.distortion > 0:
-            self.final_image = EffectProcessor.apply_distortion(
+            EffectProcessor.apply_distortion(
                 self.final_image,
                 self.distortion,
                 self.center_x,
                 self.center_y,
                 self.radius,
-                self.rotation
+                self.rotation,
+                out=self._final_back
             )
+            # Ping-pong: the distorted back buffer becomes the displayed frame
+            self.final_image, self._final_back = self._final_back, self.final_image
 
         return self.final_image
 
-    def apply_3d_rotation(self, x, y, z):
-        """Apply 3D rotation matrix to a point"""
-        # Convert to radians
-        rx = self.rotation_3d_x
-        ry = self.rotation_3d_y
-        rz = self.rotation_3d_z
+    def _render_particles(self, painter):
+        """Draw every particle trail, computing all trail points at once"""
+        if self.enable_3d:
+            # Apply 3D rotations and perspective projection
+            rotation = (self.rotation_3d_x, self.rotation_3d_y, self.rotation_3d_z)
+            px, py, fraction, size = self.particles.project_trails(rotation, self.perspective)
+        else:
+            # 2D mode - just pass through coordinates with a default scale
+            px, py, fraction, size = self.particles.project_trails()
+
+        # Trails fade in opacity and size towards their oldest point
+        alpha = (255 * fraction).astype(np.int32)
+
+        # Skip points too faint or small to show up
+        visible = (alpha > 0) & (size >= 1)
+        px, py, size = px[visible], py[visible], size[visible]
+        colors = self._particle_colors(px, fraction[visible], alpha[visible])
+
+        # Draw the shapes
+        xs = self.center_x + px
+        ys = self.center_y + py
+        self._draw_particle_shapes(painter, xs, ys, size, colors)
+        self._dirty_rect = self._particle_bounds(xs, ys, size)
+
+    def _particle_bounds(self, xs, ys, sizes):
+        """Bounding QRect of the particle shapes drawn at the given points"""
+        if len(sizes) == 0:
+            return QRect()
+
+        # Shapes extend up to their size from the center; allow a couple
+        # of pixels for antialiasing
+        extent = sizes + 2
+        left = int(np.floor(np.min(xs - extent)))
+        top = int(np.floor(np.min(ys - extent)))
+        right = int(np.ceil(np.max(xs + extent)))
+        bottom = int(np.ceil(np.max(ys + extent)))
+        return QRect(QPoint(left, top), QPoint(right, bottom)).intersected(self.buffer_image.rect())
+
+    def _spectrum_colors(self, px, fraction, alpha):
+        """Map particle position to spectrum colors"""
+        spectrum_length = len(self.spectrum_data)
+        freq_index = (np.abs(px) * (spectrum_length / self.radius)).astype(np.int32)
+        np.minimum(freq_index, spectrum_length - 1, out=freq_index)
+        # Color each spectrum bin once, then look the points' colors up
+        # and add their alpha
+        bin_colors = ColorGenerator.get_color_array("spectrum", {
+            'freq_index': np.arange(spectrum_length),
+            'intensity': np.minimum(1.0, self.spectrum_data * 2),
+            'spectrum_length': spectrum_length,
+            'alpha': 0
+        })
+        return bin_colors[freq_index] | (alpha.astype(np.uint32) << 24)
+
+    def _solid_colors(self, px, fraction, alpha):
+        """Base color at each point's alpha"""
+        return ColorGenerator.get_color_array("solid", {
+            'base_color': self.base_color,
+            'alpha': alpha
+        })
+
+    def _gradient_colors(self, px, fraction, alpha):
+        """Blend between the base and secondary colors along each trail"""
+        return ColorGenerator.get_color_array("gradient", {
+            'base_color': self.base_color,
+            'secondary_color': self.secondary_color,
+            'ratio': (np.sin(self.rotation * 2 + fraction * math.pi) + 1) / 2,
+            'alpha': alpha
+        })
+
+    def _update_particle_drawing(self):
+        """Bind the particle color and shape functions for the current modes
+
+        Called when the color mode or shape type changes, so rendering a
+        frame doesn't have to branch on them.
+        """
+        self._particle_colors = {
+            "spectrum": self._spectrum_colors,
+            "solid": self._solid_colors,
+        }.get(self.color_mode, self._gradient_colors)
+
+        if self.shape_type == "circle":
+            if NUMBA_AVAILABLE:
+                # Rasterize straight into the particle buffer
+                def splat_circles(painter, xs, ys, sizes, colors):
+                    ShapeRenderer.splat_circles(self.buffer_image, xs, ys, sizes, colors)
+                self._draw_particle_shapes = splat_circles
+            else:
+                self._draw_particle_shapes = ShapeRenderer.render_circles
+        else:
+            shape_type = self.shape_type
 
-        # Apply Z rotation first
-        x_rot = x * math.cos(rz) - y * math.sin(rz)
-        y_rot = x * math.sin(rz) + y * math.cos(rz)
+            def draw_sprites(painter, xs, ys, sizes, colors):
+                ShapeRenderer.render_sprites(painter, shape_type, xs, ys, sizes, colors)
+            self._draw_particle_shapes = draw_sprites
 
-        # Apply Y rotation
-        x_rot2 = x_rot * math.cos(ry) + z * math.sin(ry)
-        z_rot = -x_rot * math.sin(ry) + z * math.cos(ry)
+    def apply_3d_rotation(self, x, y, z):
+        """Apply 3D rotation matrix to a point (or to arrays of points)"""
+        return rotate_3d(x, y, z, self.rotation_3d_x, self.rotation_3d_y, self.rotation_3d_z)
 
-        # Apply X rotation
-        y_rot2 = y_rot * math.cos(rx) - z_rot * math.sin(rx)
-        z_rot2 = y_rot * math.sin(rx) + z_rot * math.cos(rx)
+    def _create_buffers(self, width, height):
+        """Allocate the frame buffers and post-processing scratch images"""
+        self.buffer_image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        self.buffer_image.fill(Qt.transparent)
+        # Area of buffer_image drawn on by the last frame
+        self._dirty_rect = QRect()
+        self.final_image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        self.final_image.fill(Qt.black)
 
-        return x_rot2, y_rot2, z_rot2
+        # Back buffer that post-processing passes render into before being
+        # swapped with final_image, plus scratch images for the blur and the
+        # mirror symmetry tile
+        self._final_back = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        self._blur_scratch = EffectProcessor.create_blur_scratch(width, height, QImage.Format_ARGB32_Premultiplied)
+        self._mirror_tile = SymmetryRenderer.create_mirror_tile(width, height)
 
     def resize(self, width, height):
         """Handle resizing of the rendering area"""
+        # The buffers are only reallocated for a new size
+        if (width, height) == (self.width, self.height):
+            return
+
         self.width = width
         self.height = height
         self.center_x = width // 2
@@ -420,22 +470,15 @@ class KaleidoscopeEngine(QObject):
         self.radius = min(width, height) // 2
 
         # Recreate buffers at new size
-        self.buffer_image = QImage(width, height, QImage.Format_ARGB32)
-        self.buffer_image.fill(Qt.transparent)
-        self.final_image = QImage(width, height, QImage.Format_ARGB32)
-        self.final_image.fill(Qt.black)
+        self._create_buffers(width, height)
+        self.needs_render = True
 
-        # Update wireframe manager if it exists
-        if hasattr(self, 'wireframe_manager'):
-            # Update size based on new dimensions
-            self.wireframe_manager.set_size(min(width, height) // 4)
+        # Update the wireframe size based on new dimensions
+        self.wireframe_manager.set_size(min(width, height) // 4)
 
-        # Update effects manager
-        if hasattr(self, 'effects_manager'):
-            self.effects_manager.resize(width, height)
-
-        if hasattr(self, 'experimental_effects'):
-            self.experimental_effects.resize(width, height)
+        # Update effects managers
+        self.effects_manager.resize(width, height)
+        self.experimental_effects.resize(width, height)
 
     # 3D settings
     def set_3d_enabled(self, enabled):
@@ -474,6 +517,7 @@ class KaleidoscopeEngine(QObject):
 
     def set_color_mode(self, mode):
         self.color_mode = mode
+        self._update_particle_drawing()
 
     def set_base_color(self, color):
         self.base_color = color
@@ -486,6 +530,7 @@ class KaleidoscopeEngine(QObject):
 
     def set_shape_type(self, shape):
         self.shape_type = shape
+        self._update_particle_drawing()
 
     def set_distortion(self, value):
         self.distortion = value
@@ -494,6 +539,9 @@ class KaleidoscopeEngine(QObject):
         self.symmetry_mode = mode
 
     def set_particle_settings(self, count, size, trail):
+        # Rebuilding restarts every particle, so skip it if nothing changed
+        if (count, size, trail) == (self.max_particles, self.particle_size, self.trail_length):
+            return
         self.max_particles = count
         self.particle_size = size
         self.trail_length = trail
@@ -0,0 +1,22 @@
+"""
+Optional Numba support for the rendering and audio hot paths.
+
+Numba is not a hard dependency. When it is missing, ``njit`` is a no-op
+decorator and ``prange`` is ``range``, so kernels still import. Callers
+should check ``NUMBA_AVAILABLE`` and use their NumPy path instead of
+running a kernel as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
@@ -1,20 +1,243 @@
 import random
 import math
 import colorsys
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QRadialGradient
+from collections import OrderedDict
+import numpy as np
+from PyQt5.QtCore import Qt, QPoint, QPointF
+from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QGradient, QRadialGradient, QPolygonF
+
+from src.core.visualization_components import ShapeRenderer, _hsv_to_rgb_array
+from src.core.numba_support import njit, NUMBA_AVAILABLE
+
+# Trails are kept in ring buffers with this many points per particle
+TRAIL_SLOTS = 10
+# Firework trails are drawn as this many polylines, fading toward their end
+_TRAIL_PIECES = 3
+_COLOR_CACHE_LIMIT = 64
+_GRADIENT_CACHE_LIMIT = 512
+# Glow gradients are shared between alphas this far apart
+_GRADIENT_ALPHA_STEP = 8
+
+
+@njit(cache=True, fastmath=True)
+def _step_particles_kernel(x, y, z, vx, vy, vz, ax, ay, az,
+                           alpha, fade_rate, age, max_age, drag):
+    """Numba kernel for ParticleEffect._advance; returns the alive mask"""
+    alive = np.empty(x.size, np.bool_)
+    for i in range(x.size):
+        age[i] += 1
+        vx[i] = vx[i] * drag + ax[i]
+        vy[i] = vy[i] * drag + ay[i]
+        vz[i] = vz[i] * drag + az[i]
+        x[i] += vx[i]
+        y[i] += vy[i]
+        z[i] += vz[i]
+        faded = max(np.float32(int(alpha[i] - fade_rate[i])), np.float32(0))
+        alpha[i] = faded
+        alive[i] = age[i] < max_age[i] and faded > 0
+    return alive
+
+
+@njit(cache=True, fastmath=True)
+def _drift_mist_kernel(size, growth_rate, vx, vy, noise, max_speed):
+    """Numba kernel for MistCloud._advance's growth and random drift"""
+    for i in range(size.size):
+        size[i] += growth_rate[i]
+        vx[i] = min(max(vx[i] + noise[0, i], -max_speed), max_speed)
+        vy[i] = min(max(vy[i] + noise[1, i], -max_speed), max_speed)
+
+
+class _PenTable(dict):
+    """Pens of one color keyed by (width, alpha), made on first use"""
+    def __init__(self, r, g, b):
+        super().__init__()
+        self.rgb = (r, g, b)
+
+    def __missing__(self, key):
+        width, alpha = key
+        pen = self[key] = QPen(QColor(*self.rgb, alpha))
+        pen.setWidth(width)
+        return pen
+
+
+class ColorCache:
+    """Shared QPen and gradient QBrush objects for particle colors
+
+    Trail segments of one color differ only in alpha and width, so their
+    pens are made once per color and reused every frame. Glow gradients
+    are made relative to the shape they fill, so one brush serves every
+    particle of the same colors whatever its position and size. Only the
+    most recently used colors are kept.
+    """
+    _pens = OrderedDict()
+    _gradients = OrderedDict()
+
+    @staticmethod
+    def pens(r, g, b):
+        """QPens of an (r, g, b) color, indexed by (width, alpha)"""
+        key = (r, g, b)
+        table = ColorCache._pens.get(key)
+        if table is None:
+            table = ColorCache._pens[key] = _PenTable(r, g, b)
+            if len(ColorCache._pens) > _COLOR_CACHE_LIMIT:
+                ColorCache._pens.popitem(last=False)
+        else:
+            ColorCache._pens.move_to_end(key)
+        return table
+
+    @staticmethod
+    def radial_gradient(r, g, b, core_alpha, outer_alpha):
+        """QBrush fading from the center to the edge of the shape it fills"""
+        key = (r, g, b, core_alpha, outer_alpha)
+        brush = ColorCache._gradients.get(key)
+        if brush is None:
+            gradient = QRadialGradient(0.5, 0.5, 0.5)
+            gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+            gradient.setColorAt(0, QColor(r, g, b, core_alpha))
+            gradient.setColorAt(1, QColor(r, g, b, outer_alpha))
+            brush = ColorCache._gradients[key] = QBrush(gradient)
+            if len(ColorCache._gradients) > _GRADIENT_CACHE_LIMIT:
+                ColorCache._gradients.popitem(last=False)
+        else:
+            ColorCache._gradients.move_to_end(key)
+        return brush
+
 
 class ParticleEffect:
-    """Base class for atmospheric particle effects"""
+    """Base class for atmospheric particle effects
+
+    The particles are stored as parallel NumPy arrays, one per entry of
+    ``columns`` (which also gives the value new particles start with), and
+    are advanced together in a few vectorized operations per frame. ``age``
+    and ``max_age`` are each particle's lifetime in frames.
+
+    Effects with trails set ``trail_dims`` to the number of coordinates per
+    point and add a 'trail_length' column. All particles share one ring
+    buffer, ``trail``, written at ``trail_head`` every frame;
+    ``trail_count`` says how many of each particle's latest points are valid.
+    """
+    columns = {
+        'x': 0, 'y': 0, 'z': 0,
+        'vx': 0, 'vy': 0, 'vz': 0,
+        'ax': 0, 'ay': 0, 'az': 0,
+        'size': 3,
+        'alpha': 255,
+        'fade_rate': 2,
+        'age': 0,
+        'max_age': 100,
+        'r': 255, 'g': 255, 'b': 255,
+    }
+    trail_dims = 0
+    drag = 1.0  # Velocity kept per frame
+
     def __init__(self, center_x, center_y, radius):
         self.center_x = center_x
         self.center_y = center_y
         self.radius = radius
-        self.particles = []
         self.lifetime = 0
         self.max_lifetime = 100  # Default lifetime in frames
         self.active = False
         self.color = QColor(255, 255, 255)
+        self._alloc(0)
+
+    def _alloc(self, count):
+        """Replace the particles with ``count`` new ones at the column defaults"""
+        defaults = np.array(list(self.columns.values()), dtype=np.float32)
+        self._bind_columns(np.repeat(defaults[:, np.newaxis], count, axis=1))
+
+        if self.trail_dims:
+            self.trail = np.zeros((count, TRAIL_SLOTS, self.trail_dims), dtype=np.float32)
+            self.trail_count = np.zeros(count, dtype=np.int32)
+            self.trail_head = 0
+
+    def _bind_columns(self, block):
+        """Use the rows of a (columns, count) array as the particle columns
+
+        Keeping every column in one block lets the particles be allocated
+        and compacted with a single array operation.
+        """
+        self._block = block
+        self.count = block.shape[1]
+        for name, row in zip(self.columns, block):
+            setattr(self, name, row)
+
+    def _compact(self, keep):
+        """Drop the particles where the ``keep`` mask is False"""
+        self._bind_columns(self._block[:, keep])
+
+        if self.trail_dims:
+            self.trail = self.trail[keep]
+            self.trail_count = self.trail_count[keep]
+
+    def _set_rgb(self, r, g, b):
+        """Set the particles' colors from 0-255 components"""
+        self.r[:] = r
+        self.g[:] = g
+        self.b[:] = b
+
+    def _set_hsv(self, hue, saturation, value):
+        """Set the particles' colors from HSV, as colorsys.hsv_to_rgb would"""
+        r, g, b = _hsv_to_rgb_array(hue, saturation, np.broadcast_to(value, self.count))
+        self._set_rgb(np.trunc(r * 255), np.trunc(g * 255), np.trunc(b * 255))
+
+    def _colors(self, alpha):
+        """QColor of every particle with the given alpha (array or scalar)"""
+        rgb = np.stack([self.r, self.g, self.b], axis=1).astype(np.int32).tolist()
+        alpha = np.broadcast_to(alpha, self.count).astype(np.int32).tolist()
+        return [QColor(r, g, b, a) for (r, g, b), a in zip(rgb, alpha)]
+
+    def _argb(self, alpha):
+        """Packed ARGB color of every particle with the given alpha"""
+        alpha = np.broadcast_to(alpha, self.count).astype(np.uint32)
+        return ((alpha << 24) | (self.r.astype(np.uint32) << 16)
+                | (self.g.astype(np.uint32) << 8) | self.b.astype(np.uint32))
+
+    def _on_screen(self, painter, reach):
+        """Mask of the particles drawn within ``reach`` of the painter's window"""
+        window = painter.window()
+        return ((self.x + reach > window.left()) & (self.x - reach <= window.right() + 1)
+                & (self.y + reach > window.top()) & (self.y - reach <= window.bottom() + 1))
+
+    def _draw_glows(self, painter, outer_fraction):
+        """Draw each particle as a soft radial glow of radius ``size``
+
+        The edge keeps ``outer_fraction`` of the center's alpha. Alphas
+        are rounded down to _GRADIENT_ALPHA_STEP so the gradient brushes
+        can be shared between particles and frames.
+        """
+        # Skip the glows that drifted out of view
+        shown = np.flatnonzero(self._on_screen(painter, self.size))
+        alpha = self.alpha[shown].astype(np.int32)
+        alpha -= alpha % _GRADIENT_ALPHA_STEP
+        rgb = np.stack([self.r[shown], self.g[shown], self.b[shown]], axis=1).astype(np.int32)
+
+        painter.setPen(Qt.NoPen)
+        for x, y, size, (r, g, b), a in zip(self.x[shown].tolist(), self.y[shown].tolist(),
+                                            self.size[shown].tolist(), rgb.tolist(), alpha.tolist()):
+            painter.setBrush(ColorCache.radial_gradient(r, g, b, a, int(a * outer_fraction)))
+            painter.drawEllipse(int(x - size), int(y - size), int(size * 2), int(size * 2))
+
+    def _draw_circles(self, painter, sizes, colors):
+        """Draw a circle of the given diameter and ARGB color per particle
+
+        Several circles per particle can be drawn by passing (count, k)
+        arrays; each particle's circles are drawn in order.
+        """
+        sizes, colors = np.broadcast_arrays(sizes, colors)
+        repeat = sizes.size // max(self.count, 1)
+        ShapeRenderer.draw_circles(painter, np.repeat(self.x, repeat), np.repeat(self.y, repeat),
+                                   np.maximum(sizes.ravel() / 2, 1), colors.ravel())
+
+    def _record_trail(self, *coords):
+        """Append the given coordinate arrays to every particle's trail"""
+        for dim, values in enumerate(coords):
+            self.trail[:, self.trail_head, dim] = values
+        self.trail_head = (self.trail_head + 1) % TRAIL_SLOTS
+        self.trail_count = np.minimum(self.trail_count + 1, self.trail_length).astype(np.int32)
+
+    def ordered_trails(self):
+        """Return trails oldest point first; valid points sit at the end"""
+        return np.roll(self.trail, -self.trail_head, axis=1)
 
     def start(self):
         """Start the effect"""
@@ -33,55 +256,33 @@ class ParticleEffect:
             self.active = False
             return
 
-        # Update particles
-        for particle in self.particles:
-            particle.update(bass, mids, highs, volume)
-
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.active]
-
-    def render(self, painter):
-        """Render the effect"""
-        if not self.active:
-            return
-
-        for particle in self.particles:
-            particle.render(painter)
-
-    def generate_particles(self):
-        """Generate particles for this effect - override in subclasses"""
-        pass
-
-
-class Particle:
-    """Base particle class"""
-    def __init__(self, x, y, z=0):
-        self.x = x
-        self.y = y
-        self.z = z  # For 3D effects
-        self.vx = 0
-        self.vy = 0
-        self.vz = 0
-        self.ax = 0
-        self.ay = 0
-        self.az = 0
-        self.size = 3
-        self.color = QColor(255, 255, 255)
-        self.alpha = 255  # Make sure this is always an integer
-        self.fade_rate = 2
-        self.lifetime = 0
-        self.max_lifetime = 100
-        self.active = True
-
-    def update(self, bass, mids, highs, volume):
-        """Update particle position and state"""
-        # Update lifetime
-        self.lifetime += 1
-        if self.lifetime >= self.max_lifetime:
-            self.active = False
-            return
+        # Update particles and remove dead ones
+        if self.count:
+            alive = self._advance(bass, mids, highs, volume)
+            if not alive.all():
+                self._compact(alive)
+
+    def _advance(self, bass, mids, highs, volume):
+        """Advance every particle by one frame
+
+        Returns a mask of the particles that are still alive. Subclasses
+        extend this with their own per-frame behaviour.
+        """
+        if NUMBA_AVAILABLE:
+            return _step_particles_kernel(self.x, self.y, self.z, self.vx, self.vy, self.vz,
+                                          self.ax, self.ay, self.az, self.alpha, self.fade_rate,
+                                          self.age, self.max_age, np.float32(self.drag))
+
+        # Particles that reach their lifetime die where they are
+        self.age += 1
+        alive = self.age < self.max_age
+
+        # Apply physics, with drag/friction first
+        if self.drag != 1.0:
+            self.vx *= self.drag
+            self.vy *= self.drag
+            self.vz *= self.drag
 
-        # Apply physics
         self.vx += self.ax
         self.vy += self.ay
         self.vz += self.az
@@ -90,273 +291,32 @@ class Particle:
         self.y += self.vy
         self.z += self.vz
 
-        # Apply fade - ensure alpha stays an integer
-        self.alpha = max(0, int(self.alpha - self.fade_rate))
-        if self.alpha <= 0:
-            self.active = False
-
-    def render(self, painter):
-        """Render the particle"""
-        if not self.active:
-            return
-
-        # Apply color with current alpha - ensure alpha is an integer
-        current_color = QColor(self.color)
-        current_color.setAlpha(int(self.alpha))
-
-        # Draw particle
-        painter.setBrush(QBrush(current_color))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(int(self.x - self.size/2), int(self.y - self.size/2),
-                          int(self.size), int(self.size))
-
-
-class SparkParticle(Particle):
-    """Bright, fast-moving spark particle"""
-    def __init__(self, x, y, z=0):
-        super().__init__(x, y, z)
-        self.size = random.uniform(1, 3)
-        self.color = QColor(255, 220, 150)  # Yellowish-orange
-        self.fade_rate = random.uniform(3, 7)
-        self.max_lifetime = random.randint(30, 60)
-
-        # Set initial velocity (faster than other particles)
-        angle = random.uniform(0, math.pi * 2)
-        speed = random.uniform(3, 7)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.vz = random.uniform(-1, 1) * speed * 0.5
-
-        # Add slight gravity
-        self.ay = 0.05
+        # Fade in whole steps, keeping alpha an integer
+        self.alpha -= self.fade_rate
+        np.trunc(self.alpha, out=self.alpha)
+        np.maximum(self.alpha, 0, out=self.alpha)
+        return alive & (self.alpha > 0)
 
     def render(self, painter):
-        """Render with a glow effect"""
-        if not self.active:
-            return
-
-        # Base particle
-        current_color = QColor(self.color)
-        current_color.setAlpha(int(self.alpha))  # Ensure alpha is an integer
-
-        painter.setBrush(QBrush(current_color))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(int(self.x - self.size/2), int(self.y - self.size/2),
-                          int(self.size), int(self.size))
-
-        # Add glow (larger, more transparent circle)
-        glow_color = QColor(self.color)
-        glow_color.setAlpha(int(self.alpha // 3))  # Ensure alpha is an integer
-        glow_size = self.size * 2
-
-        painter.setBrush(QBrush(glow_color))
-        painter.drawEllipse(int(self.x - glow_size/2), int(self.y - glow_size/2),
-                          int(glow_size), int(glow_size))
-
-
-class FlareParticle(Particle):
-    """Bright, large flare particle with color shift"""
-    def __init__(self, x, y, z=0):
-        super().__init__(x, y, z)
-        self.base_size = random.uniform(4, 10)
-        self.size = self.base_size
-        self.pulse_phase = random.uniform(0, math.pi * 2)
-        self.pulse_speed = random.uniform(0.1, 0.2)
-
-        # Set color (bright, warm tones)
-        hue = random.uniform(0, 0.1)  # Red to yellow
-        self.color = QColor()
-        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 0.8, 1.0)]
-        self.color.setRgb(r, g, b)
-
-        self.fade_rate = random.uniform(1, 3)
-        self.max_lifetime = random.randint(60, 120)
-
-        # Slower movement than sparks
-        angle = random.uniform(0, math.pi * 2)
-        speed = random.uniform(0.5, 2)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.vz = random.uniform(-0.5, 0.5)
-
-    def update(self, bass, mids, highs, volume):
-        super().update(bass, mids, highs, volume)
-
-        # Pulse size with phase
-        self.pulse_phase += self.pulse_speed
-        pulse_factor = 0.5 * math.sin(self.pulse_phase) + 1.5
-
-        # Make size reactive to audio
-        audio_factor = 1.0 + volume + (bass * 0.5)
-        self.size = self.base_size * pulse_factor * audio_factor
-
-    def render(self, painter):
-        """Render with a radial gradient"""
-        if not self.active:
-            return
-
-        # Use a radial gradient for a soft glow
-        gradient = QRadialGradient(self.x, self.y, self.size)
-
-        # Core color (brighter)
-        core_color = QColor(self.color)
-        core_color.setAlpha(int(self.alpha))  # Ensure alpha is an integer
-
-        # Outer color (more transparent)
-        outer_color = QColor(self.color)
-        outer_color.setAlpha(int(self.alpha // 4))  # Ensure alpha is an integer
-
-        gradient.setColorAt(0, core_color)
-        gradient.setColorAt(1, outer_color)
-
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(int(self.x - self.size), int(self.y - self.size),
-                          int(self.size * 2), int(self.size * 2))
-
-
-class FireworkParticle(Particle):
-    """Firework explosion particle"""
-    def __init__(self, x, y, z=0, color=None):
-        super().__init__(x, y, z)
-        self.trail = []
-        self.trail_length = random.randint(3, 8)
-        self.size = random.uniform(1, 3)
-
-        # Use provided color or generate random bright color
-        if color:
-            self.color = color
-        else:
-            hue = random.random()
-            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 0.9, 1.0)]
-            self.color = QColor(r, g, b)
-
-        self.fade_rate = random.uniform(2, 4)
-        self.max_lifetime = random.randint(40, 80)
-
-        # High initial velocity that slows down
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-3, 3)
-        self.vz = random.uniform(-1, 1)
-
-        # Add gravity
-        self.ay = 0.08
-
-        # Add drag/friction
-        self.drag = 0.98
-
-    def update(self, bass, mids, highs, volume):
-        # Store current position in trail
-        self.trail.append((self.x, self.y))
-        if len(self.trail) > self.trail_length:
-            self.trail.pop(0)
-
-        # Apply physics with drag
-        self.vx *= self.drag
-        self.vy *= self.drag
-        self.vz *= self.drag
-
-        super().update(bass, mids, highs, volume)
-
-    def render(self, painter):
-        """Render particle with trail"""
-        if not self.active or len(self.trail) < 2:
-            return
-
-        # Draw trail
-        for i in range(len(self.trail) - 1):
-            # Calculate alpha for this trail segment
-            segment_alpha = int(self.alpha * (i / len(self.trail)))  # Ensure alpha is an integer
-
-            # Set color with diminishing alpha for trail
-            trail_color = QColor(self.color)
-            trail_color.setAlpha(segment_alpha)
-
-            # Set pen for trail
-            pen = QPen(trail_color)
-            pen.setWidth(max(1, int(self.size * (i / len(self.trail)))))
-            painter.setPen(pen)
-
-            # Draw line segment
-            x1, y1 = self.trail[i]
-            x2, y2 = self.trail[i + 1]
-            painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-
-        # Draw the particle head
-        current_color = QColor(self.color)
-        current_color.setAlpha(int(self.alpha))  # Ensure alpha is an integer
-
-        painter.setBrush(QBrush(current_color))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(int(self.x - self.size/2), int(self.y - self.size/2),
-                          int(self.size), int(self.size))
-
-
-class MistParticle(Particle):
-    """Soft, slow-moving mist particle"""
-    def __init__(self, x, y, z=0):
-        super().__init__(x, y, z)
-        self.size = random.uniform(5, 15)
-
-        # Mist is typically white/blue but semi-transparent
-        self.color = QColor(220, 230, 255)  # Light blue-ish
-        self.alpha = random.randint(40, 120)  # Start semi-transparent
-
-        self.fade_rate = random.uniform(0.5, 1.0)
-        self.max_lifetime = random.randint(100, 200)
-
-        # Very slow movement with some randomness
-        self.vx = random.uniform(-0.3, 0.3)
-        self.vy = random.uniform(-0.3, 0.3)
-
-        # Slow size change
-        self.growth_rate = random.uniform(-0.02, 0.05)
-
-    def update(self, bass, mids, highs, volume):
-        super().update(bass, mids, highs, volume)
-
-        # Slowly change size
-        self.size += self.growth_rate
-
-        # Add slight random movement (drifting)
-        self.vx += random.uniform(-0.05, 0.05)
-        self.vy += random.uniform(-0.05, 0.05)
-
-        # Limit velocity (mist moves slowly)
-        self.vx = max(-0.5, min(0.5, self.vx))
-        self.vy = max(-0.5, min(0.5, self.vy))
-
-    def render(self, painter):
-        """Render with a soft, diffuse appearance"""
+        """Render the effect"""
         if not self.active:
             return
 
-        # Use a radial gradient for soft edges
-        gradient = QRadialGradient(self.x, self.y, self.size)
-
-        # Core color
-        core_color = QColor(self.color)
-        core_color.setAlpha(int(self.alpha))  # Ensure alpha is an integer
-
-        # Outer color (transparent)
-        outer_color = QColor(self.color)
-        outer_color.setAlpha(0)
+        self._draw_circles(painter, self.size, self._argb(self.alpha))
 
-        gradient.setColorAt(0, core_color)
-        gradient.setColorAt(1, outer_color)
+    def generate_particles(self):
+        """Generate particles for this effect - override in subclasses"""
+        pass
 
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(int(self.x - self.size), int(self.y - self.size),
-                          int(self.size * 2), int(self.size * 2))
 
 class SparkBurst(ParticleEffect):
-    """Burst of sparks from a point, good for beat hits"""
+    """Burst of bright, fast-moving sparks from a point, good for beat hits"""
     def __init__(self, center_x, center_y, radius):
         super().__init__(center_x, center_y, radius)
         self.max_lifetime = random.randint(60, 100)
         self.burst_strength = random.uniform(0.8, 1.5)
         self.particle_count = random.randint(15, 30)
+        self.color = QColor(255, 220, 150)  # Yellowish-orange
 
     def generate_particles(self):
         """Generate spark particles in a burst pattern"""
@@ -366,20 +326,40 @@ class SparkBurst(ParticleEffect):
         origin_x = self.center_x + math.cos(angle) * dist
         origin_y = self.center_y + math.sin(angle) * dist
 
-        # Create particles
-        self.particles = []
-        for _ in range(self.particle_count):
-            spark = SparkParticle(origin_x, origin_y)
+        count = self.particle_count
+        self._alloc(count)
+        self.x[:] = origin_x
+        self.y[:] = origin_y
+        self.size[:] = np.random.uniform(1, 3, count)
+        self._set_rgb(self.color.red(), self.color.green(), self.color.blue())
+        self.fade_rate[:] = np.random.uniform(3, 7, count)
+        self.max_age[:] = np.random.randint(30, 61, count)
+
+        # Fast outward velocity for the burst
+        angles = np.random.uniform(0, math.pi * 2, count)
+        speeds = np.random.uniform(3, 7, count)
+        self.vx[:] = np.cos(angles) * speeds * self.burst_strength
+        self.vy[:] = np.sin(angles) * speeds * self.burst_strength
+        self.vz[:] = np.random.uniform(-1, 1, count) * speeds * 0.5
 
-            # Adjust velocity for burst effect (outward)
-            spark.vx *= self.burst_strength
-            spark.vy *= self.burst_strength
+        # Add slight gravity
+        self.ay[:] = 0.05
 
-            self.particles.append(spark)
+    def render(self, painter):
+        """Render the sparks with a glow effect"""
+        if not self.active:
+            return
+
+        # Base particle, then a larger, more transparent glow over it
+        sizes = np.stack([self.size, self.size * 2], axis=1)
+        colors = np.stack([self._argb(self.alpha), self._argb(self.alpha // 3)], axis=1)
+        self._draw_circles(painter, sizes, colors)
 
 
 class FlareEmission(ParticleEffect):
     """Slow-moving flares that pulse with the music"""
+    columns = {**ParticleEffect.columns, 'base_size': 0, 'pulse_phase': 0, 'pulse_speed': 0}
+
     def __init__(self, center_x, center_y, radius):
         super().__init__(center_x, center_y, radius)
         self.max_lifetime = random.randint(120, 180)
@@ -402,23 +382,52 @@ class FlareEmission(ParticleEffect):
         else:
             base_angle = math.atan2(origin_y - self.center_y, origin_x - self.center_x)
 
-        # Create particles
-        self.particles = []
-        for _ in range(self.particle_count):
-            flare = FlareParticle(origin_x, origin_y)
+        count = self.particle_count
+        self._alloc(count)
+        self.x[:] = origin_x
+        self.y[:] = origin_y
+        self.base_size[:] = np.random.uniform(4, 10, count)
+        self.size[:] = self.base_size
+        self.pulse_phase[:] = np.random.uniform(0, math.pi * 2, count)
+        self.pulse_speed[:] = np.random.uniform(0.1, 0.2, count)
 
-            # Set velocity in emission direction with some spread
-            emission_angle = base_angle + random.uniform(-self.emission_width/2, self.emission_width/2)
-            speed = random.uniform(0.5, 1.5)
+        # Bright, warm tones from red to yellow
+        self._set_hsv(np.random.uniform(0, 0.1, count), 0.8, 1.0)
 
-            flare.vx = math.cos(emission_angle) * speed
-            flare.vy = math.sin(emission_angle) * speed
+        self.fade_rate[:] = np.random.uniform(1, 3, count)
+        self.max_age[:] = np.random.randint(60, 121, count)
 
-            self.particles.append(flare)
+        # Slow velocity in the emission direction with some spread
+        angles = base_angle + np.random.uniform(-self.emission_width/2, self.emission_width/2, count)
+        speeds = np.random.uniform(0.5, 1.5, count)
+        self.vx[:] = np.cos(angles) * speeds
+        self.vy[:] = np.sin(angles) * speeds
+        self.vz[:] = np.random.uniform(-0.5, 0.5, count)
+
+    def _advance(self, bass, mids, highs, volume):
+        alive = super()._advance(bass, mids, highs, volume)
+
+        # Pulse size with phase, reacting to the audio
+        self.pulse_phase += self.pulse_speed
+        audio_factor = 1.0 + volume + (bass * 0.5)
+        self.size[:] = self.base_size * (0.5 * np.sin(self.pulse_phase) + 1.5) * audio_factor
+        return alive
+
+    def render(self, painter):
+        """Render the flares with a radial gradient"""
+        if not self.active:
+            return
+
+        # Use a radial gradient for a soft glow, brighter at the core
+        self._draw_glows(painter, 0.25)
 
 
 class FireworkExplosion(ParticleEffect):
     """Firework that shoots up and explodes into colorful particles"""
+    columns = {**ParticleEffect.columns, 'trail_length': 0}
+    trail_dims = 2
+    drag = 0.98  # Velocity kept per frame
+
     def __init__(self, center_x, center_y, radius):
         super().__init__(center_x, center_y, radius)
         self.max_lifetime = random.randint(150, 200)
@@ -433,7 +442,25 @@ class FireworkExplosion(ParticleEffect):
         self.explosion_height = random.uniform(0.4, 0.7)  # How high before exploding
         self.explosion_size = random.uniform(30, 60)
         self.explosion_stage = False  # Start with launch stage
-        self.launch_particle = None
+
+    def _spawn(self, count, x, y, trail_length):
+        """Replace the particles with ``count`` firework particles at (x, y)"""
+        self._alloc(count)
+        self.x[:] = x
+        self.y[:] = y
+        self.trail_length[:] = trail_length
+        self.size[:] = np.random.uniform(1, 3, count)
+        self._set_rgb(self.color.red(), self.color.green(), self.color.blue())
+        self.fade_rate[:] = np.random.uniform(2, 4, count)
+        self.max_age[:] = np.random.randint(40, 81, count)
+
+        # High initial velocity that slows down
+        self.vx[:] = np.random.uniform(-3, 3, count)
+        self.vy[:] = np.random.uniform(-3, 3, count)
+        self.vz[:] = np.random.uniform(-1, 1, count)
+
+        # Add gravity
+        self.ay[:] = 0.08
 
     def start(self):
         """Start with launch particle"""
@@ -455,45 +482,72 @@ class FireworkExplosion(ParticleEffect):
         target_y = self.center_y + math.sin(target_angle) * target_dist
 
         # Create launch particle
-        self.launch_particle = FireworkParticle(start_x, start_y, color=self.color)
-        self.launch_particle.size = 3
-        self.launch_particle.trail_length = 10
+        self._spawn(1, start_x, start_y, trail_length=10)
+        self.size[0] = 3
 
         # Calculate velocity to reach target (simplified)
-        self.launch_particle.vx = (target_x - start_x) / 30
-        self.launch_particle.vy = (target_y - start_y) / 30
-        self.launch_particle.ay = 0  # No gravity during launch
+        self.vx[0] = (target_x - start_x) / 30
+        self.vy[0] = (target_y - start_y) / 30
+        self.ay[0] = 0  # No gravity during launch
 
-        self.particles = [self.launch_particle]
+    def _advance(self, bass, mids, highs, volume):
+        # Store current positions in the trails
+        self._record_trail(self.x, self.y)
+        return super()._advance(bass, mids, highs, volume)
 
     def update(self, bass, mids, highs, volume):
         """Handle launch and explosion stages"""
         super().update(bass, mids, highs, volume)
 
-        # Check if we need to trigger explosion
-        if not self.explosion_stage and self.launch_particle:
-            # Calculate distance from center
-            dx = self.launch_particle.x - self.center_x
-            dy = self.launch_particle.y - self.center_y
-            dist = math.sqrt(dx*dx + dy*dy)
+        # Check if the launch particle is ready to explode
+        if not self.explosion_stage and self.count:
+            # Squared distance from center
+            dx = self.x[0] - self.center_x
+            dy = self.y[0] - self.center_y
+            target = self.radius * self.explosion_height
 
             # Explode when close enough to target
-            if dist <= self.radius * self.explosion_height:
+            if dx*dx + dy*dy <= target * target:
                 self.explosion_stage = True
 
-                # Create explosion particles
-                explosion_x = self.launch_particle.x
-                explosion_y = self.launch_particle.y
+                # Create explosion particles with the shared color
+                self._spawn(self.particle_count, self.x[0], self.y[0],
+                            np.random.randint(3, 9, self.particle_count))
 
-                self.particles = []
-                for _ in range(self.particle_count):
-                    # Create particles with shared color
-                    particle = FireworkParticle(explosion_x, explosion_y, color=self.color)
-                    self.particles.append(particle)
+    def render(self, painter):
+        """Render the particles with their trails"""
+        if not self.active:
+            return
+
+        pens = ColorCache.pens(self.color.red(), self.color.green(), self.color.blue())
+        for size, alpha, valid, trail in zip(self.size.tolist(), self.alpha.astype(np.int32).tolist(),
+                                             self.trail_count.tolist(), self.ordered_trails().tolist()):
+            if valid < 2:
+                continue
+
+            # Draw the trail in a few polylines with diminishing alpha and
+            # width toward its end; each piece uses the pen the per-segment
+            # ramp gives its newest segment
+            points = [QPointF(x, y) for x, y in trail[TRAIL_SLOTS - valid:]]
+            segments = valid - 1
+            pieces = min(_TRAIL_PIECES, segments)
+            start = 0
+            for piece in range(1, pieces + 1):
+                end = segments * piece // pieces
+                ramp = (end - 1) / valid
+                painter.setPen(pens[max(1, int(size * ramp)), int(alpha * ramp)])
+                painter.drawPolyline(QPolygonF(points[start:end + 1]))
+                start = end
+
+        # Draw the heads of the particles with a trail
+        heads = np.where(self.trail_count >= 2, self.alpha, 0)
+        self._draw_circles(painter, self.size, self._argb(heads))
 
 
 class MistCloud(ParticleEffect):
     """Gentle cloud of mist that drifts and reacts subtly to music"""
+    columns = {**ParticleEffect.columns, 'growth_rate': 0}
+
     def __init__(self, center_x, center_y, radius):
         super().__init__(center_x, center_y, radius)
         self.max_lifetime = random.randint(200, 300)
@@ -509,17 +563,56 @@ class MistCloud(ParticleEffect):
 
         cloud_size = random.uniform(50, 100)
 
-        # Create particles
-        self.particles = []
-        for _ in range(self.particle_count):
-            # Position within cloud area
-            offset_angle = random.uniform(0, math.pi * 2)
-            offset_dist = random.uniform(0, cloud_size)
+        count = self.particle_count
+        self._alloc(count)
+
+        # Position within cloud area
+        offset_angle = np.random.uniform(0, math.pi * 2, count)
+        offset_dist = np.random.uniform(0, cloud_size, count)
+        self.x[:] = cloud_x + np.cos(offset_angle) * offset_dist
+        self.y[:] = cloud_y + np.sin(offset_angle) * offset_dist
+
+        self.size[:] = np.random.uniform(5, 15, count)
+
+        # Mist is light blue-ish and starts semi-transparent
+        self._set_rgb(220, 230, 255)
+        self.alpha[:] = np.random.randint(40, 121, count)
+
+        self.fade_rate[:] = np.random.uniform(0.5, 1.0, count)
+        self.max_age[:] = np.random.randint(100, 201, count)
+
+        # Very slow movement with some randomness
+        self.vx[:] = np.random.uniform(-0.3, 0.3, count)
+        self.vy[:] = np.random.uniform(-0.3, 0.3, count)
+
+        # Slow size change
+        self.growth_rate[:] = np.random.uniform(-0.02, 0.05, count)
+
+    def _advance(self, bass, mids, highs, volume):
+        alive = super()._advance(bass, mids, highs, volume)
+
+        # Drift randomly, but slowly, with one batch of noise for both axes
+        noise = np.random.uniform(-0.05, 0.05, (2, self.count))
+        if NUMBA_AVAILABLE:
+            _drift_mist_kernel(self.size, self.growth_rate, self.vx, self.vy, noise, 0.5)
+            return alive
+
+        # Slowly change size
+        self.size += self.growth_rate
+
+        self.vx += noise[0]
+        self.vy += noise[1]
+        np.clip(self.vx, -0.5, 0.5, out=self.vx)
+        np.clip(self.vy, -0.5, 0.5, out=self.vy)
+        return alive
 
-            x = cloud_x + math.cos(offset_angle) * offset_dist
-            y = cloud_y + math.sin(offset_angle) * offset_dist
+    def render(self, painter):
+        """Render the mist with soft, diffuse edges"""
+        if not self.active:
+            return
 
-            self.particles.append(MistParticle(x, y))
+        # Use a radial gradient fading out to transparent
+        self._draw_glows(painter, 0)
 
 class EffectsManager:
     """Manager for all particle effects"""
@@ -624,14 +717,13 @@ class EffectsManager:
         if self.random_generation and random.random() < self.generation_chance * self.intensity:
             self.generate_random_effect(bands[0], bands[1], bands[2], volume)
 
-        # Update existing effects
+        # Update existing effects, scaling the audio for them once per frame
+        bass = bands[0] * self.bass_reactivity
+        mids = bands[1] * self.mids_reactivity
+        highs = bands[2] * self.highs_reactivity
+        scaled_volume = volume * self.volume_reactivity
         for effect in self.effects:
-            effect.update(
-                bands[0] * self.bass_reactivity,
-                bands[1] * self.mids_reactivity,
-                bands[2] * self.highs_reactivity,
-                volume * self.volume_reactivity
-            )
+            effect.update(bass, mids, highs, scaled_volume)
 
         # Remove inactive effects (keep tunnel if it exists)
         self.effects = [e for e in self.effects if e.active or e == self.active_tunnel]
@@ -810,214 +902,25 @@ class EffectsManager:
         # Fallback (shouldn't happen)
         return random.choice(list(weights.keys()))
 
-class TunnelParticle(Particle):
-    """Particle that creates a 3D tunnel effect flowing toward or away from viewer"""
-    def __init__(self, center_x, center_y, z=0):
-        # Initialize with position at center, but variable z depth
-        super().__init__(center_x, center_y, z)
-
-        # Set particle properties
-        self.base_size = random.uniform(1, 6)  # Base size (will change with z position)
-        self.size = self.base_size
-
-        # Generate random position on a ring
-        angle = random.uniform(0, math.pi * 2)
-        dist = random.uniform(10, 100)  # Start distance from center
-
-        # Set x,y position on the ring
-        self.x = center_x + math.cos(angle) * dist
-        self.y = center_y + math.sin(angle) * dist
-
-        # Set z position (depth)
-        self.z = random.uniform(-500, -100)
-
-        # Flow direction (toward or away from viewer)
-        self.flow_direction = random.choice([-1, 1])  # -1 = toward viewer, 1 = away
-
-        # Flow speed (affected by audio)
-        self.base_speed = random.uniform(2, 8)
-        self.current_speed = self.base_speed
-
-        # Color (will vary based on z position)
-        hue = random.random()
-        self.hue = hue  # Store original hue for later modification
-        self.saturation = random.uniform(0.7, 1.0)
-        self.value = random.uniform(0.8, 1.0)
-
-        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, self.saturation, self.value)]
-        self.color = QColor(r, g, b)
-
-        # Longer lifetime than other particles
-        self.fade_rate = 0  # Don't fade automatically, reset when out of bounds
-        self.max_lifetime = 1000
-
-        # Store original position for spiral movement
-        self.original_angle = angle
-        self.original_dist = dist
-        self.spiral_amount = 0  # How much spiral effect to apply
-        self.spiral_speed = random.uniform(0.0005, 0.002)
-
-        # Trail behind the particle (optional)
-        self.trail = []
-        self.trail_length = random.randint(3, 10) if random.random() < 0.3 else 0  # Only some particles have trails
-
-    def update(self, bass, mids, highs, volume):
-        """Update tunnel particle position and state"""
-        # Store position in trail if enabled
-        if self.trail_length > 0:
-            self.trail.append((self.x, self.y, self.z))
-            if len(self.trail) > self.trail_length:
-                self.trail.pop(0)
-
-        # Update spiral amount based on mids
-        self.spiral_amount += self.spiral_speed * (1.0 + mids * 2)
-
-        # Update speed based on audio
-        self.current_speed = self.base_speed * (1.0 + bass * 2)
-
-        # Move along z-axis based on flow direction
-        self.z += self.current_speed * self.flow_direction
-
-        # Calculate new x,y position based on spiral effect
-        angle = self.original_angle + self.spiral_amount
-        dist = self.original_dist * (abs(self.z) / 400)  # Distance increases with depth
-
-        # Calculate center-relative coordinates
-        center_x = self.x - (self.x - self.original_dist * math.cos(self.original_angle))
-        center_y = self.y - (self.y - self.original_dist * math.sin(self.original_angle))
-
-        self.x = center_x + math.cos(angle) * dist
-        self.y = center_y + math.sin(angle) * dist
-
-        # Reset if particle goes beyond view bounds
-        if (self.flow_direction < 0 and self.z > 50) or (self.flow_direction > 0 and self.z < -1000):
-            self.reset_position(center_x, center_y)
-
-        # Update size based on z position (perspective effect)
-        z_factor = 1000 / (1000 + abs(self.z))
-        self.size = self.base_size * z_factor * (1.0 + volume * 0.5)
-
-        # Update color based on audio
-        # Shift hue based on highs
-        hue_shift = (highs * 0.2) % 1.0
-        new_hue = (self.hue + hue_shift) % 1.0
-
-        # Increase saturation with bass
-        new_saturation = min(1.0, self.saturation + bass * 0.3)
-
-        # Increase brightness with volume
-        new_value = min(1.0, self.value + volume * 0.3)
-
-        # Apply new color
-        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(new_hue, new_saturation, new_value)]
-        self.color = QColor(r, g, b)
-
-        # Update lifetime
-        self.lifetime += 1
-        if self.lifetime >= self.max_lifetime:
-            self.active = False
-
-    def reset_position(self, center_x, center_y):
-        """Reset particle to new position when it goes out of bounds"""
-        # Clear trail
-        self.trail = []
-
-        # New random angle and distance
-        self.original_angle = random.uniform(0, math.pi * 2)
-        self.original_dist = random.uniform(10, 100)
-
-        # Reset z position based on flow direction
-        if self.flow_direction < 0:  # Toward viewer
-            self.z = random.uniform(-500, -300)
-        else:  # Away from viewer
-            self.z = random.uniform(-100, 50)
-
-        # Reset lifetime
-        self.lifetime = 0
-
-        # Reset color
-        self.hue = random.random()
-        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(self.hue, self.saturation, self.value)]
-        self.color = QColor(r, g, b)
-
-    def render(self, painter, center_x, center_y, perspective=800):
-        """Render the tunnel particle with perspective and optional trail"""
-        if not self.active:
-            return
-
-        # Apply perspective projection to get screen coordinates
-        # z ranges from about -500 to 50
-        z_factor = perspective / (perspective - self.z)
-
-        # Project particle position
-        screen_x = center_x + (self.x - center_x) * z_factor
-        screen_y = center_y + (self.y - center_y) * z_factor
-
-        # Calculate alpha based on z position
-        # Particles fade in as they approach viewer
-        if self.flow_direction < 0:  # Toward viewer
-            # Ensure alpha is in the valid range [0, 255]
-            alpha = max(0, min(255, int(255 * min(1.0, (500 + self.z) / 500))))
-        else:  # Away from viewer
-            # Ensure alpha is in the valid range [0, 255]
-            alpha = max(0, min(255, int(255 * min(1.0, (1000 - abs(self.z)) / 500))))
-
-        # Draw trail if enabled
-        if self.trail_length > 0 and len(self.trail) > 1:
-            # Draw lines connecting trail points
-            prev_x, prev_y = None, None
-
-            for i, (trail_x, trail_y, trail_z) in enumerate(reversed(self.trail)):
-                # Apply perspective to trail point
-                trail_z_factor = perspective / (perspective - trail_z)
-                trail_screen_x = center_x + (trail_x - center_x) * trail_z_factor
-                trail_screen_y = center_y + (trail_y - center_y) * trail_z_factor
-
-                # Calculate trail segment alpha (ensure it's in valid range)
-                segment_ratio = i / len(self.trail)
-                trail_alpha = max(0, min(255, int(alpha * segment_ratio)))
-
-                # Set color with alpha
-                trail_color = QColor(self.color)
-                trail_color.setAlpha(trail_alpha)
-
-                # Set pen for trail line
-                pen = QPen(trail_color)
-                pen_width = max(1, int(self.size * trail_z_factor * 0.5))
-                pen.setWidth(pen_width)
-                painter.setPen(pen)
-
-                # Draw line segment if we have a previous point
-                if prev_x is not None and prev_y is not None:
-                    painter.drawLine(
-                        int(trail_screen_x),
-                        int(trail_screen_y),
-                        int(prev_x),
-                        int(prev_y)
-                    )
-
-                prev_x, prev_y = trail_screen_x, trail_screen_y
-
-        # Draw the main particle
-        # Set color with calculated alpha
-        particle_color = QColor(self.color)
-        particle_color.setAlpha(alpha)
-
-        # Apply size based on perspective
-        screen_size = self.size * z_factor
-
-        # Draw the particle
-        painter.setBrush(QBrush(particle_color))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(
-            int(screen_x - screen_size/2),
-            int(screen_y - screen_size/2),
-            int(screen_size),
-            int(screen_size)
-        )
-
 class ParticleTunnel(ParticleEffect):
-    """Creates a 3D tunnel of flowing particles reacting to music"""
+    """Creates a 3D tunnel of flowing particles reacting to music
+
+    Each particle flows along the z axis toward or away from the viewer,
+    spiralling around its ring as it goes, and is respawned further back
+    once it leaves the view. Only some particles keep a trail.
+    """
+    columns = {
+        **ParticleEffect.columns,
+        'base_size': 0,
+        'direction': 1,  # Flow direction: -1 = toward viewer, 1 = away
+        'base_speed': 0,
+        'hue': 0, 'saturation': 0, 'value': 0,  # Base color, modified by the audio
+        'original_angle': 0, 'original_dist': 0,  # Ring position, for the spiral movement
+        'spiral': 0, 'spiral_rate': 0,
+        'trail_length': 0,
+    }
+    trail_dims = 3
+
     def __init__(self, center_x, center_y, radius):
         super().__init__(center_x, center_y, radius)
         self.max_lifetime = float('inf')  # Tunnel continues indefinitely
@@ -1058,17 +961,87 @@ class ParticleTunnel(ParticleEffect):
 
     def generate_particles(self):
         """Generate particles arranged in a tunnel formation"""
-        self.particles = []
+        count = self.particle_count
+        self._alloc(count)
+
+        # Base size, changing with the z position
+        self.base_size[:] = np.random.uniform(1, 6, count)
+        self.size[:] = self.base_size
+
+        # Random positions on a ring around the center, at variable depth
+        self.original_angle[:] = np.random.uniform(0, math.pi * 2, count)
+        self.original_dist[:] = np.random.uniform(10, 100, count)
+        self.x[:] = self.center_x + np.cos(self.original_angle) * self.original_dist
+        self.y[:] = self.center_y + np.sin(self.original_angle) * self.original_dist
+        self.z[:] = np.random.uniform(-500, -100, count)
+
+        self.direction[:] = self.flow_direction
+        self.base_speed[:] = np.random.uniform(2, 8, count)
+
+        self.hue[:] = np.random.random(count)
+        self.saturation[:] = np.random.uniform(0.7, 1.0, count)
+        self.value[:] = np.random.uniform(0.8, 1.0, count)
+        self._set_hsv(self.hue, self.saturation, self.value)
+
+        # Don't fade; particles are reset when they leave the view
+        self.fade_rate[:] = 0
+        self.max_age[:] = 1000
+
+        self.spiral_rate[:] = np.random.uniform(0.0005, 0.002, count)
+
+        # Only some particles have trails
+        has_trail = np.random.random(count) < 0.3
+        self.trail_length[:] = np.where(has_trail, np.random.randint(3, 11, count), 0)
+
+    def _advance(self, bass, mids, highs, volume):
+        # Store positions in the trails of the particles that have one
+        self._record_trail(self.x, self.y, self.z)
+
+        # Spiral with the mids, and flow along the z axis with the bass
+        self.spiral += self.spiral_rate * (1.0 + mids * 2)
+        self.z += self.base_speed * (1.0 + bass * 2) * self.direction
+
+        # Move around the ring, further out with depth
+        angle = self.original_angle + self.spiral
+        dist = self.original_dist * (np.abs(self.z) / 400)
+        self.x[:] = self.original_dist * np.cos(self.original_angle) + np.cos(angle) * dist
+        self.y[:] = self.original_dist * np.sin(self.original_angle) + np.sin(angle) * dist
+
+        # Reset particles that went beyond the view bounds
+        beyond = (((self.direction < 0) & (self.z > 50))
+                  | ((self.direction > 0) & (self.z < -1000)))
+        if beyond.any():
+            self._reset_particles(beyond)
+
+        # Update size based on z position (perspective effect)
+        z_factor = 1000 / (1000 + np.abs(self.z))
+        self.size[:] = self.base_size * z_factor * (1.0 + volume * 0.5)
+
+        # Shift hue with the highs, saturate with the bass and brighten
+        # with the volume
+        hue = (self.hue + (highs * 0.2) % 1.0) % 1.0
+        saturation = np.minimum(1.0, self.saturation + bass * 0.3)
+        value = np.minimum(1.0, self.value + volume * 0.3)
+        self._set_hsv(hue, saturation, value)
+
+        self.age += 1
+        return self.age < self.max_age
 
-        for _ in range(self.particle_count):
-            # Create tunnel particle
-            particle = TunnelParticle(self.center_x, self.center_y)
+    def _reset_particles(self, mask):
+        """Move the masked particles to new ring positions further back"""
+        count = np.count_nonzero(mask)
+        self.trail_count[mask] = 0
 
-            # Override some settings to match tunnel config
-            particle.flow_direction = self.flow_direction
+        self.original_angle[mask] = np.random.uniform(0, math.pi * 2, count)
+        self.original_dist[mask] = np.random.uniform(10, 100, count)
 
-            # Add to active particles
-            self.particles.append(particle)
+        # Start toward viewer particles far away, the others close
+        self.z[mask] = np.where(self.direction[mask] < 0,
+                                np.random.uniform(-500, -300, count),
+                                np.random.uniform(-100, 50, count))
+
+        self.age[mask] = 0
+        self.hue[mask] = np.random.random(count)
 
     def update(self, bass, mids, highs, volume):
         """Update tunnel effect based on audio analysis"""
@@ -1093,32 +1066,55 @@ class ParticleTunnel(ParticleEffect):
         if bass > 0.8 and random.random() < 0.05:
             self.flow_direction *= -1
 
-        # Update for particles that need respawning (instead of removing them)
-        for particle in self.particles:
-            if not particle.active:
-                # Reset instead of removing
-                particle.reset_position(self.center_x, self.center_y)
-                particle.active = True
-
-                # Apply current tunnel settings
-                particle.flow_direction = self.flow_direction
-
-    def render(self, painter):
-        """Render the tunnel effect with depth sorting"""
-        if not self.active or not self.particles:
+    def render(self, painter, perspective=800):
+        """Render the tunnel effect with depth sorting and perspective"""
+        if not self.active or not self.count:
             return
 
-        # Sort particles by Z depth for proper rendering
-        # When flowing toward viewer (negative direction), render back-to-front
-        # When flowing away (positive direction), render front-to-back
-        if self.flow_direction < 0:
-            # Sort from back to front (most negative z first)
-            sorted_particles = sorted(self.particles, key=lambda p: p.z)
-        else:
-            # Sort from front to back (most positive z first)
-            sorted_particles = sorted(self.particles, key=lambda p: -p.z)
+        # Project the particles; z ranges from about -500 to 50
+        z_factor = perspective / (perspective - self.z)
+        screen_x = self.center_x + (self.x - self.center_x) * z_factor
+        screen_y = self.center_y + (self.y - self.center_y) * z_factor
+        screen_size = self.size * z_factor
 
-        # Render each particle with proper depth perspective
-        for particle in sorted_particles:
-            if particle.active:
-                particle.render(painter, self.center_x, self.center_y, 800)
+        # Particles fade in as they approach the viewer
+        visibility = np.where(self.direction < 0,
+                              (500 + self.z) / 500,
+                              (1000 - np.abs(self.z)) / 500)
+        alpha = np.clip(np.trunc(255 * np.minimum(1.0, visibility)), 0, 255)
+
+        # Sort particles by Z depth: back to front when flowing toward the
+        # viewer, front to back when flowing away
+        order = np.argsort(self.z if self.flow_direction < 0 else -self.z, kind='stable')
+
+        # Project the trails the same way, with pen widths shrinking with depth
+        trails = self.ordered_trails()
+        trail_z_factor = perspective / (perspective - trails[:, :, 2])
+        trail_x = (self.center_x + (trails[:, :, 0] - self.center_x) * trail_z_factor).tolist()
+        trail_y = (self.center_y + (trails[:, :, 1] - self.center_y) * trail_z_factor).tolist()
+        trail_width = np.maximum(1, self.size[:, None] * trail_z_factor * 0.5).astype(np.int32).tolist()
+
+        colors = self._colors(alpha)
+        trail_count = self.trail_count.tolist()
+        for i, x, y, size in zip(order.tolist(), screen_x[order].tolist(),
+                                 screen_y[order].tolist(), screen_size[order].tolist()):
+            valid = trail_count[i]
+            if valid > 1:
+                # Connect the trail points, fading out from the newest
+                alpha = colors[i].alpha()
+                for j in range(1, valid):
+                    newer, older = TRAIL_SLOTS - j, TRAIL_SLOTS - j - 1
+                    trail_color = QColor(colors[i])
+                    trail_color.setAlpha(int(alpha * (j / valid)))
+
+                    pen = QPen(trail_color)
+                    pen.setWidth(trail_width[i][older])
+                    painter.setPen(pen)
+
+                    painter.drawLine(int(trail_x[i][older]), int(trail_y[i][older]),
+                                     int(trail_x[i][newer]), int(trail_y[i][newer]))
+
+            # Draw the particle
+            painter.setBrush(QBrush(colors[i]))
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(int(x - size/2), int(y - size/2), int(size), int(size))
@@ -6,56 +6,319 @@ Music-Reactive Kaleidoscope Visualization Module
 import math
 import random
 import colorsys
-from PyQt5.QtCore import Qt, QPoint, QRect
-from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QImage, QRadialGradient
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRect, QRectF
+from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QImage, QPixmap, QRadialGradient, QPolygonF
 import numpy as np
 import sys
 
+from src.core.numba_support import njit, prange, NUMBA_AVAILABLE
 
 
 # =============================================================================
 # Core Module: Visualization Components
 # =============================================================================
 
-class Particle:
-    """Individual particle for the visualization"""
-    def __init__(self, radius, particle_size, trail_length):
-        angle = random.uniform(0, math.pi * 2)
-        dist = random.uniform(0, radius * 0.7)
-        self.x = math.cos(angle) * dist
-        self.y = math.sin(angle) * dist
-        self.z = random.uniform(-100, 100)  # Add Z coordinate for 3D
-        self.size = random.uniform(particle_size * 0.5, particle_size * 1.5)
-        self.speed = random.uniform(0.5, 2.0)
-        self.angle = random.uniform(0, math.pi * 2)
-        self.z_speed = random.uniform(-0.5, 0.5)  # Z-axis movement speed
-        self.trail = []
+def qimage_array(image):
+    """Return a (height, width) uint32 NumPy view of a 32-bit QImage's pixels
+
+    The view shares memory with the image, so writes go straight into it.
+    The image must outlive the returned array.
+    """
+    ptr = image.bits()
+    ptr.setsize(image.sizeInBytes())
+    return np.frombuffer(ptr, np.uint32).reshape(
+        image.height(), image.bytesPerLine() // 4)[:, :image.width()]
+
+
+def points_to_polygon(xs, ys):
+    """Build a QPolygonF from x and y coordinate arrays without a Python loop"""
+    polygon = QPolygonF(len(xs))
+    ptr = polygon.data()
+    ptr.setsize(len(xs) * 2 * 8)
+    coords = np.frombuffer(ptr, np.float64).reshape(len(xs), 2)
+    coords[:, 0] = xs
+    coords[:, 1] = ys
+    return polygon
+
+
+def group_indices(keys):
+    """Yield (key, indices) for each distinct value in an integer key array"""
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.diff(sorted_keys, prepend=sorted_keys[:1] - 1))
+    ends = np.append(starts[1:], len(sorted_keys))
+    for start, end in zip(starts, ends):
+        yield int(sorted_keys[start]), order[start:end]
+
+
+def content_rect(image, margin=2):
+    """Bounding QRect of the non-transparent pixels of a 32-bit image
+
+    The rect is grown by ``margin`` pixels so transformed draws of it keep
+    the same edge sampling as drawing the whole image. Returns an empty
+    QRect when the image is fully transparent.
+    """
+    pixels = qimage_array(image)
+    rows = np.flatnonzero(pixels.any(axis=1))
+    if len(rows) == 0:
+        return QRect()
+    cols = np.flatnonzero(pixels.any(axis=0))
+
+    left = max(int(cols[0]) - margin, 0)
+    top = max(int(rows[0]) - margin, 0)
+    right = min(int(cols[-1]) + margin, image.width() - 1)
+    bottom = min(int(rows[-1]) + margin, image.height() - 1)
+    return QRect(QPoint(left, top), QPoint(right, bottom))
+
+
+def rotate_3d(x, y, z, angle_x, angle_y, angle_z):
+    """Rotate points about the Z, then Y, then X axis (angles in radians)"""
+    cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+    cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+    cos_z, sin_z = math.cos(angle_z), math.sin(angle_z)
+
+    x_rot = x * cos_z - y * sin_z
+    y_rot = x * sin_z + y * cos_z
+
+    x_rot2 = x_rot * cos_y + z * sin_y
+    z_rot = -x_rot * sin_y + z * cos_y
+
+    y_rot2 = y_rot * cos_x - z_rot * sin_x
+    z_rot2 = y_rot * sin_x + z_rot * cos_x
+
+    return x_rot2, y_rot2, z_rot2
+
+
+def rotation_matrix_3d(angle_x, angle_y, angle_z, order="zyx"):
+    """3x3 matrix applying the same rotations as rotate_3d to row vectors
+
+    ``order`` lists the axes in the order their rotations are applied:
+    rotate_3d turns about Z first, the wireframe shapes about X first.
+    Rotate an (N, 3) array of points with ``points @ matrix``.
+    """
+    cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+    cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+    cos_z, sin_z = math.cos(angle_z), math.sin(angle_z)
+    axes = {
+        'x': np.array([[1, 0, 0], [0, cos_x, -sin_x], [0, sin_x, cos_x]]),
+        'y': np.array([[cos_y, 0, sin_y], [0, 1, 0], [-sin_y, 0, cos_y]]),
+        'z': np.array([[cos_z, -sin_z, 0], [sin_z, cos_z, 0], [0, 0, 1]]),
+    }
+
+    matrix = np.identity(3)
+    for axis in order:
+        matrix = axes[axis] @ matrix
+    return matrix.T
+
+
+@njit(cache=True, fastmath=True)
+def _project_trails_kernel(trail, trail_head, trail_count, current_size,
+                           project, angle_x, angle_y, angle_z, perspective):
+    """Numba kernel for ParticleSystem.project_trails"""
+    count, trail_length, _ = trail.shape
+    total = 0
+    for i in range(count):
+        total += trail_count[i]
+
+    px = np.empty(total, np.float32)
+    py = np.empty(total, np.float32)
+    fraction = np.empty(total, np.float32)
+    size = np.empty(total, np.float32)
+
+    cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+    cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+    cos_z, sin_z = math.cos(angle_z), math.sin(angle_z)
+
+    k = 0
+    for i in range(count):
+        valid = trail_count[i]
+        for j in range(valid):
+            slot = (trail_head - valid + j) % trail_length
+            x = trail[i, slot, 0]
+            y = trail[i, slot, 1]
+            z = trail[i, slot, 2]
+            scale = 1.0
+            # The same for every point, so the compiler can hoist this
+            # branch out of the loop
+            if project:
+                x_rot = x * cos_z - y * sin_z
+                y_rot = x * sin_z + y * cos_z
+                x = x_rot * cos_y + z * sin_y
+                z_rot = -x_rot * sin_y + z * cos_y
+                y = y_rot * cos_x - z_rot * sin_x
+                z = y_rot * sin_x + z_rot * cos_x
+                scale = perspective / (perspective + z)
+            px[k] = x * scale
+            py[k] = y * scale
+            fraction[k] = j / valid
+            size[k] = current_size[i] * fraction[k] * scale
+            k += 1
+
+    return px, py, fraction, size
+
+
+class ParticleSystem:
+    """Kaleidoscope particles stored as parallel NumPy arrays
+
+    All particles are advanced in one vectorized pass per frame. Trails are
+    kept in a shared (count, trail_length, 3) ring buffer: every particle
+    appends a point per frame at ``trail_head``, and ``trail_count`` records
+    how many of its most recent points are valid.
+    """
+    def __init__(self, count, radius, particle_size, trail_length):
+        self.count = count
         self.trail_length = trail_length
-        self.color = QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-        self.current_size = self.size
+
+        angle = np.random.uniform(0, math.pi * 2, count)
+        dist = np.random.uniform(0, radius * 0.7, count)
+        self.x = (np.cos(angle) * dist).astype(np.float32)
+        self.y = (np.sin(angle) * dist).astype(np.float32)
+        self.z = np.random.uniform(-100, 100, count).astype(np.float32)  # Z coordinate for 3D
+        self.size = np.random.uniform(particle_size * 0.5, particle_size * 1.5, count).astype(np.float32)
+        self.speed = np.random.uniform(0.5, 2.0, count).astype(np.float32)
+        self.angle = np.random.uniform(0, math.pi * 2, count).astype(np.float32)
+        self.z_speed = np.random.uniform(-0.5, 0.5, count).astype(np.float32)  # Z-axis movement speed
+        self.current_size = self.size.copy()
+
+        # Trail ring buffer
+        self.trail = np.zeros((count, trail_length, 3), dtype=np.float32)
+        self.trail_head = 0
+        self.trail_count = np.zeros(count, dtype=np.int32)
 
     def update(self, speed_mod, size_mod, z_mod=1.0):
-        """Update particle position and trail"""
+        """Update particle positions and trails"""
         self.angle += 0.02 * speed_mod
-        self.x += math.cos(self.angle) * self.speed * speed_mod * 0.5
-        self.y += math.sin(self.angle) * self.speed * speed_mod * 0.5
+        step = self.speed * (speed_mod * 0.5)
+        self.x += np.cos(self.angle) * step
+        self.y += np.sin(self.angle) * step
         self.z += self.z_speed * z_mod  # Update Z position
 
-        # Z-axis boundaries (wrap around)
-        if self.z > 200 or self.z < -200:
-            self.z_speed = -self.z_speed
+        # Z-axis boundaries (bounce)
+        self.z_speed[np.abs(self.z) > 200] *= -1
 
         # Store trail positions
-        self.trail.append((self.x, self.y, self.z))
-        if len(self.trail) > self.trail_length:
-            self.trail.pop(0)
+        head = self.trail_head
+        self.trail[:, head, 0] = self.x
+        self.trail[:, head, 1] = self.y
+        self.trail[:, head, 2] = self.z
+        self.trail_head = (head + 1) % self.trail_length
+        np.minimum(self.trail_count + 1, self.trail_length, out=self.trail_count)
 
         # Update current size
-        self.current_size = self.size * size_mod
+        np.multiply(self.size, size_mod, out=self.current_size)
+
+    def respawn_outside(self, limit, respawn_radius):
+        """Move particles further than ``limit`` from the center back near it"""
+        # Compare squared distances, avoiding a square root per particle
+        outside = self.x * self.x + self.y * self.y > limit * limit
+        respawned = np.count_nonzero(outside)
+        if respawned:
+            angle = np.random.uniform(0, math.pi * 2, respawned)
+            dist = np.random.uniform(0, respawn_radius, respawned)
+            self.x[outside] = np.cos(angle) * dist
+            self.y[outside] = np.sin(angle) * dist
+            self.trail_count[outside] = 0
+
+    def ordered_trails(self):
+        """Return trails oldest point first; valid points sit at the end"""
+        return np.roll(self.trail, -self.trail_head, axis=1)
+
+    def project_trails(self, rotation=None, perspective=500):
+        """Screen offsets of every valid trail point, oldest first per particle
+
+        With ``rotation`` given as (x, y, z) angles, the points are rotated
+        and perspective-projected; otherwise they are used as they are.
+        Returns (px, py, fraction, size) arrays, where fraction is each
+        point's position along its trail (0 = oldest) and size its size
+        scaled by the fraction and the projection.
+        """
+        if NUMBA_AVAILABLE:
+            angle_x, angle_y, angle_z = rotation if rotation is not None else (0.0, 0.0, 0.0)
+            return _project_trails_kernel(self.trail, self.trail_head, self.trail_count,
+                                          self.current_size, rotation is not None,
+                                          angle_x, angle_y, angle_z, perspective)
+
+        # Valid points are the last trail_count slots of each ordered trail
+        slots = np.arange(self.trail_length)
+        first_valid = (self.trail_length - self.trail_count)[:, None]
+        valid = slots >= first_valid
+        fraction = ((slots - first_valid) / np.maximum(self.trail_count, 1)[:, None]).astype(np.float32)
+
+        points = self.ordered_trails()[valid]
+        fraction = fraction[valid]
+        current_size = np.broadcast_to(self.current_size[:, None], valid.shape)[valid]
+
+        if rotation is not None:
+            matrix = rotation_matrix_3d(*rotation).astype(np.float32)
+            rx, ry, rz = (points @ matrix).T
+            scale = perspective / (perspective + rz)
+            return rx * scale, ry * scale, fraction, current_size * fraction * scale
+
+        return points[:, 0], points[:, 1], fraction, current_size * fraction
+
+
+# Unit-size star vertices, alternating outer (radius 1) and inner (0.4) points
+_STAR_OFFSETS = [
+    (math.cos(angle) * radius, math.sin(angle) * radius)
+    for i in range(5)
+    for angle, radius in ((math.pi/2 + i * 2*math.pi/5, 1.0),
+                          (math.pi/2 + i * 2*math.pi/5 + math.pi/5, 0.4))
+]
+
+
+# Shape sprites are rasterized at this size with the shape's size at half of it
+SPRITE_SIZE = 64
+_SPRITE_CACHE_LIMIT = 512
+
+
+@njit(cache=True, fastmath=True)
+def _splat_circles_kernel(pixels, xs, ys, radii, colors):
+    """Numba kernel for ShapeRenderer.splat_circles (uint32 pixel views)
+
+    Blends each circle over the premultiplied pixels in turn, with the
+    coverage of a pixel falling off over one pixel at the circle's edge.
+    """
+    height, width = pixels.shape
+    for i in range(len(xs)):
+        radius = radii[i]
+        color = np.int64(colors[i])
+        alpha = (color >> 24) & 0xFF
+        if radius <= 0 or alpha == 0:
+            continue
+        red = (color >> 16) & 0xFF
+        green = (color >> 8) & 0xFF
+        blue = color & 0xFF
+        center_x, center_y = xs[i], ys[i]
+
+        top = max(int(math.floor(center_y - radius)), 0)
+        bottom = min(int(math.ceil(center_y + radius)) + 1, height)
+        left = max(int(math.floor(center_x - radius)), 0)
+        right = min(int(math.ceil(center_x + radius)) + 1, width)
+        for y in range(top, bottom):
+            dy = y + 0.5 - center_y
+            for x in range(left, right):
+                dx = x + 0.5 - center_x
+                coverage = radius + 0.5 - math.sqrt(dx * dx + dy * dy)
+                if coverage <= 0:
+                    continue
+                # Source alpha and the fraction of the destination kept
+                src_alpha = alpha * min(coverage, 1.0) / 255.0
+                keep = 1.0 - src_alpha
+
+                dst = np.int64(pixels[y, x])
+                out_a = int(src_alpha * 255 + ((dst >> 24) & 0xFF) * keep + 0.5)
+                out_r = int(src_alpha * red + ((dst >> 16) & 0xFF) * keep + 0.5)
+                out_g = int(src_alpha * green + ((dst >> 8) & 0xFF) * keep + 0.5)
+                out_b = int(src_alpha * blue + (dst & 0xFF) * keep + 0.5)
+                pixels[y, x] = np.uint32((out_a << 24) | (out_r << 16) | (out_g << 8) | out_b)
 
 
 class ShapeRenderer:
     """Factory for rendering different particle shapes"""
+    # Pre-rasterized sprites keyed by (shape_type, rgb), least recently used first
+    _sprite_cache = OrderedDict()
+
     @staticmethod
     def render_shape(painter, shape_type, x, y, size, color):
         """Render a shape at the given position with the specified color"""
@@ -80,25 +343,122 @@ class ShapeRenderer:
         elif shape_type == "star":
             painter.setBrush(QBrush(color))
             painter.setPen(Qt.NoPen)
-            points = []
-            for i in range(5):
-                # Outer points
-                angle = math.pi/2 + i * 2*math.pi/5
-                points.append(QPoint(
-                    int(x + math.cos(angle) * size),
-                    int(y + math.sin(angle) * size)
-                ))
-                # Inner points
-                angle += math.pi/5
-                points.append(QPoint(
-                    int(x + math.cos(angle) * size * 0.4),
-                    int(y + math.sin(angle) * size * 0.4)
-                ))
+            points = [QPoint(int(x + dx * size), int(y + dy * size))
+                      for dx, dy in _STAR_OFFSETS]
             painter.drawPolygon(points)
 
 
+    @staticmethod
+    def render_circles(painter, xs, ys, sizes, colors):
+        """Render many circles, batching those that share a color and size
+
+        Circles are drawn as round pen points, one drawPoints call per
+        (color, diameter) group. ``colors`` holds ARGB values as uint32.
+        """
+        diameters = 2 * sizes.astype(np.int64)
+        keys = (colors.astype(np.int64) << 16) | diameters
+
+        painter.setBrush(Qt.NoBrush)
+        for key, group in group_indices(keys):
+            pen = QPen(QColor.fromRgba(key >> 16))
+            pen.setWidth(key & 0xFFFF)
+            pen.setCapStyle(Qt.RoundCap)
+            painter.setPen(pen)
+            painter.drawPoints(points_to_polygon(xs[group], ys[group]))
+
+    @staticmethod
+    def splat_circles(image, xs, ys, sizes, colors):
+        """Rasterize circles straight into a premultiplied 32-bit image
+
+        Needs Numba. Draws the same antialiased circles as render_circles,
+        in the order given, without a QPainter call per color group.
+        ``colors`` holds unpremultiplied ARGB values as uint32.
+        """
+        _splat_circles_kernel(qimage_array(image), np.asarray(xs, np.float32),
+                              np.asarray(ys, np.float32), np.trunc(sizes), colors)
+
+    @staticmethod
+    def draw_circles(painter, xs, ys, sizes, colors):
+        """Draw circles with whichever of splat_circles and render_circles fits
+
+        Splats straight into the painter's image when Numba is available
+        and the painter draws plainly (no transform, clip, opacity or
+        composition mode) onto a premultiplied 32-bit QImage; otherwise
+        renders them with the painter.
+        """
+        device = painter.device()
+        if (NUMBA_AVAILABLE and isinstance(device, QImage)
+                and device.format() == QImage.Format_ARGB32_Premultiplied
+                and painter.transform().isIdentity() and not painter.hasClipping()
+                and painter.opacity() == 1.0
+                and painter.compositionMode() == QPainter.CompositionMode_SourceOver):
+            ShapeRenderer.splat_circles(device, xs, ys, sizes, colors)
+        else:
+            ShapeRenderer.render_circles(painter, xs, ys, sizes, colors)
+
+    @staticmethod
+    def get_sprite(shape_type, rgb):
+        """Return the cached sprite for a shape in an opaque color"""
+        key = (shape_type, rgb)
+        sprite = ShapeRenderer._sprite_cache.get(key)
+        if sprite is None:
+            half = SPRITE_SIZE // 2
+            sprite = QPixmap(SPRITE_SIZE, SPRITE_SIZE)
+            sprite.fill(Qt.transparent)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            ShapeRenderer.render_shape(painter, shape_type, half, half, half, QColor(rgb))
+            painter.end()
+
+            ShapeRenderer._sprite_cache[key] = sprite
+            if len(ShapeRenderer._sprite_cache) > _SPRITE_CACHE_LIMIT:
+                ShapeRenderer._sprite_cache.popitem(last=False)
+        else:
+            ShapeRenderer._sprite_cache.move_to_end(key)
+        return sprite
+
+    @staticmethod
+    def render_sprites(painter, shape_type, xs, ys, sizes, colors):
+        """Render many shapes by stamping cached sprites
+
+        Each point becomes a pixmap fragment scaled to its size with its
+        alpha as opacity; one drawPixmapFragments call is made per color.
+        Colors are quantized to 5 bits per channel so that similar colors
+        share a sprite.
+        """
+        rgb = colors & 0x00F8F8F8
+        opacity = (colors >> 24) / 255.0
+        scale = sizes / (SPRITE_SIZE // 2)
+        source = QRectF(0, 0, SPRITE_SIZE, SPRITE_SIZE)
+        create = QPainter.PixmapFragment.create
+
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        for key, group in group_indices(rgb):
+            fragments = [create(QPointF(x, y), source, s, s, 0, o)
+                         for x, y, s, o in zip(xs[group], ys[group], scale[group], opacity[group])]
+            painter.drawPixmapFragments(fragments, ShapeRenderer.get_sprite(shape_type, key))
+
+
 class ColorGenerator:
     """Factory for generating colors based on different modes"""
+    # Unit-value spectrum colors, cached per spectrum length
+    _spectrum_palettes = {}
+
+    @staticmethod
+    def spectrum_palette(spectrum_length):
+        """(spectrum_length, 3) RGB of each spectrum hue at full value
+
+        With a fixed saturation every HSV channel is the value times a
+        factor that only depends on the hue, so scaling a row of this
+        palette by the intensity gives the same color as hsv_to_rgb.
+        """
+        palette = ColorGenerator._spectrum_palettes.get(spectrum_length)
+        if palette is None:
+            hue = (np.arange(spectrum_length) / spectrum_length) % 1.0
+            palette = np.stack(_hsv_to_rgb_array(hue, 0.8, np.ones(spectrum_length)), axis=1)
+            ColorGenerator._spectrum_palettes[spectrum_length] = palette
+        return palette
+
     @staticmethod
     def get_color(mode, params):
         """Generate color based on the specified mode and parameters"""
@@ -126,11 +486,77 @@ class ColorGenerator:
             return QColor(r, g, b, params.get('alpha', 255))
 
 
+    @staticmethod
+    def get_color_array(mode, params):
+        """Vectorized get_color: returns packed ARGB values as a uint32 array
+
+        Takes the same parameters as get_color, with 'freq_index',
+        'intensity', 'ratio' and 'alpha' given as arrays. Spectrum colors
+        are looked up in ``spectrum_palette``, so 'freq_index' must hold
+        integers.
+        """
+        alpha = np.asarray(params.get('alpha', 255)).astype(np.uint32)
+        if mode == "spectrum":
+            spectrum_length = params.get('spectrum_length', 100)
+            palette = ColorGenerator.spectrum_palette(spectrum_length)
+            freq_index = np.asarray(params['freq_index']) % spectrum_length
+            intensity = np.asarray(params['intensity'], dtype=np.float64)
+            rgb = (palette[freq_index] * intensity[..., None] * 255).astype(np.uint32)
+            r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        elif mode == "solid":
+            base_color = params.get('base_color', QColor(255, 0, 127))
+            r, g, b = base_color.red(), base_color.green(), base_color.blue()
+        else:  # gradient
+            base_color = params.get('base_color', QColor(255, 0, 127))
+            secondary_color = params.get('secondary_color', QColor(0, 127, 255))
+            ratio = params.get('ratio', 0.5)
+            inverse = 1 - ratio
+
+            r = (base_color.red() * ratio + secondary_color.red() * inverse).astype(np.uint32)
+            g = (base_color.green() * ratio + secondary_color.green() * inverse).astype(np.uint32)
+            b = (base_color.blue() * ratio + secondary_color.blue() * inverse).astype(np.uint32)
+
+        return (alpha << 24) | (np.uint32(r) << 16) | (np.uint32(g) << 8) | np.uint32(b)
+
+
+def _hsv_to_rgb_array(hue, saturation, value):
+    """Vectorized colorsys.hsv_to_rgb over arrays of hue and value"""
+    hue = np.asarray(hue, dtype=np.float64)
+    value = np.asarray(value, dtype=np.float64)
+    sector = (hue * 6.0).astype(np.int64)
+    f = hue * 6.0 - sector
+    p = value * (1.0 - saturation)
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    sector %= 6
+
+    choices = [sector == i for i in range(6)]
+    r = np.select(choices, [value, q, p, p, t, value])
+    g = np.select(choices, [t, value, value, q, p, p])
+    b = np.select(choices, [p, p, t, value, value, q])
+    return r, g, b
+
+
 class SymmetryRenderer:
     """Factory for rendering different symmetry modes"""
+    @staticmethod
+    def create_mirror_tile(width, height, image_format=QImage.Format_ARGB32_Premultiplied):
+        """Create the 2x2 tile image used by the mirror mode"""
+        return QImage(width * 2, height * 2, image_format)
+
     @staticmethod
     def apply_symmetry(painter, buffer_image, mode, params):
         """Apply symmetry effect to the buffer image"""
+        if mode in ("radial", "spiral") and (buffer_image.depth() == 32 or 'content_rect' in params):
+            # The rotated copies only need the part of the buffer that has
+            # something drawn on it; callers that track it can pass it in
+            drawn = params.get('content_rect')
+            source = QRectF(drawn if drawn is not None else content_rect(buffer_image))
+            if source.isEmpty():
+                return
+        else:
+            source = QRectF(buffer_image.rect())
+
         if mode == "radial":
             # Create multiple reflected segments in a circle
             segments = params.get('segments', 8)
@@ -145,21 +571,29 @@ class SymmetryRenderer:
                 transform = painter.transform()
                 painter.translate(center_x, center_y)
                 painter.rotate(math.degrees(-angle))
-                painter.drawImage(-center_x, -center_y, buffer_image)
+                painter.drawImage(QPointF(source.x() - center_x, source.y() - center_y), buffer_image, source)
                 painter.setTransform(transform)
 
         elif mode == "mirror":
-            # Simple mirror reflection across x and y axes
-            painter.drawImage(0, 0, buffer_image)
-
-            # Create flipped versions
-            flipped_h = buffer_image.mirrored(True, False)
-            flipped_v = buffer_image.mirrored(False, True)
-            flipped_both = buffer_image.mirrored(True, True)
-
-            painter.drawImage(0, 0, flipped_h)
-            painter.drawImage(0, 0, flipped_v)
-            painter.drawImage(0, 0, flipped_both)
+            # Simple mirror reflection across x and y axes. The four flipped
+            # variants are written into one 2x2 tile and each quadrant is
+            # drawn over the same area.
+            width, height = buffer_image.width(), buffer_image.height()
+            tile = params.get('mirror_tile')
+            if tile is None or tile.width() != width * 2 or tile.height() != height * 2:
+                tile = SymmetryRenderer.create_mirror_tile(width, height)
+            if buffer_image.depth() != 32:
+                buffer_image = buffer_image.convertToFormat(tile.format())
+
+            pixels = qimage_array(buffer_image)
+            tiled = qimage_array(tile)
+            tiled[:height, :width] = pixels
+            tiled[:height, width:] = pixels[:, ::-1]
+            tiled[height:, :width] = pixels[::-1, :]
+            tiled[height:, width:] = pixels[::-1, ::-1]
+
+            for source_x, source_y in ((0, 0), (width, 0), (0, height), (width, height)):
+                painter.drawImage(0, 0, tile, source_x, source_y, width, height)
 
         elif mode == "spiral":
             # Create a spiral effect by rotating and scaling segments
@@ -175,83 +609,224 @@ class SymmetryRenderer:
                 painter.translate(center_x, center_y)
                 painter.rotate(math.degrees(-angle))
                 painter.scale(scale, scale)
-                painter.drawImage(-center_x, -center_y, buffer_image)
+                painter.drawImage(QPointF(source.x() - center_x, source.y() - center_y), buffer_image, source)
                 painter.setTransform(transform)
 
 
+@njit(parallel=True, cache=True, fastmath=True)
+def _distort_kernel(src, dst, unit_x, unit_y, wave_sin, wave_cos, amount, rotation):
+    """Numba kernel for EffectProcessor.apply_distortion (uint32 pixel views)
+
+    Takes the cached grids from EffectProcessor._get_distortion_grid;
+    pixels outside the radius have zero unit vectors and stay in place.
+    """
+    height, width = src.shape
+    phase = rotation * 10
+    # sin(d / 20 + phase) expanded, so no trig is needed per pixel
+    scale_sin = math.cos(phase) * amount * 10
+    scale_cos = math.sin(phase) * amount * 10
+    for y in prange(height):
+        for x in range(width):
+            factor = wave_sin[y, x] * scale_sin + wave_cos[y, x] * scale_cos
+            src_x = min(max(int(x + unit_x[y, x] * factor), 0), width - 1)
+            src_y = min(max(int(y + unit_y[y, x] * factor), 0), height - 1)
+            dst[y, x] = src[src_y, src_x]
+
+
+# _box_blur_kernel divides by the window with a multiply and a 40 bit
+# shift, which is exact while 255 * window**3 < 2**40
+_BOX_BLUR_MAX_RADIUS = 800
+
+
+@njit(cache=True)
+def _box_blur_kernel(pixels, radius):
+    """Numba kernel for the box blur in EffectProcessor.apply_blur
+
+    Blurs a (rows, cols, 4) uint8 array in place, first down its columns
+    and then along its rows, with the same running sums and repeated
+    border pixels as EffectProcessor._box_blur_rows.
+    """
+    rows, cols, channels = pixels.shape
+    window = 2 * radius + 1
+    scale = ((1 << 40) + window - 1) // window
+
+    # Sweep down the rows with a running total per column and channel
+    source = pixels.copy()
+    total = np.zeros((cols, channels), np.int64)
+    for k in range(-radius, radius + 1):
+        row = min(max(k, 0), rows - 1)
+        for x in range(cols):
+            for c in range(channels):
+                total[x, c] += source[row, x, c]
+    for y in range(rows):
+        add = min(y + radius + 1, rows - 1)
+        sub = max(y - radius, 0)
+        for x in range(cols):
+            for c in range(channels):
+                pixels[y, x, c] = (total[x, c] * scale) >> 40
+                total[x, c] += np.int64(source[add, x, c]) - np.int64(source[sub, x, c])
+
+    # Then along each row, from a copy of it
+    line = np.empty((cols, channels), np.int64)
+    run = np.empty(channels, np.int64)
+    for y in range(rows):
+        for x in range(cols):
+            for c in range(channels):
+                line[x, c] = pixels[y, x, c]
+        run[:] = 0
+        for k in range(-radius, radius + 1):
+            col = min(max(k, 0), cols - 1)
+            for c in range(channels):
+                run[c] += line[col, c]
+        for x in range(cols):
+            add = min(x + radius + 1, cols - 1)
+            sub = max(x - radius, 0)
+            for c in range(channels):
+                pixels[y, x, c] = (run[c] * scale) >> 40
+                run[c] += line[add, c] - line[sub, c]
+
+
 class EffectProcessor:
     """Applies post-processing effects to images"""
     @staticmethod
-    def apply_blur(image, amount):
-        """Apply blur effect to the image"""
-        if amount <= 0:
+    def create_blur_scratch(width, height, image_format=QImage.Format_ARGB32_Premultiplied):
+        """Create the quarter-size scratch image used by apply_blur"""
+        return QImage(max(1, width // 4), max(1, height // 4), image_format)
+
+    @staticmethod
+    def _box_blur_rows(pixels, radius):
+        """Box blur a (rows, cols, 4) uint8 array along its first axis
+
+        Uses a running sum, so the cost doesn't depend on the radius.
+        Edges are extended by repeating the border pixels.
+        """
+        window = 2 * radius + 1
+        padded = np.concatenate([
+            np.repeat(pixels[:1], radius + 1, axis=0),
+            pixels,
+            np.repeat(pixels[-1:], radius, axis=0)
+        ])
+        sums = np.cumsum(padded, axis=0, dtype=np.uint32)
+        return ((sums[window:] - sums[:-window]) // window).astype(np.uint8)
+
+    @staticmethod
+    def apply_blur(image, amount, scratch=None):
+        """Apply blur effect to the image
+
+        When a scratch image from ``create_blur_scratch`` is given the image
+        is blurred in place and no images are allocated; otherwise a blurred
+        copy is returned.
+        """
+        # The box blur radius grows with the amount while the cost stays
+        # constant; amounts below one leave the image as it is
+        radius = int(amount)
+        if radius <= 0:
             return image
 
-        # Create a temporary copy to avoid modifying the original during operation
-        result = QImage(image)
-
-        # Create a smaller version and scale it back up for blur effect
-        for _ in range(int(amount)):
-            # Note: explicitly specify the transformation mode as the last parameter
-            small_image = result.scaled(
-                result.width() // 4,
-                result.height() // 4,
-                Qt.IgnoreAspectRatio,  # aspectRatioMode
-                Qt.SmoothTransformation  # transformMode
-            )
+        if scratch is None:
+            # Work on a copy so the caller's image is left untouched
+            image = QImage(image)
+            scratch = EffectProcessor.create_blur_scratch(image.width(), image.height(), image.format())
+        small_rect = scratch.rect()
+
+        # Scale down to quarter size
+        painter = QPainter(scratch)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        painter.drawImage(small_rect, image, image.rect())
+        painter.end()
 
-            blurred = small_image.scaled(
-                result.width(),
-                result.height(),
-                Qt.IgnoreAspectRatio,  # aspectRatioMode
-                Qt.SmoothTransformation  # transformMode
-            )
+        # Separable box blur of the small image
+        pixels = qimage_array(scratch).view(np.uint8).reshape(scratch.height(), scratch.width(), 4)
+        if NUMBA_AVAILABLE and radius <= _BOX_BLUR_MAX_RADIUS:
+            _box_blur_kernel(pixels, radius)
+        else:
+            blurred = EffectProcessor._box_blur_rows(pixels, radius)
+            pixels[:] = EffectProcessor._box_blur_rows(blurred.swapaxes(0, 1), radius).swapaxes(0, 1)
+
+        # Scale back up, painting the blurred image onto the result
+        painter = QPainter(image)
+        painter.setOpacity(0.7)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        painter.drawImage(image.rect(), scratch, small_rect)
+        painter.end()
 
-            # Paint the blurred image onto the result
-            painter = QPainter(result)
-            painter.setOpacity(0.7)
-            painter.drawImage(0, 0, blurred)
-            painter.end()
+        return image
 
-        return result
+    # Per-geometry sampling grids for apply_distortion, keyed by
+    # (width, height, center_x, center_y, radius)
+    _distortion_grids = {}
+
+    @staticmethod
+    def _get_distortion_grid(width, height, center_x, center_y, radius):
+        """Return cached pixel grids, radial unit vectors and wave tables
+
+        The unit vectors are zero outside the radius, so those pixels are
+        not displaced. The wave tables hold sin and cos of distance / 20,
+        which only change with the geometry; the rotation is applied per
+        frame with the angle addition formula.
+        """
+        key = (width, height, center_x, center_y, radius)
+        grid = EffectProcessor._distortion_grids.get(key)
+        if grid is None:
+            # Only one geometry is live at a time, so drop stale grids
+            EffectProcessor._distortion_grids.clear()
+
+            ys, xs = np.mgrid[0:height, 0:width].astype(np.float32)
+            dx = xs - center_x
+            dy = ys - center_y
+            distance = np.hypot(dx, dy)
+            inside = (distance > 0) & (distance < radius)
+
+            # Unit direction away from the center (zero at the center itself)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                unit_x = np.where(inside, dx / distance, 0).astype(np.float32)
+                unit_y = np.where(inside, dy / distance, 0).astype(np.float32)
+
+            grid = (xs, ys, unit_x, unit_y, np.sin(distance / 20), np.cos(distance / 20))
+            EffectProcessor._distortion_grids[key] = grid
+        return grid
 
     @staticmethod
-    def apply_distortion(image, amount, center_x, center_y, radius, rotation):
-        """Apply wave distortion effect to the image"""
+    def apply_distortion(image, amount, center_x, center_y, radius, rotation, out=None):
+        """Apply wave distortion effect to the image
+
+        The result is written into ``out`` when given (it must match the
+        image size and be 32-bit), otherwise into a new image.
+        """
         if amount <= 0:
             return image
 
-        # Create a new image for the distorted result
-        result = QImage(image.size(), QImage.Format_ARGB32)
-        result.fill(Qt.transparent)
+        if image.depth() != 32:
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
 
-        painter = QPainter(result)
+        width, height = image.width(), image.height()
+        result = out if out is not None else QImage(width, height, image.format())
 
-        # Apply distortion by sampling from original with offset
-        for x in range(0, image.width(), 2):
-            for y in range(0, image.height(), 2):
-                # Calculate displacement based on distance from center
-                dx = x - center_x
-                dy = y - center_y
-                distance = math.sqrt(dx*dx + dy*dy)
+        xs, ys, unit_x, unit_y, wave_sin, wave_cos = EffectProcessor._get_distortion_grid(
+            width, height, center_x, center_y, radius)
 
-                if distance < radius:
-                    # Apply sine wave distortion
-                    angle = math.atan2(dy, dx)
-                    factor = amount * math.sin(distance / 20 + rotation * 10) * 10
+        if NUMBA_AVAILABLE:
+            _distort_kernel(qimage_array(image), qimage_array(result),
+                            unit_x, unit_y, wave_sin, wave_cos, amount, rotation)
+            return result
 
-                    src_x = int(x + math.cos(angle) * factor)
-                    src_y = int(y + math.sin(angle) * factor)
+        # Radial sine-wave displacement, sin(d / 20 + phase) * amount * 10;
+        # the unit vectors confine it to the radius
+        phase = rotation * 10
+        factor = wave_sin * np.float32(math.cos(phase) * amount * 10)
+        factor += wave_cos * np.float32(math.sin(phase) * amount * 10)
 
-                    if 0 <= src_x < image.width() and 0 <= src_y < image.height():
-                        result.setPixelColor(x, y, image.pixelColor(src_x, src_y))
+        src_x = (xs + unit_x * factor).astype(np.int32)
+        src_y = (ys + unit_y * factor).astype(np.int32)
+        np.clip(src_x, 0, width - 1, out=src_x)
+        np.clip(src_y, 0, height - 1, out=src_y)
 
-        painter.end()
+        # Gather whole ARGB pixels from the source into the result
+        qimage_array(result)[:] = qimage_array(image)[src_y, src_x]
         return result
 
 
-
-
 class CircularWaveform:
     """Circular waveform display that surrounds the kaleidoscope"""
     def __init__(self, radius=300, inner_radius_pct=0.8, num_samples=128):
@@ -259,8 +834,8 @@ class CircularWaveform:
         self.inner_radius_pct = inner_radius_pct  # Inner radius as percentage of outer
         self.inner_radius = radius * inner_radius_pct
         self.num_samples = num_samples  # Number of sample points to use
-        self.waveform_data = np.zeros(num_samples)  # Current waveform data
-        self.smoothed_data = np.zeros(num_samples)  # Smoothed data for display
+        self.waveform_data = np.zeros(num_samples, dtype=np.float32)  # Current waveform data
+        self.smoothed_data = np.zeros(num_samples, dtype=np.float32)  # Smoothed data for display
         self.smoothing = 0.3  # Smoothing factor
         self.line_width = 2  # Line width
         self.color = QColor(255, 255, 255, 180)  # Default color with alpha
@@ -289,8 +864,9 @@ class CircularWaveform:
                 spectrum
             )
 
-        # Apply smoothing
-        self.smoothed_data = self.smoothed_data * self.smoothing + self.waveform_data * (1 - self.smoothing)
+        # Apply smoothing in place, keeping the float32 display buffer
+        self.smoothed_data *= self.smoothing
+        self.smoothed_data += self.waveform_data * (1 - self.smoothing)
 
         # Scale based on overall volume and bass
         self.amplitude = 0.5 + (volume * 1.5) + (bass_value * self.bass_influence)
@@ -506,44 +1082,21 @@ class WireframeShape:
                     painter.drawLine(int(start[0]), int(start[1]), int(end[0]), int(end[1]))
 
     def _transform_vertices(self, vertices, current_size, center_x, center_y, perspective=800):
-        """Transform and project vertices with 3D rotation and perspective"""
-        projected_vertices = []
-        for vertex in vertices:
-            # Scale by current size
-            x = vertex[0] * current_size
-            y = vertex[1] * current_size
-            z = vertex[2] * current_size
-
-            # Apply 3D rotations
-            x, y, z = self._rotate_point(x, y, z)
+        """Transform and project vertices with 3D rotation and perspective
 
-            # Apply perspective projection
-            scale = perspective / (perspective + z)
-            px = center_x + x * scale
-            py = center_y + y * scale
+        Returns an (N, 2) array of screen positions. All vertices are
+        rotated with one matrix product, the trig being evaluated once.
+        """
+        points = np.asarray(vertices, dtype=np.float64).reshape(-1, 3) * current_size
+        x, y, z = (points @ self._rotation_matrix()).T
 
-            projected_vertices.append((px, py))
+        # Apply perspective projection
+        scale = perspective / (perspective + z)
+        return np.column_stack((center_x + x * scale, center_y + y * scale))
 
-        return projected_vertices
-
-    def _rotate_point(self, x, y, z):
-        """Apply 3D rotation to a point"""
-        # Rotate around X axis
-        y_rot = y * math.cos(self.rotation_x) - z * math.sin(self.rotation_x)
-        z_rot = y * math.sin(self.rotation_x) + z * math.cos(self.rotation_x)
-        y, z = y_rot, z_rot
-
-        # Rotate around Y axis
-        x_rot = x * math.cos(self.rotation_y) + z * math.sin(self.rotation_y)
-        z_rot = -x * math.sin(self.rotation_y) + z * math.cos(self.rotation_y)
-        x, z = x_rot, z_rot
-
-        # Rotate around Z axis
-        x_rot = x * math.cos(self.rotation_z) - y * math.sin(self.rotation_z)
-        y_rot = x * math.sin(self.rotation_z) + y * math.cos(self.rotation_z)
-        x, y = x_rot, y_rot
-
-        return x, y, z
+    def _rotation_matrix(self):
+        """Rotation about the X, then Y, then Z axis, for row vectors"""
+        return rotation_matrix_3d(self.rotation_x, self.rotation_y, self.rotation_z, order="xyz")
 
     def start_morph(self, target_shape):
         """Begin morphing to another shape"""
@@ -1031,22 +1584,8 @@ class WireframeManager:
             painter.setPen(glow_pen)
 
             # Transform and project vertices
-            projected_vertices = []
-            for vertex in shape.vertices:
-                # Scale by current size
-                x = vertex[0] * shape.size * shape.pulse_size
-                y = vertex[1] * shape.size * shape.pulse_size
-                z = vertex[2] * shape.size * shape.pulse_size
-
-                # Apply 3D rotations
-                x, y, z = shape._rotate_point(x, y, z)
-
-                # Apply perspective projection
-                scale = perspective / (perspective + z)
-                px = center_x + x * scale
-                py = center_y + y * scale
-
-                projected_vertices.append((px, py))
+            projected_vertices = shape._transform_vertices(
+                shape.vertices, shape.size * shape.pulse_size, center_x, center_y, perspective)
 
             # Draw glow edges
             for edge in shape.edges:
@@ -1060,22 +1599,8 @@ class WireframeManager:
     def _render_vertices(self, painter, shape, center_x, center_y, perspective):
         """Render vertices as points"""
         # Transform and project vertices
-        projected_vertices = []
-        for vertex in shape.vertices:
-            # Scale by current size
-            x = vertex[0] * shape.size * shape.pulse_size
-            y = vertex[1] * shape.size * shape.pulse_size
-            z = vertex[2] * shape.size * shape.pulse_size
-
-            # Apply 3D rotations
-            x, y, z = shape._rotate_point(x, y, z)
-
-            # Apply perspective projection
-            scale = perspective / (perspective + z)
-            px = center_x + x * scale
-            py = center_y + y * scale
-
-            projected_vertices.append((px, py))
+        projected_vertices = shape._transform_vertices(
+            shape.vertices, shape.size * shape.pulse_size, center_x, center_y, perspective)
 
         # Use current shape color with alpha
         vertex_color = QColor(shape.base_color)
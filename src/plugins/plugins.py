@@ -1,9 +1,10 @@
 import math
 import random
 import colorsys
+import numbers
 from PyQt5.QtWidgets import (QLabel, QSlider, QComboBox, QPushButton)
 from PyQt5.QtCore import Qt, QRect, QPoint
-from PyQt5.QtGui import QColor, QPainter, QBrush, QPen
+from PyQt5.QtGui import QColor, QPainter, QBrush, QPen, QPolygon
 
 from src.core.visualization_components import EffectProcessor
 
@@ -150,12 +151,14 @@ class TriangleShapePlugin(ShapePlugin):
         """Render a triangle"""
         painter.setBrush(QBrush(color))
         painter.setPen(Qt.NoPen)
-        points = [
-            QPoint(int(x), int(y - size)),
-            QPoint(int(x - size * 0.866), int(y + size * 0.5)),
-            QPoint(int(x + size * 0.866), int(y + size * 0.5))
-        ]
-        painter.drawPolygon(points)
+        # One QPolygon built from flat coordinates instead of three QPoints
+        half_width = size * 0.866
+        bottom = int(y + size * 0.5)
+        painter.drawConvexPolygon(QPolygon([
+            int(x), int(y - size),
+            int(x - half_width), bottom,
+            int(x + half_width), bottom
+        ]))
 
 
 # =============================================================================
@@ -182,17 +185,46 @@ class SpectrumColorPlugin(ColorPlugin):
     """Spectrum-based color plugin"""
     def __init__(self):
         super().__init__("Spectrum")
+        # Hue colors at full value, by spectrum length
+        self._palettes = {}
         self.saturation = 0.8
         self.brightness_boost = 1.0
 
+    @property
+    def saturation(self):
+        return self._saturation
+
+    @saturation.setter
+    def saturation(self, value):
+        # The palettes depend on the saturation, so rebuild them on next use
+        self._saturation = value
+        self._palettes.clear()
+
+    def _spectrum_palette(self, spectrum_length):
+        """RGB of each spectrum hue at full value and the current saturation
+
+        Every HSV channel is the value times a factor of the hue and
+        saturation, so a row scaled by the intensity matches hsv_to_rgb.
+        """
+        palette = self._palettes.get(spectrum_length)
+        if palette is None:
+            palette = [colorsys.hsv_to_rgb(i / spectrum_length, self._saturation, 1.0)
+                       for i in range(spectrum_length)]
+            self._palettes[spectrum_length] = palette
+        return palette
+
     def get_color(self, params):
         """Generate color based on frequency spectrum"""
         freq_index = params.get('freq_index', 0)
         intensity = params.get('intensity', 1.0) * self.brightness_boost
         spectrum_length = params.get('spectrum_length', 100)
 
-        hue = (freq_index / spectrum_length) % 1.0
-        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, self.saturation, intensity)]
+        if isinstance(freq_index, numbers.Integral):
+            rgb = self._spectrum_palette(spectrum_length)[freq_index % spectrum_length]
+            r, g, b = [int(c * intensity * 255) for c in rgb]
+        else:
+            hue = (freq_index / spectrum_length) % 1.0
+            r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, self.saturation, intensity)]
 
         return QColor(r, g, b, params.get('alpha', 255))
 
@@ -8,7 +8,9 @@ Composes control groups from mixin modules:
 - experimental_controls: Dimensional, Liquid Metal, Mycelia, Gravitational Lens
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QTabWidget)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QTabWidget, QSlider,
+                             QComboBox, QSpinBox, QCheckBox)
+from PyQt5.QtCore import pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QColor
 
 from src.ui.visual_controls import VisualControlsMixin
@@ -26,9 +28,26 @@ class ControlPanel(
 ):
     """Control panel with UI settings for the visualization"""
 
+    # Emitted with a control's attribute name whenever its value changes
+    settingsChanged = pyqtSignal(str)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Values last pushed by apply_to_engine, keyed by setting, and the
+        # engine they were pushed to
+        self._last_applied = {}
+        self._applied_engine = None
+
+        # Colors of the color buttons, parsed once per stylesheet
+        self._button_colors = {}
+
+        # Lower-cased item texts of the combo boxes, read once per combo
+        self._combo_texts = {}
+
+        # Value labels of the sliders: slider -> (label, format, divisor)
+        self._value_labels = {}
+
         main_layout = QVBoxLayout()
 
         self.tab_widget = QTabWidget()
@@ -104,8 +123,62 @@ class ControlPanel(
 
         self.setLayout(main_layout)
 
+        self._connect_controls()
+
+    def _connect_controls(self):
+        """Forward every control's change signal to settingsChanged"""
+        self._control_names = {}
+        for name, control in list(vars(self).items()):
+            if name.endswith('_color_btn'):
+                # Color buttons report through _set_button_color
+                self._control_names[control] = name
+                continue
+            if isinstance(control, (QSlider, QSpinBox)):
+                signal = control.valueChanged
+            elif isinstance(control, QComboBox):
+                signal = control.currentIndexChanged
+            elif isinstance(control, QCheckBox):
+                signal = control.stateChanged
+            else:
+                continue
+            self._control_names[control] = name
+            signal.connect(self._on_control_changed)
+
+    def _bind_value_label(self, slider, label, fmt="{}", divisor=None):
+        """Show ``slider``'s value in ``label``, divided by ``divisor`` if given"""
+        self._value_labels[slider] = (label, fmt.format, divisor)
+        slider.valueChanged.connect(self._update_value_label)
+
+    @pyqtSlot(int)
+    def _update_value_label(self, value):
+        """Update the value label of the slider that sent the change"""
+        label, format_value, divisor = self._value_labels[self.sender()]
+        label.setText(format_value(value if divisor is None else value / divisor))
+
+    def _on_control_changed(self, *args):
+        """Emit settingsChanged for the control that sent the change"""
+        self.settingsChanged.emit(self._control_names.get(self.sender(), ""))
+
+    def _set_button_color(self, button, color):
+        """Show a picked color on a color button and report the change"""
+        button.setStyleSheet(f"background-color: {color.name()}")
+        self.settingsChanged.emit(self._control_names.get(button, ""))
+
     def reset_to_defaults(self):
-        """Reset all controls to default values"""
+        """Reset all controls to default values
+
+        settingsChanged is emitted once for the whole reset, not once per
+        control, and also covers the reset color buttons.
+        """
+        self.blockSignals(True)
+        try:
+            self._reset_controls()
+        finally:
+            self.blockSignals(False)
+        self.settingsChanged.emit("")
+
+    def _reset_controls(self):
+        """Set every control to its default value"""
         # General controls
         self.segments_slider.setValue(8)
         self.rotation_slider.setValue(50)
@@ -250,53 +323,101 @@ class ControlPanel(
             self.lens_grid_check.setChecked(True)
 
     def apply_to_engine(self, engine, audio_processor):
-        """Apply all settings to the engine and audio processor"""
+        """Apply all settings to the engine and audio processor
+
+        Only settings whose values changed since the last call are pushed;
+        switching to a different engine pushes everything again.
+        """
         if not engine or not audio_processor:
             return
 
+        if engine is not self._applied_engine:
+            self._applied_engine = engine
+            self._last_applied.clear()
+
         self._apply_general_settings(engine, audio_processor)
         self._apply_wireframe_settings(engine)
         self._apply_waveform_settings(engine)
         self._apply_particle_effects_settings(engine)
         self._apply_experimental_settings(engine)
 
+    def _push(self, key, setter, *args, context=None, **kwargs):
+        """Call setter with the given arguments unless they are unchanged
+
+        ``key`` identifies the setting; ``context`` holds any other state
+        the setter's result depends on, forcing a push when it changes.
+        Colors are stored as copies, since receivers may keep and change
+        the ones they are given.
+        """
+        values = (tuple(QColor(arg) if isinstance(arg, QColor) else arg for arg in args),
+                  {name: QColor(arg) if isinstance(arg, QColor) else arg
+                   for name, arg in kwargs.items()},
+                  context)
+        if self._last_applied.get(key) == values:
+            return
+        setter(*args, **kwargs)
+        self._last_applied[key] = values
+
+    def _button_color(self, button):
+        """Color shown on a color button
+
+        The button's stylesheet holds the color; each distinct stylesheet
+        is parsed once. A copy is returned because receivers may change
+        the color's alpha.
+        """
+        style = button.styleSheet()
+        color = self._button_colors.get(style)
+        if color is None:
+            color = QColor(style.split(":")[1].strip())
+            self._button_colors[style] = color
+        return QColor(color)
+
+    def _combo_text(self, combo):
+        """Lower-cased text of a combo box's current item"""
+        texts = self._combo_texts.get(combo)
+        if texts is None:
+            texts = [combo.itemText(i).lower() for i in range(combo.count())]
+            self._combo_texts[combo] = texts
+        return texts[combo.currentIndex()]
+
     def _apply_general_settings(self, engine, audio_processor):
         """Apply general, visual, 3D, pulse, and audio settings."""
-        engine.set_segments(self.segments_slider.value())
-        engine.set_rotation_speed(self.rotation_slider.value() / 100)
-        engine.set_symmetry_mode(self.symmetry_combo.currentText().lower())
-
-        engine.set_color_mode(self.color_mode_combo.currentText().lower())
-        base_color = QColor()
-        base_color.setNamedColor(self.base_color_btn.styleSheet().split(":")[1].strip())
-        engine.set_base_color(base_color)
-        secondary_color = QColor()
-        secondary_color.setNamedColor(self.secondary_color_btn.styleSheet().split(":")[1].strip())
-        engine.set_secondary_color(secondary_color)
-        engine.set_shape_type(self.shape_combo.currentText().lower())
-        engine.set_blur_amount(self.blur_slider.value())
-        engine.set_distortion(self.distortion_slider.value() / 100)
-        engine.set_particle_settings(
+        self._push('set_segments', engine.set_segments, self.segments_slider.value())
+        self._push('set_rotation_speed', engine.set_rotation_speed, self.rotation_slider.value() / 100)
+        self._push('set_symmetry_mode', engine.set_symmetry_mode, self._combo_text(self.symmetry_combo))
+
+        self._push('set_color_mode', engine.set_color_mode, self._combo_text(self.color_mode_combo))
+        base_color = self._button_color(self.base_color_btn)
+        self._push('set_base_color', engine.set_base_color, base_color)
+        secondary_color = self._button_color(self.secondary_color_btn)
+        self._push('set_secondary_color', engine.set_secondary_color, secondary_color)
+        self._push('set_shape_type', engine.set_shape_type, self._combo_text(self.shape_combo))
+        self._push('set_blur_amount', engine.set_blur_amount, self.blur_slider.value())
+        self._push('set_distortion', engine.set_distortion, self.distortion_slider.value() / 100)
+        self._push(
+            'set_particle_settings', engine.set_particle_settings,
             self.particles_slider.value(),
             self.size_slider.value(),
             self.trail_slider.value()
         )
 
-        engine.set_3d_enabled(self.enable_3d_check.isChecked())
-        engine.set_depth_influence(self.depth_slider.value() / 100)
-        engine.set_perspective(self.perspective_slider.value())
+        self._push('set_3d_enabled', engine.set_3d_enabled, self.enable_3d_check.isChecked())
+        self._push('set_depth_influence', engine.set_depth_influence, self.depth_slider.value() / 100)
+        self._push('set_perspective', engine.set_perspective, self.perspective_slider.value())
 
-        engine.set_pulse_enabled(self.enable_pulse_check.isChecked())
-        engine.set_pulse_parameters(
+        self._push('set_pulse_enabled', engine.set_pulse_enabled, self.enable_pulse_check.isChecked())
+        self._push(
+            'set_pulse_parameters', engine.set_pulse_parameters,
             self.pulse_strength_slider.value() / 100,
             1.0,
             self.pulse_attack_slider.value() / 100,
             self.pulse_decay_slider.value() / 100
         )
 
-        audio_processor.set_sensitivity(self.sensitivity_slider.value() / 100)
-        audio_processor.set_smoothing(self.smoothing_slider.value() / 100)
-        engine.set_audio_influence(
+        self._push('set_sensitivity', audio_processor.set_sensitivity, self.sensitivity_slider.value() / 100)
+        self._push('set_smoothing', audio_processor.set_smoothing, self.smoothing_slider.value() / 100)
+        self._push(
+            'set_audio_influence', engine.set_audio_influence,
             self.bass_slider.value() / 100,
             self.mids_slider.value() / 100,
             self.highs_slider.value() / 100
@@ -308,28 +429,30 @@ class ControlPanel(
             if not hasattr(self, 'enable_wireframe_check'):
                 return
 
-            engine.set_wireframe_enabled(self.enable_wireframe_check.isChecked())
+            self._push('set_wireframe_enabled', engine.set_wireframe_enabled, self.enable_wireframe_check.isChecked())
 
             if hasattr(self, 'wireframe_edges_check'):
-                engine.set_wireframe_edges_visible(self.wireframe_edges_check.isChecked())
+                self._push('set_wireframe_edges_visible', engine.set_wireframe_edges_visible, self.wireframe_edges_check.isChecked())
 
-            shape_type = self.wireframe_shape_combo.currentText().lower().strip()
+            shape_type = self._combo_text(self.wireframe_shape_combo).strip()
             morph_enabled = self.wireframe_morph_check.isChecked()
-            engine.set_wireframe_shape(shape_type, morph_enabled)
+            self._push('set_wireframe_shape', engine.set_wireframe_shape, shape_type, morph_enabled)
 
-            engine.set_wireframe_size(self.wireframe_size_slider.value())
-            engine.set_wireframe_rotation(self.wireframe_rotation_slider.value() / 100.0)
+            # Resizing the engine resets the wireframe size, so the engine
+            # size is part of what has to match
+            self._push('set_wireframe_size', engine.set_wireframe_size, self.wireframe_size_slider.value(),
+                       context=(engine.width, engine.height))
+            self._push('set_wireframe_rotation', engine.set_wireframe_rotation, self.wireframe_rotation_slider.value() / 100.0)
 
-            color_mode = self.wireframe_color_combo.currentText().lower().replace(" ", "_")
-            engine.set_wireframe_color_mode(color_mode)
+            color_mode = self._combo_text(self.wireframe_color_combo).replace(" ", "_")
+            self._push('set_wireframe_color_mode', engine.set_wireframe_color_mode, color_mode)
 
-            primary_color = QColor()
-            primary_color.setNamedColor(self.wireframe_color_btn.styleSheet().split(":")[1].strip())
-            secondary_color = QColor()
-            secondary_color.setNamedColor(self.wireframe_secondary_color_btn.styleSheet().split(":")[1].strip())
-            engine.set_wireframe_colors(primary_color, secondary_color)
+            primary_color = self._button_color(self.wireframe_color_btn)
+            secondary_color = self._button_color(self.wireframe_secondary_color_btn)
+            self._push('set_wireframe_colors', engine.set_wireframe_colors, primary_color, secondary_color)
 
-            engine.set_wireframe_effects(
+            self._push(
+                'set_wireframe_effects', engine.set_wireframe_effects,
                 self.wireframe_vertices_check.isChecked(),
                 self.wireframe_vertex_slider.value(),
                 self.wireframe_glow_check.isChecked(),
@@ -337,17 +460,20 @@ class ControlPanel(
             )
 
             if hasattr(self, 'wireframe_multi_check'):
-                engine.set_wireframe_multi_shape(
+                self._push(
+                    'set_wireframe_multi_shape', engine.set_wireframe_multi_shape,
                     self.wireframe_multi_check.isChecked(),
                     self.wireframe_count_slider.value()
                 )
-                engine.set_wireframe_echo(
+                self._push(
+                    'set_wireframe_echo', engine.set_wireframe_echo,
                     self.wireframe_echo_check.isChecked(),
                     self.wireframe_echo_count_slider.value(),
                     self.wireframe_echo_opacity_slider.value() / 100.0,
                     0.2
                 )
-                engine.set_wireframe_beat_response(
+                self._push(
+                    'set_wireframe_beat_response', engine.set_wireframe_beat_response,
                     self.wireframe_auto_morph_check.isChecked(),
                     self.wireframe_beat_morph_check.isChecked()
                 )
@@ -360,22 +486,24 @@ class ControlPanel(
             if not hasattr(self, 'enable_waveform_check'):
                 return
 
-            engine.set_waveform_enabled(self.enable_waveform_check.isChecked())
-            engine.set_waveform_parameters(
+            self._push('set_waveform_enabled', engine.set_waveform_enabled, self.enable_waveform_check.isChecked())
+            # The waveform radius is derived from the engine size
+            self._push(
+                'set_waveform_parameters', engine.set_waveform_parameters,
                 self.waveform_radius_slider.value(),
                 self.waveform_width_slider.value(),
                 self.waveform_rotation_slider.value() / 1000.0,
-                self.waveform_amplitude_slider.value() / 100.0
+                self.waveform_amplitude_slider.value() / 100.0,
+                context=(engine.width, engine.height)
             )
 
-            primary_color = QColor()
-            primary_color.setNamedColor(self.waveform_color_btn.styleSheet().split(":")[1].strip())
-            secondary_color = QColor()
-            secondary_color.setNamedColor(self.waveform_secondary_color_btn.styleSheet().split(":")[1].strip())
+            primary_color = self._button_color(self.waveform_color_btn)
+            secondary_color = self._button_color(self.waveform_secondary_color_btn)
             use_gradient = self.waveform_color_combo.currentText() == "Gradient"
-            engine.set_waveform_colors(primary_color, secondary_color, use_gradient)
+            self._push('set_waveform_colors', engine.set_waveform_colors, primary_color, secondary_color, use_gradient)
 
-            engine.set_waveform_reflection(
+            self._push(
+                'set_waveform_reflection', engine.set_waveform_reflection,
                 self.waveform_reflection_check.isChecked(),
                 self.waveform_reflection_slider.value()
             )
@@ -388,32 +516,35 @@ class ControlPanel(
             if not hasattr(self, 'enable_effects_check'):
                 return
 
-            engine.set_effects_enabled(self.enable_effects_check.isChecked())
-            engine.set_effects_intensity(self.effects_intensity_slider.value() / 100.0)
-            engine.set_effects_beat_response(
+            self._push('set_effects_enabled', engine.set_effects_enabled, self.enable_effects_check.isChecked())
+            self._push('set_effects_intensity', engine.set_effects_intensity, self.effects_intensity_slider.value() / 100.0)
+            self._push(
+                'set_effects_beat_response', engine.set_effects_beat_response,
                 self.effects_beat_check.isChecked(),
                 self.effects_beat_threshold_slider.value() / 100.0
             )
-            engine.set_effects_random_generation(
+            self._push(
+                'set_effects_random_generation', engine.set_effects_random_generation,
                 self.effects_random_check.isChecked(),
                 self.effects_random_slider.value() / 1000.0
             )
 
             if hasattr(self, 'effect_spark_check'):
-                engine.set_effect_type_enabled("spark", self.effect_spark_check.isChecked())
-                engine.set_effect_type_enabled("flare", self.effect_flare_check.isChecked())
-                engine.set_effect_type_enabled("firework", self.effect_firework_check.isChecked())
-                engine.set_effect_type_enabled("mist", self.effect_mist_check.isChecked())
+                self._push('spark.set_effect_type_enabled', engine.set_effect_type_enabled, "spark", self.effect_spark_check.isChecked())
+                self._push('flare.set_effect_type_enabled', engine.set_effect_type_enabled, "flare", self.effect_flare_check.isChecked())
+                self._push('firework.set_effect_type_enabled', engine.set_effect_type_enabled, "firework", self.effect_firework_check.isChecked())
+                self._push('mist.set_effect_type_enabled', engine.set_effect_type_enabled, "mist", self.effect_mist_check.isChecked())
                 weights = {
                     "spark": self.effect_spark_weight_slider.value(),
                     "flare": self.effect_flare_weight_slider.value(),
                     "firework": self.effect_firework_weight_slider.value(),
                     "mist": self.effect_mist_weight_slider.value()
                 }
-                engine.set_effects_weights(weights)
+                self._push('set_effects_weights', engine.set_effects_weights, weights)
 
             if hasattr(self, 'effects_bass_slider'):
-                engine.set_effects_audio_reactivity(
+                self._push(
+                    'set_effects_audio_reactivity', engine.set_effects_audio_reactivity,
                     self.effects_bass_slider.value() / 100.0,
                     self.effects_mids_slider.value() / 100.0,
                     self.effects_highs_slider.value() / 100.0,
@@ -421,12 +552,14 @@ class ControlPanel(
                 )
 
             if hasattr(self, 'tunnel_enable_check'):
-                engine.set_tunnel_enabled(self.tunnel_enable_check.isChecked())
-                engine.set_tunnel_auto_change(
+                self._push('set_tunnel_enabled', engine.set_tunnel_enabled, self.tunnel_enable_check.isChecked())
+                self._push(
+                    'set_tunnel_auto_change', engine.set_tunnel_auto_change,
                     self.tunnel_auto_change_check.isChecked(),
                     self.tunnel_interval_slider.value()
                 )
-                engine.set_tunnel_direction(self.tunnel_direction_combo.currentText().lower())
+                # Only takes effect on a running tunnel, so always pushed
+                engine.set_tunnel_direction(self._combo_text(self.tunnel_direction_combo))
 
         except Exception as e:
             print(f"Error applying particle effects settings: {e}")
@@ -442,33 +575,33 @@ class ControlPanel(
             exp = engine.experimental_effects
 
             # Dimensional Portal
-            exp.set_effect_enabled('dimensional_portal', self.dimensional_enable_check.isChecked())
-            exp.set_effect_intensity('dimensional_portal', self.dimensional_intensity_slider.value() / 100.0)
+            self._push('dimensional_portal.set_effect_enabled', exp.set_effect_enabled, 'dimensional_portal', self.dimensional_enable_check.isChecked())
+            self._push('dimensional_portal.set_effect_intensity', exp.set_effect_intensity, 'dimensional_portal', self.dimensional_intensity_slider.value() / 100.0)
 
             # Liquid Metal
-            exp.set_effect_enabled('liquid_metal', self.liquid_metal_enable_check.isChecked())
-            exp.set_effect_intensity('liquid_metal', self.liquid_metal_intensity_slider.value() / 100.0)
+            self._push('liquid_metal.set_effect_enabled', exp.set_effect_enabled, 'liquid_metal', self.liquid_metal_enable_check.isChecked())
+            self._push('liquid_metal.set_effect_intensity', exp.set_effect_intensity, 'liquid_metal', self.liquid_metal_intensity_slider.value() / 100.0)
 
             # Audio Mycelia
-            exp.set_effect_enabled('audio_mycelia', self.mycelia_enable_check.isChecked())
-            exp.set_effect_intensity('audio_mycelia', self.mycelia_intensity_slider.value() / 100.0)
+            self._push('audio_mycelia.set_effect_enabled', exp.set_effect_enabled, 'audio_mycelia', self.mycelia_enable_check.isChecked())
+            self._push('audio_mycelia.set_effect_intensity', exp.set_effect_intensity, 'audio_mycelia', self.mycelia_intensity_slider.value() / 100.0)
 
             if hasattr(exp.effects['audio_mycelia'], 'set_growth_rate'):
-                exp.effects['audio_mycelia'].set_growth_rate(self.mycelia_growth_slider.value() / 100.0)
+                self._push('audio_mycelia.set_growth_rate', exp.effects['audio_mycelia'].set_growth_rate, self.mycelia_growth_slider.value() / 100.0)
 
             # Gravitational Lens
-            exp.set_effect_enabled('gravitational_lens', self.lens_enable_check.isChecked())
-            exp.set_effect_intensity('gravitational_lens', self.lens_intensity_slider.value() / 100.0)
+            self._push('gravitational_lens.set_effect_enabled', exp.set_effect_enabled, 'gravitational_lens', self.lens_enable_check.isChecked())
+            self._push('gravitational_lens.set_effect_intensity', exp.set_effect_intensity, 'gravitational_lens', self.lens_intensity_slider.value() / 100.0)
 
             if hasattr(exp.effects['gravitational_lens'], 'set_distortion_strength'):
-                exp.effects['gravitational_lens'].set_distortion_strength(self.lens_distortion_slider.value() / 100.0)
+                self._push('gravitational_lens.set_distortion_strength', exp.effects['gravitational_lens'].set_distortion_strength, self.lens_distortion_slider.value() / 100.0)
 
             if hasattr(exp.effects['gravitational_lens'], 'set_grid_visible'):
-                exp.effects['gravitational_lens'].set_grid_visible(self.lens_grid_check.isChecked())
+                self._push('gravitational_lens.set_grid_visible', exp.effects['gravitational_lens'].set_grid_visible, self.lens_grid_check.isChecked())
 
             # Global opacity
             if hasattr(self, 'experimental_opacity_slider'):
-                exp.set_global_opacity(self.experimental_opacity_slider.value() / 100.0)
+                self._push('set_global_opacity', exp.set_global_opacity, self.experimental_opacity_slider.value() / 100.0)
 
             # Dimensional Portal colors
             if hasattr(self, 'dimensional_inner_color_btn'):
@@ -493,21 +626,19 @@ class ControlPanel(
 
     def _apply_dimensional_colors(self, exp):
         """Apply dimensional portal color settings."""
-        inner_color = QColor()
-        inner_color.setNamedColor(self.dimensional_inner_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['dimensional_portal'].set_inner_color(inner_color)
+        inner_color = self._button_color(self.dimensional_inner_color_btn)
+        self._push('dimensional_portal.set_inner_color', exp.effects['dimensional_portal'].set_inner_color, inner_color)
 
-        outer_color = QColor()
-        outer_color.setNamedColor(self.dimensional_outer_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['dimensional_portal'].set_outer_color(outer_color)
+        outer_color = self._button_color(self.dimensional_outer_color_btn)
+        self._push('dimensional_portal.set_outer_color', exp.effects['dimensional_portal'].set_outer_color, outer_color)
 
-        glow_color = QColor()
-        glow_color.setNamedColor(self.dimensional_glow_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['dimensional_portal'].set_glow_color(glow_color)
+        glow_color = self._button_color(self.dimensional_glow_color_btn)
+        self._push('dimensional_portal.set_glow_color', exp.effects['dimensional_portal'].set_glow_color, glow_color)
 
         if hasattr(self, 'dimensional_reactive_inner_check') and \
            hasattr(exp.effects['dimensional_portal'], 'enable_color_reactivity'):
-            exp.effects['dimensional_portal'].enable_color_reactivity(
+            self._push(
+                'dimensional_portal.enable_color_reactivity', exp.effects['dimensional_portal'].enable_color_reactivity,
                 enable_inner=self.dimensional_reactive_inner_check.isChecked(),
                 enable_outer=self.dimensional_reactive_outer_check.isChecked(),
                 enable_glow=self.dimensional_reactive_glow_check.isChecked()
@@ -515,54 +646,46 @@ class ControlPanel(
 
     def _apply_liquid_metal_colors(self, exp):
         """Apply liquid metal color settings."""
-        metal_color = QColor()
-        metal_color.setNamedColor(self.liquid_metal_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['liquid_metal'].set_metal_color(metal_color)
+        metal_color = self._button_color(self.liquid_metal_color_btn)
+        self._push('liquid_metal.set_metal_color', exp.effects['liquid_metal'].set_metal_color, metal_color)
 
-        highlight_color = QColor()
-        highlight_color.setNamedColor(self.liquid_highlight_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['liquid_metal'].set_highlight_color(highlight_color)
+        highlight_color = self._button_color(self.liquid_highlight_color_btn)
+        self._push('liquid_metal.set_highlight_color', exp.effects['liquid_metal'].set_highlight_color, highlight_color)
 
-        shadow_color = QColor()
-        shadow_color.setNamedColor(self.liquid_shadow_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['liquid_metal'].set_shadow_color(shadow_color)
+        shadow_color = self._button_color(self.liquid_shadow_color_btn)
+        self._push('liquid_metal.set_shadow_color', exp.effects['liquid_metal'].set_shadow_color, shadow_color)
 
     def _apply_mycelia_colors(self, exp):
         """Apply audio mycelia color settings."""
-        base_color = QColor()
-        base_color.setNamedColor(self.mycelia_base_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['audio_mycelia'].set_base_color(base_color)
+        base_color = self._button_color(self.mycelia_base_color_btn)
+        self._push('audio_mycelia.set_base_color', exp.effects['audio_mycelia'].set_base_color, base_color)
 
-        tip_color = QColor()
-        tip_color.setNamedColor(self.mycelia_tip_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['audio_mycelia'].set_tip_color(tip_color)
+        tip_color = self._button_color(self.mycelia_tip_color_btn)
+        self._push('audio_mycelia.set_tip_color', exp.effects['audio_mycelia'].set_tip_color, tip_color)
 
-        bg_color = QColor()
-        bg_color.setNamedColor(self.mycelia_bg_color_btn.styleSheet().split(":")[1].strip())
+        bg_color = self._button_color(self.mycelia_bg_color_btn)
         alpha = self.mycelia_bg_opacity_slider.value()
-        exp.effects['audio_mycelia'].set_bg_color(bg_color, alpha)
+        self._push('audio_mycelia.set_bg_color', exp.effects['audio_mycelia'].set_bg_color, bg_color, alpha)
 
         if hasattr(exp.effects['audio_mycelia'], 'set_growth_rate'):
-            exp.effects['audio_mycelia'].set_growth_rate(self.mycelia_growth_slider.value() / 100.0)
+            self._push('audio_mycelia.set_growth_rate', exp.effects['audio_mycelia'].set_growth_rate, self.mycelia_growth_slider.value() / 100.0)
 
     def _apply_lens_colors(self, exp):
         """Apply gravitational lens color settings."""
-        grid_color = QColor()
-        grid_color.setNamedColor(self.lens_grid_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['gravitational_lens'].set_grid_color(grid_color, 100)
+        grid_color = self._button_color(self.lens_grid_color_btn)
+        self._push('gravitational_lens.set_grid_color', exp.effects['gravitational_lens'].set_grid_color, grid_color, 100)
 
-        lens_color = QColor()
-        lens_color.setNamedColor(self.lens_center_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['gravitational_lens'].set_lens_color(lens_color)
+        lens_color = self._button_color(self.lens_center_color_btn)
+        self._push('gravitational_lens.set_lens_color', exp.effects['gravitational_lens'].set_lens_color, lens_color)
 
-        edge_color = QColor()
-        edge_color.setNamedColor(self.lens_edge_color_btn.styleSheet().split(":")[1].strip())
-        exp.effects['gravitational_lens'].set_edge_color(edge_color)
+        edge_color = self._button_color(self.lens_edge_color_btn)
+        self._push('gravitational_lens.set_edge_color', exp.effects['gravitational_lens'].set_edge_color, edge_color)
 
         if hasattr(exp.effects['gravitational_lens'], 'set_distortion_strength'):
-            exp.effects['gravitational_lens'].set_distortion_strength(
+            self._push(
+                'gravitational_lens.set_distortion_strength', exp.effects['gravitational_lens'].set_distortion_strength,
                 self.lens_distortion_slider.value() / 100.0
             )
 
         if hasattr(exp.effects['gravitational_lens'], 'set_grid_visible'):
-            exp.effects['gravitational_lens'].set_grid_visible(self.lens_grid_check.isChecked())
+            self._push('gravitational_lens.set_grid_visible', exp.effects['gravitational_lens'].set_grid_visible, self.lens_grid_check.isChecked())
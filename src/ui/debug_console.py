@@ -1,6 +1,8 @@
+from collections import deque
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTextEdit, QPushButton)
-from PyQt5.QtCore import Qt, QTime
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTime, QTimer
+from PyQt5.QtGui import QFont, QTextCursor
 
 
 
@@ -18,8 +20,18 @@ class DebugConsole(QWidget):
         self.console = QTextEdit()
         self.console.setReadOnly(True)
         self.console.setFont(QFont("Courier New", 10))
+        # Keep only the most recent lines so the document stays cheap to lay out
+        self.console.document().setMaximumBlockCount(500)
         layout.addWidget(self.console)
 
+        # Messages are collected and appended in batches, and held back
+        # while the console is hidden
+        self._log_buffer = deque(maxlen=500)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(200)
+        self._flush_timer.timeout.connect(self.flush)
+
         # Clear button
         clear_btn = QPushButton("Clear Console")
         clear_btn.clicked.connect(self.clear_console)
@@ -28,10 +40,35 @@ class DebugConsole(QWidget):
         self.setLayout(layout)
 
     def log(self, message):
-        """Add a message to the console"""
-        self.console.append(f"[{QTime.currentTime().toString('hh:mm:ss.zzz')}] {message}")
+        """Add a message to the console
+
+        The message is timestamped now and shown with the next batch, at
+        most 200 ms later, or when the console is next shown.
+        """
+        self._log_buffer.append(f"[{QTime.currentTime().toString('hh:mm:ss.zzz')}] {message}")
+        if self.isVisible() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Append all pending messages to the console in one edit"""
+        if not self._log_buffer:
+            return
+
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        if not self.console.document().isEmpty():
+            text = "\n" + text
+
+        self.console.moveCursor(QTextCursor.End)
+        self.console.insertPlainText(text)
+
+    def showEvent(self, event):
+        """Show the messages logged while the console was hidden"""
+        super().showEvent(event)
+        self.flush()
 
     def clear_console(self):
         """Clear the console"""
+        self._log_buffer.clear()
         self.console.clear()
 
@@ -31,8 +31,7 @@ class EffectControlsMixin:
         layout.addWidget(self.waveform_radius_slider, 1, 1)
         self.waveform_radius_value = QLabel("80%")
         layout.addWidget(self.waveform_radius_value, 1, 2)
-        self.waveform_radius_slider.valueChanged.connect(
-            lambda v: self.waveform_radius_value.setText(f"{v}%"))
+        self._bind_value_label(self.waveform_radius_slider, self.waveform_radius_value, "{}%")
 
         layout.addWidget(QLabel("Line Width:"), 2, 0)
         self.waveform_width_slider = QSlider(Qt.Horizontal)
@@ -41,8 +40,7 @@ class EffectControlsMixin:
         layout.addWidget(self.waveform_width_slider, 2, 1)
         self.waveform_width_value = QLabel("2")
         layout.addWidget(self.waveform_width_value, 2, 2)
-        self.waveform_width_slider.valueChanged.connect(
-            lambda v: self.waveform_width_value.setText(str(v)))
+        self._bind_value_label(self.waveform_width_slider, self.waveform_width_value)
 
         layout.addWidget(QLabel("Rotation:"), 3, 0)
         self.waveform_rotation_slider = QSlider(Qt.Horizontal)
@@ -51,8 +49,7 @@ class EffectControlsMixin:
         layout.addWidget(self.waveform_rotation_slider, 3, 1)
         self.waveform_rotation_value = QLabel("0.01")
         layout.addWidget(self.waveform_rotation_value, 3, 2)
-        self.waveform_rotation_slider.valueChanged.connect(
-            lambda v: self.waveform_rotation_value.setText(f"{v/1000:.3f}"))
+        self._bind_value_label(self.waveform_rotation_slider, self.waveform_rotation_value, "{:.3f}", divisor=1000)
 
         layout.addWidget(QLabel("Amplitude:"), 4, 0)
         self.waveform_amplitude_slider = QSlider(Qt.Horizontal)
@@ -61,8 +58,7 @@ class EffectControlsMixin:
         layout.addWidget(self.waveform_amplitude_slider, 4, 1)
         self.waveform_amplitude_value = QLabel("1.0")
         layout.addWidget(self.waveform_amplitude_value, 4, 2)
-        self.waveform_amplitude_slider.valueChanged.connect(
-            lambda v: self.waveform_amplitude_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.waveform_amplitude_slider, self.waveform_amplitude_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Color Mode:"), 5, 0)
         self.waveform_color_combo = QComboBox()
@@ -93,8 +89,7 @@ class EffectControlsMixin:
         layout.addWidget(self.waveform_reflection_slider, 9, 1)
         self.waveform_reflection_value = QLabel("30%")
         layout.addWidget(self.waveform_reflection_value, 9, 2)
-        self.waveform_reflection_slider.valueChanged.connect(
-            lambda v: self.waveform_reflection_value.setText(f"{v}%"))
+        self._bind_value_label(self.waveform_reflection_slider, self.waveform_reflection_value, "{}%")
 
         group.setLayout(layout)
         return group
@@ -103,13 +98,13 @@ class EffectControlsMixin:
         """Open color dialog for waveform primary color selection"""
         color = QColorDialog.getColor(QColor(255, 255, 255), self, "Select Waveform Color")
         if color.isValid():
-            self.waveform_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.waveform_color_btn, color)
 
     def _select_waveform_secondary_color(self):
         """Open color dialog for waveform secondary color selection"""
         color = QColorDialog.getColor(QColor(0, 200, 255), self, "Select Waveform Secondary Color")
         if color.isValid():
-            self.waveform_secondary_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.waveform_secondary_color_btn, color)
 
     def _create_particle_effects_controls(self):
         """Create controls for particle effects"""
@@ -128,8 +123,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_intensity_slider, 1, 1)
         self.effects_intensity_value = QLabel("1.0")
         layout.addWidget(self.effects_intensity_value, 1, 2)
-        self.effects_intensity_slider.valueChanged.connect(
-            lambda v: self.effects_intensity_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.effects_intensity_slider, self.effects_intensity_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("On Beat:"), 2, 0)
         self.effects_beat_check = QCheckBox()
@@ -143,8 +137,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_beat_threshold_slider, 3, 1)
         self.effects_beat_threshold_value = QLabel("0.5")
         layout.addWidget(self.effects_beat_threshold_value, 3, 2)
-        self.effects_beat_threshold_slider.valueChanged.connect(
-            lambda v: self.effects_beat_threshold_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.effects_beat_threshold_slider, self.effects_beat_threshold_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Random Effects:"), 4, 0)
         self.effects_random_check = QCheckBox()
@@ -158,8 +151,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_random_slider, 5, 1)
         self.effects_random_value = QLabel("0.01")
         layout.addWidget(self.effects_random_value, 5, 2)
-        self.effects_random_slider.valueChanged.connect(
-            lambda v: self.effects_random_value.setText(f"{v/1000:.3f}"))
+        self._bind_value_label(self.effects_random_slider, self.effects_random_value, "{:.3f}", divisor=1000)
 
         group.setLayout(layout)
         return group
@@ -180,8 +172,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effect_spark_weight_slider, 0, 2)
         self.effect_spark_weight_value = QLabel("40")
         layout.addWidget(self.effect_spark_weight_value, 0, 3)
-        self.effect_spark_weight_slider.valueChanged.connect(
-            lambda v: self.effect_spark_weight_value.setText(str(v)))
+        self._bind_value_label(self.effect_spark_weight_slider, self.effect_spark_weight_value)
 
         # Flares
         layout.addWidget(QLabel("Flares:"), 1, 0)
@@ -194,8 +185,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effect_flare_weight_slider, 1, 2)
         self.effect_flare_weight_value = QLabel("30")
         layout.addWidget(self.effect_flare_weight_value, 1, 3)
-        self.effect_flare_weight_slider.valueChanged.connect(
-            lambda v: self.effect_flare_weight_value.setText(str(v)))
+        self._bind_value_label(self.effect_flare_weight_slider, self.effect_flare_weight_value)
 
         # Fireworks
         layout.addWidget(QLabel("Fireworks:"), 2, 0)
@@ -208,8 +198,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effect_firework_weight_slider, 2, 2)
         self.effect_firework_weight_value = QLabel("15")
         layout.addWidget(self.effect_firework_weight_value, 2, 3)
-        self.effect_firework_weight_slider.valueChanged.connect(
-            lambda v: self.effect_firework_weight_value.setText(str(v)))
+        self._bind_value_label(self.effect_firework_weight_slider, self.effect_firework_weight_value)
 
         # Mist
         layout.addWidget(QLabel("Mist:"), 3, 0)
@@ -222,8 +211,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effect_mist_weight_slider, 3, 2)
         self.effect_mist_weight_value = QLabel("15")
         layout.addWidget(self.effect_mist_weight_value, 3, 3)
-        self.effect_mist_weight_slider.valueChanged.connect(
-            lambda v: self.effect_mist_weight_value.setText(str(v)))
+        self._bind_value_label(self.effect_mist_weight_slider, self.effect_mist_weight_value)
 
         group.setLayout(layout)
         return group
@@ -240,8 +228,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_bass_slider, 0, 1)
         self.effects_bass_value = QLabel("1.0")
         layout.addWidget(self.effects_bass_value, 0, 2)
-        self.effects_bass_slider.valueChanged.connect(
-            lambda v: self.effects_bass_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.effects_bass_slider, self.effects_bass_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Mids:"), 1, 0)
         self.effects_mids_slider = QSlider(Qt.Horizontal)
@@ -250,8 +237,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_mids_slider, 1, 1)
         self.effects_mids_value = QLabel("0.7")
         layout.addWidget(self.effects_mids_value, 1, 2)
-        self.effects_mids_slider.valueChanged.connect(
-            lambda v: self.effects_mids_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.effects_mids_slider, self.effects_mids_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Highs:"), 2, 0)
         self.effects_highs_slider = QSlider(Qt.Horizontal)
@@ -260,8 +246,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_highs_slider, 2, 1)
         self.effects_highs_value = QLabel("0.5")
         layout.addWidget(self.effects_highs_value, 2, 2)
-        self.effects_highs_slider.valueChanged.connect(
-            lambda v: self.effects_highs_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.effects_highs_slider, self.effects_highs_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Volume:"), 3, 0)
         self.effects_volume_slider = QSlider(Qt.Horizontal)
@@ -270,8 +255,7 @@ class EffectControlsMixin:
         layout.addWidget(self.effects_volume_slider, 3, 1)
         self.effects_volume_value = QLabel("0.8")
         layout.addWidget(self.effects_volume_value, 3, 2)
-        self.effects_volume_slider.valueChanged.connect(
-            lambda v: self.effects_volume_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.effects_volume_slider, self.effects_volume_value, "{:.1f}", divisor=100)
 
         group.setLayout(layout)
         return group
@@ -298,8 +282,7 @@ class EffectControlsMixin:
         layout.addWidget(self.tunnel_interval_slider, 2, 1)
         self.tunnel_interval_value = QLabel("10s")
         layout.addWidget(self.tunnel_interval_value, 2, 2)
-        self.tunnel_interval_slider.valueChanged.connect(
-            lambda v: self.tunnel_interval_value.setText(f"{v/60:.1f}s"))
+        self._bind_value_label(self.tunnel_interval_slider, self.tunnel_interval_value, "{:.1f}s", divisor=60)
 
         layout.addWidget(QLabel("Flow Direction:"), 3, 0)
         self.tunnel_direction_combo = QComboBox()
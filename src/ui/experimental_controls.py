@@ -39,8 +39,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.dimensional_intensity_slider, 1, 1)
         self.dimensional_intensity_value = QLabel("0.8")
         layout.addWidget(self.dimensional_intensity_value, 1, 2)
-        self.dimensional_intensity_slider.valueChanged.connect(
-            lambda v: self.dimensional_intensity_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.dimensional_intensity_slider, self.dimensional_intensity_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Inner Color:"), 2, 0)
         self.dimensional_inner_color_btn = QPushButton()
@@ -76,17 +75,17 @@ class ExperimentalControlsMixin:
     def _select_dimensional_inner_color(self):
         color = QColorDialog.getColor(QColor(20, 0, 40), self, "Select Inner Color")
         if color.isValid():
-            self.dimensional_inner_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.dimensional_inner_color_btn, color)
 
     def _select_dimensional_outer_color(self):
         color = QColorDialog.getColor(QColor(100, 0, 255), self, "Select Outer Color")
         if color.isValid():
-            self.dimensional_outer_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.dimensional_outer_color_btn, color)
 
     def _select_dimensional_glow_color(self):
         color = QColorDialog.getColor(QColor(180, 120, 255), self, "Select Glow Color")
         if color.isValid():
-            self.dimensional_glow_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.dimensional_glow_color_btn, color)
 
     def _create_liquid_metal_controls(self):
         """Create controls for liquid metal effect"""
@@ -105,8 +104,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.liquid_metal_intensity_slider, 1, 1)
         self.liquid_metal_intensity_value = QLabel("0.8")
         layout.addWidget(self.liquid_metal_intensity_value, 1, 2)
-        self.liquid_metal_intensity_slider.valueChanged.connect(
-            lambda v: self.liquid_metal_intensity_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.liquid_metal_intensity_slider, self.liquid_metal_intensity_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Metal Color:"), 2, 0)
         self.liquid_metal_color_btn = QPushButton()
@@ -132,17 +130,17 @@ class ExperimentalControlsMixin:
     def _select_liquid_metal_color(self):
         color = QColorDialog.getColor(QColor(200, 200, 220), self, "Select Metal Color")
         if color.isValid():
-            self.liquid_metal_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.liquid_metal_color_btn, color)
 
     def _select_liquid_highlight_color(self):
         color = QColorDialog.getColor(QColor(255, 255, 255), self, "Select Highlight Color")
         if color.isValid():
-            self.liquid_highlight_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.liquid_highlight_color_btn, color)
 
     def _select_liquid_shadow_color(self):
         color = QColorDialog.getColor(QColor(70, 70, 100), self, "Select Shadow Color")
         if color.isValid():
-            self.liquid_shadow_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.liquid_shadow_color_btn, color)
 
     def _create_mycelia_controls(self):
         """Create controls for audio mycelia effect"""
@@ -161,8 +159,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.mycelia_intensity_slider, 1, 1)
         self.mycelia_intensity_value = QLabel("0.8")
         layout.addWidget(self.mycelia_intensity_value, 1, 2)
-        self.mycelia_intensity_slider.valueChanged.connect(
-            lambda v: self.mycelia_intensity_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.mycelia_intensity_slider, self.mycelia_intensity_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Growth Rate:"), 2, 0)
         self.mycelia_growth_slider = QSlider(Qt.Horizontal)
@@ -171,8 +168,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.mycelia_growth_slider, 2, 1)
         self.mycelia_growth_value = QLabel("1.5")
         layout.addWidget(self.mycelia_growth_value, 2, 2)
-        self.mycelia_growth_slider.valueChanged.connect(
-            lambda v: self.mycelia_growth_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.mycelia_growth_slider, self.mycelia_growth_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Base Color:"), 3, 0)
         self.mycelia_base_color_btn = QPushButton()
@@ -199,8 +195,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.mycelia_bg_opacity_slider, 6, 1)
         self.mycelia_bg_opacity_value = QLabel("100")
         layout.addWidget(self.mycelia_bg_opacity_value, 6, 2)
-        self.mycelia_bg_opacity_slider.valueChanged.connect(
-            lambda v: self.mycelia_bg_opacity_value.setText(str(v)))
+        self._bind_value_label(self.mycelia_bg_opacity_slider, self.mycelia_bg_opacity_value)
 
         group.setLayout(layout)
         return group
@@ -208,17 +203,17 @@ class ExperimentalControlsMixin:
     def _select_mycelia_base_color(self):
         color = QColorDialog.getColor(QColor(80, 220, 120), self, "Select Base Color")
         if color.isValid():
-            self.mycelia_base_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.mycelia_base_color_btn, color)
 
     def _select_mycelia_tip_color(self):
         color = QColorDialog.getColor(QColor(220, 255, 200), self, "Select Tip Color")
         if color.isValid():
-            self.mycelia_tip_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.mycelia_tip_color_btn, color)
 
     def _select_mycelia_bg_color(self):
         color = QColorDialog.getColor(QColor(10, 20, 10), self, "Select Background Color")
         if color.isValid():
-            self.mycelia_bg_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.mycelia_bg_color_btn, color)
 
     def _create_gravitational_lens_controls(self):
         """Create controls for gravitational lens effect"""
@@ -237,8 +232,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.lens_intensity_slider, 1, 1)
         self.lens_intensity_value = QLabel("0.8")
         layout.addWidget(self.lens_intensity_value, 1, 2)
-        self.lens_intensity_slider.valueChanged.connect(
-            lambda v: self.lens_intensity_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.lens_intensity_slider, self.lens_intensity_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Distortion:"), 2, 0)
         self.lens_distortion_slider = QSlider(Qt.Horizontal)
@@ -247,8 +241,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.lens_distortion_slider, 2, 1)
         self.lens_distortion_value = QLabel("1.0")
         layout.addWidget(self.lens_distortion_value, 2, 2)
-        self.lens_distortion_slider.valueChanged.connect(
-            lambda v: self.lens_distortion_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.lens_distortion_slider, self.lens_distortion_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Grid Color:"), 3, 0)
         self.lens_grid_color_btn = QPushButton()
@@ -279,17 +272,17 @@ class ExperimentalControlsMixin:
     def _select_lens_grid_color(self):
         color = QColorDialog.getColor(QColor(50, 50, 80), self, "Select Grid Color")
         if color.isValid():
-            self.lens_grid_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.lens_grid_color_btn, color)
 
     def _select_lens_center_color(self):
         color = QColorDialog.getColor(QColor(100, 150, 255), self, "Select Lens Color")
         if color.isValid():
-            self.lens_center_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.lens_center_color_btn, color)
 
     def _select_lens_edge_color(self):
         color = QColorDialog.getColor(QColor(50, 100, 200), self, "Select Edge Color")
         if color.isValid():
-            self.lens_edge_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.lens_edge_color_btn, color)
 
     def _create_global_experimental_controls(self):
         """Create global controls for experimental effects"""
@@ -303,8 +296,7 @@ class ExperimentalControlsMixin:
         layout.addWidget(self.experimental_opacity_slider, 0, 1)
         self.experimental_opacity_value = QLabel("80%")
         layout.addWidget(self.experimental_opacity_value, 0, 2)
-        self.experimental_opacity_slider.valueChanged.connect(
-            lambda v: self.experimental_opacity_value.setText(f"{v}%"))
+        self._bind_value_label(self.experimental_opacity_slider, self.experimental_opacity_value, "{}%")
 
         group.setLayout(layout)
         return group
@@ -31,8 +31,7 @@ class VisualControlsMixin:
         layout.addWidget(self.segments_slider, 0, 1)
         self.segments_value = QLabel("8")
         layout.addWidget(self.segments_value, 0, 2)
-        self.segments_slider.valueChanged.connect(
-            lambda v: self.segments_value.setText(str(v)))
+        self._bind_value_label(self.segments_slider, self.segments_value)
 
         # Rotation speed
         layout.addWidget(QLabel("Rotation:"), 1, 0)
@@ -42,8 +41,7 @@ class VisualControlsMixin:
         layout.addWidget(self.rotation_slider, 1, 1)
         self.rotation_value = QLabel("0.5")
         layout.addWidget(self.rotation_value, 1, 2)
-        self.rotation_slider.valueChanged.connect(
-            lambda v: self.rotation_value.setText(str(v/100)))
+        self._bind_value_label(self.rotation_slider, self.rotation_value, divisor=100)
 
         # Symmetry mode
         layout.addWidget(QLabel("Symmetry:"), 2, 0)
@@ -93,8 +91,7 @@ class VisualControlsMixin:
         layout.addWidget(self.blur_slider, 4, 1)
         self.blur_value = QLabel("0")
         layout.addWidget(self.blur_value, 4, 2)
-        self.blur_slider.valueChanged.connect(
-            lambda v: self.blur_value.setText(str(v)))
+        self._bind_value_label(self.blur_slider, self.blur_value)
 
         # Distortion
         layout.addWidget(QLabel("Distortion:"), 5, 0)
@@ -104,8 +101,7 @@ class VisualControlsMixin:
         layout.addWidget(self.distortion_slider, 5, 1)
         self.distortion_value = QLabel("0.0")
         layout.addWidget(self.distortion_value, 5, 2)
-        self.distortion_slider.valueChanged.connect(
-            lambda v: self.distortion_value.setText(str(v/100)))
+        self._bind_value_label(self.distortion_slider, self.distortion_value, divisor=100)
 
         # Particle count
         layout.addWidget(QLabel("Particles:"), 6, 0)
@@ -115,8 +111,7 @@ class VisualControlsMixin:
         layout.addWidget(self.particles_slider, 6, 1)
         self.particles_value = QLabel("100")
         layout.addWidget(self.particles_value, 6, 2)
-        self.particles_slider.valueChanged.connect(
-            lambda v: self.particles_value.setText(str(v)))
+        self._bind_value_label(self.particles_slider, self.particles_value)
 
         # Particle size
         layout.addWidget(QLabel("Size:"), 7, 0)
@@ -126,8 +121,7 @@ class VisualControlsMixin:
         layout.addWidget(self.size_slider, 7, 1)
         self.size_value = QLabel("10")
         layout.addWidget(self.size_value, 7, 2)
-        self.size_slider.valueChanged.connect(
-            lambda v: self.size_value.setText(str(v)))
+        self._bind_value_label(self.size_slider, self.size_value)
 
         # Trail length
         layout.addWidget(QLabel("Trails:"), 8, 0)
@@ -137,8 +131,7 @@ class VisualControlsMixin:
         layout.addWidget(self.trail_slider, 8, 1)
         self.trail_value = QLabel("5")
         layout.addWidget(self.trail_value, 8, 2)
-        self.trail_slider.valueChanged.connect(
-            lambda v: self.trail_value.setText(str(v)))
+        self._bind_value_label(self.trail_slider, self.trail_value)
 
         group.setLayout(layout)
         return group
@@ -160,8 +153,7 @@ class VisualControlsMixin:
         layout.addWidget(self.depth_slider, 1, 1)
         self.depth_value = QLabel("1.0")
         layout.addWidget(self.depth_value, 1, 2)
-        self.depth_slider.valueChanged.connect(
-            lambda v: self.depth_value.setText(str(v/100)))
+        self._bind_value_label(self.depth_slider, self.depth_value, divisor=100)
 
         layout.addWidget(QLabel("Perspective:"), 2, 0)
         self.perspective_slider = QSlider(Qt.Horizontal)
@@ -170,8 +162,7 @@ class VisualControlsMixin:
         layout.addWidget(self.perspective_slider, 2, 1)
         self.perspective_value = QLabel("800")
         layout.addWidget(self.perspective_value, 2, 2)
-        self.perspective_slider.valueChanged.connect(
-            lambda v: self.perspective_value.setText(str(v)))
+        self._bind_value_label(self.perspective_slider, self.perspective_value)
 
         group.setLayout(layout)
         return group
@@ -193,8 +184,7 @@ class VisualControlsMixin:
         layout.addWidget(self.pulse_strength_slider, 1, 1)
         self.pulse_strength_value = QLabel("1.0")
         layout.addWidget(self.pulse_strength_value, 1, 2)
-        self.pulse_strength_slider.valueChanged.connect(
-            lambda v: self.pulse_strength_value.setText(str(v/100)))
+        self._bind_value_label(self.pulse_strength_slider, self.pulse_strength_value, divisor=100)
 
         layout.addWidget(QLabel("Attack:"), 2, 0)
         self.pulse_attack_slider = QSlider(Qt.Horizontal)
@@ -203,8 +193,7 @@ class VisualControlsMixin:
         layout.addWidget(self.pulse_attack_slider, 2, 1)
         self.pulse_attack_value = QLabel("0.1")
         layout.addWidget(self.pulse_attack_value, 2, 2)
-        self.pulse_attack_slider.valueChanged.connect(
-            lambda v: self.pulse_attack_value.setText(str(v/100)))
+        self._bind_value_label(self.pulse_attack_slider, self.pulse_attack_value, divisor=100)
 
         layout.addWidget(QLabel("Decay:"), 3, 0)
         self.pulse_decay_slider = QSlider(Qt.Horizontal)
@@ -213,8 +202,7 @@ class VisualControlsMixin:
         layout.addWidget(self.pulse_decay_slider, 3, 1)
         self.pulse_decay_value = QLabel("0.2")
         layout.addWidget(self.pulse_decay_value, 3, 2)
-        self.pulse_decay_slider.valueChanged.connect(
-            lambda v: self.pulse_decay_value.setText(str(v/100)))
+        self._bind_value_label(self.pulse_decay_slider, self.pulse_decay_value, divisor=100)
 
         group.setLayout(layout)
         return group
@@ -231,8 +219,7 @@ class VisualControlsMixin:
         layout.addWidget(self.sensitivity_slider, 0, 1)
         self.sensitivity_value = QLabel("1.0")
         layout.addWidget(self.sensitivity_value, 0, 2)
-        self.sensitivity_slider.valueChanged.connect(
-            lambda v: self.sensitivity_value.setText(str(v/100)))
+        self._bind_value_label(self.sensitivity_slider, self.sensitivity_value, divisor=100)
 
         layout.addWidget(QLabel("Smoothing:"), 1, 0)
         self.smoothing_slider = QSlider(Qt.Horizontal)
@@ -241,8 +228,7 @@ class VisualControlsMixin:
         layout.addWidget(self.smoothing_slider, 1, 1)
         self.smoothing_value = QLabel("0.3")
         layout.addWidget(self.smoothing_value, 1, 2)
-        self.smoothing_slider.valueChanged.connect(
-            lambda v: self.smoothing_value.setText(str(v/100)))
+        self._bind_value_label(self.smoothing_slider, self.smoothing_value, divisor=100)
 
         layout.addWidget(QLabel("Bass:"), 2, 0)
         self.bass_slider = QSlider(Qt.Horizontal)
@@ -251,8 +237,7 @@ class VisualControlsMixin:
         layout.addWidget(self.bass_slider, 2, 1)
         self.bass_value = QLabel("1.0")
         layout.addWidget(self.bass_value, 2, 2)
-        self.bass_slider.valueChanged.connect(
-            lambda v: self.bass_value.setText(str(v/100)))
+        self._bind_value_label(self.bass_slider, self.bass_value, divisor=100)
 
         layout.addWidget(QLabel("Mids:"), 3, 0)
         self.mids_slider = QSlider(Qt.Horizontal)
@@ -261,8 +246,7 @@ class VisualControlsMixin:
         layout.addWidget(self.mids_slider, 3, 1)
         self.mids_value = QLabel("1.0")
         layout.addWidget(self.mids_value, 3, 2)
-        self.mids_slider.valueChanged.connect(
-            lambda v: self.mids_value.setText(str(v/100)))
+        self._bind_value_label(self.mids_slider, self.mids_value, divisor=100)
 
         layout.addWidget(QLabel("Highs:"), 4, 0)
         self.highs_slider = QSlider(Qt.Horizontal)
@@ -271,8 +255,7 @@ class VisualControlsMixin:
         layout.addWidget(self.highs_slider, 4, 1)
         self.highs_value = QLabel("1.0")
         layout.addWidget(self.highs_value, 4, 2)
-        self.highs_slider.valueChanged.connect(
-            lambda v: self.highs_value.setText(str(v/100)))
+        self._bind_value_label(self.highs_slider, self.highs_value, divisor=100)
 
         group.setLayout(layout)
         return group
@@ -294,9 +277,12 @@ class VisualControlsMixin:
 
         layout.addWidget(QLabel("Monitor:"), 2, 0)
         self.monitor_combo = QComboBox()
-        for i in range(QApplication.desktop().screenCount()):
-            self.monitor_combo.addItem(f"Monitor {i+1}")
+        self._refresh_monitors()
         layout.addWidget(self.monitor_combo, 2, 1, 1, 2)
+        # Only re-enumerate when a screen is plugged in or removed
+        app = QApplication.instance()
+        app.screenAdded.connect(self._refresh_monitors)
+        app.screenRemoved.connect(self._refresh_monitors)
 
         layout.addWidget(QLabel("Show Frequency:"), 3, 0)
         self.freq_display_check = QCheckBox()
@@ -310,20 +296,30 @@ class VisualControlsMixin:
         layout.addWidget(self.freq_height_slider, 4, 1)
         self.freq_height_value = QLabel("150")
         layout.addWidget(self.freq_height_value, 4, 2)
-        self.freq_height_slider.valueChanged.connect(
-            lambda v: self.freq_height_value.setText(str(v)))
+        self._bind_value_label(self.freq_height_slider, self.freq_height_value)
 
         group.setLayout(layout)
         return group
 
+    def _refresh_monitors(self, *args):
+        """Fill the monitor combo with one entry per connected screen"""
+        current = self.monitor_combo.currentIndex()
+        count = len(QApplication.screens())
+
+        self.monitor_combo.blockSignals(True)
+        self.monitor_combo.clear()
+        self.monitor_combo.addItems([f"Monitor {i+1}" for i in range(count)])
+        self.monitor_combo.setCurrentIndex(min(max(current, 0), count - 1))
+        self.monitor_combo.blockSignals(False)
+
     def _select_base_color(self):
         """Open color dialog for base color selection"""
         color = QColorDialog.getColor(QColor(255, 0, 127), self, "Select Base Color")
         if color.isValid():
-            self.base_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.base_color_btn, color)
 
     def _select_secondary_color(self):
         """Open color dialog for secondary color selection"""
         color = QColorDialog.getColor(QColor(0, 127, 255), self, "Select Secondary Color")
         if color.isValid():
-            self.secondary_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.secondary_color_btn, color)
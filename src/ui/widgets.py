@@ -1,9 +1,11 @@
+import os
 import numpy as np
-from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtWidgets import QWidget, QOpenGLWidget
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPainter, QColor
+from PyQt5.QtGui import QPainter, QColor, QImage, QOpenGLContext
 
 from src.core.kaleidoscope_engine import KaleidoscopeEngine
+from src.core.visualization_components import qimage_array
 
 
 
@@ -11,15 +13,24 @@ from src.core.kaleidoscope_engine import KaleidoscopeEngine
 # UI Module: Visualization Widget
 # =============================================================================
 
-class VisualizationWidget(QWidget):
-    """Widget to display the kaleidoscope visualization"""
+def opengl_available():
+    """Check whether an OpenGL context can be created on this display"""
+    context = QOpenGLContext()
+    return context.create()
+
+
+class VisualizationMixin:
+    """Engine, timer and fullscreen handling shared by the visualization widgets
+
+    Frames are rendered on the animation timer; subclasses combine this
+    with a Qt widget class and call ``draw_frame`` from their paint handler.
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setAttribute(Qt.WA_OpaquePaintEvent)
-        self.setAttribute(Qt.WA_NoSystemBackground)
 
-        # Engine for visualization
+        # Engine for visualization and the last frame it rendered
         self.engine = None
+        self._latest = None
 
         # Animation settings
         self.fps = 60
@@ -47,25 +58,26 @@ class VisualizationWidget(QWidget):
 
     def update_frame(self):
         """Update and render a new frame"""
-        if self.engine:
-            self.update()
+        if not self.engine or not self.isVisible() or not self.engine.needs_render:
+            return
+
+        # Render once per timer tick with new audio or settings; paint
+        # events just show the result
+        self._latest = self.engine.render()
+        self.update()
 
     def process_audio(self, spectrum, bands, volume, raw_audio=None):
         """Process audio data and update visualization"""
         if self.engine:
             self.engine.update(spectrum, bands, volume, raw_audio)
 
-    def paintEvent(self, event):
-        """Paint the current frame"""
-        if not self.engine:
+    def draw_frame(self):
+        """Paint the most recently rendered frame onto the widget"""
+        if self._latest is None:
             return
 
-        # Render new frame
-        image = self.engine.render()
-
-        # Paint to widget
         painter = QPainter(self)
-        painter.drawImage(0, 0, image)
+        painter.drawImage(0, 0, self._latest)
         painter.end()
 
     def set_fps(self, fps):
@@ -73,8 +85,12 @@ class VisualizationWidget(QWidget):
         self.fps = fps
         self.timer.setInterval(1000 // self.fps)
 
-    def toggle_fullscreen(self, fullscreen, monitor=0):
-        """Toggle fullscreen mode"""
+    def toggle_fullscreen(self, fullscreen, monitor=0, screen_geometry=None):
+        """Toggle fullscreen mode
+
+        ``screen_geometry`` is the geometry of the monitor to fill, as
+        resolved by the caller; without it the window stays where it is.
+        """
         if fullscreen == self.is_fullscreen:
             return
 
@@ -87,9 +103,7 @@ class VisualizationWidget(QWidget):
             self.showFullScreen()
 
             # Move to specified monitor
-            desktop = QApplication.desktop()
-            if monitor < desktop.screenCount():
-                screen_geometry = desktop.screenGeometry(monitor)
+            if screen_geometry is not None:
                 self.move(screen_geometry.x(), screen_geometry.y())
                 self.resize(screen_geometry.width(), screen_geometry.height())
         else:
@@ -97,6 +111,42 @@ class VisualizationWidget(QWidget):
             self.showNormal()
 
 
+class VisualizationWidget(VisualizationMixin, QWidget):
+    """Widget to display the kaleidoscope visualization"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+
+    def paintEvent(self, event):
+        """Paint the current frame"""
+        self.draw_frame()
+
+
+class GLVisualizationWidget(VisualizationMixin, QOpenGLWidget):
+    """Experimental visualization widget presented through OpenGL
+
+    Frames are still rendered by the engine on the CPU; QPainter on the
+    OpenGL paint engine uploads each frame as a texture and lets the GPU
+    composite it onto the window.
+    """
+    def paintGL(self):
+        """Paint the current frame"""
+        self.draw_frame()
+
+
+def create_visualization_widget(parent=None):
+    """Create the raster visualization widget
+
+    The OpenGL widget is experimental and only used when the
+    KALEIDOSCOPE_OPENGL environment variable is set to 1 and an OpenGL
+    context can be created.
+    """
+    if os.environ.get("KALEIDOSCOPE_OPENGL") == "1" and opengl_available():
+        return GLVisualizationWidget(parent)
+    return VisualizationWidget(parent)
+
+
 # =============================================================================
 # UI Module: Frequency Display Widget
 # =============================================================================
@@ -105,13 +155,77 @@ class FrequencyDisplayWidget(QWidget):
     """Widget to display audio frequency spectrum"""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.spectrum_data = np.zeros(100)
+        self.spectrum_data = np.zeros(100, dtype=np.float32)
         self.bands = np.zeros(3)
         self.volume = 0
 
+        # Spectrum bars are rasterized into this image with NumPy; the column
+        # layout is rebuilt when the size or number of bins changes
+        self._spectrum_image = None
+        self._bar_layout = None
+
         # Set minimum size
         self.setMinimumHeight(150)
 
+    def _update_bar_layout(self, width, bins):
+        """Work out which pixel columns each spectrum bar covers
+
+        Bars overlap when there are more bins than pixels, so the
+        (column, bin) pairs are split into layers that are drawn in bin
+        order, the same order the bars used to be painted in.
+        """
+        bar_width = width / bins
+        columns, column_bins = [], []
+        for i in range(bins):
+            start = int(i * bar_width)
+            span = np.arange(start, min(width, start + max(1, int(bar_width - 1))))
+            columns.append(span)
+            column_bins.append(np.full(len(span), i))
+        columns = np.concatenate(columns)
+        column_bins = np.concatenate(column_bins)
+
+        # Color based on frequency (blue to red gradient)
+        bin_colors = np.array([
+            QColor.fromHsv(int(240 - (i / bins * 240)), 240, 200).rgba()
+            for i in range(bins)
+        ], dtype=np.uint32)
+
+        # How many earlier bars already cover each pair's column
+        order = np.argsort(columns, kind='stable')
+        starts = np.searchsorted(columns[order], columns[order])
+        depth = np.empty(len(columns), dtype=np.int64)
+        depth[order] = np.arange(len(columns)) - starts
+
+        layers = []
+        for level in range(depth.max() + 1 if len(depth) else 0):
+            pairs = depth == level
+            layers.append((columns[pairs], column_bins[pairs], bin_colors[column_bins[pairs]]))
+        self._bar_layout = (width, bins, layers)
+
+    def _render_spectrum(self, width, height):
+        """Rasterize the background and spectrum bars into an image"""
+        image = self._spectrum_image
+        if image is None or image.width() != width or image.height() != height:
+            image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            self._spectrum_image = image
+
+        bins = len(self.spectrum_data)
+        if self._bar_layout is None or self._bar_layout[:2] != (width, bins):
+            self._update_bar_layout(width, bins)
+
+        # Normalize values (with some amplification), treating NaN as silence
+        values = np.nan_to_num(np.asarray(self.spectrum_data, dtype=np.float64))
+        bar_heights = (np.clip(values * 2, 0.0, 1.0) * height).astype(np.int64)
+
+        pixels = qimage_array(image)
+        pixels.fill(QColor(30, 30, 30).rgba())
+        rows = np.arange(height)[:, None]
+        for columns, column_bins, colors in self._bar_layout[2]:
+            bars = pixels[:, columns]
+            np.copyto(bars, colors[None, :], where=rows >= height - bar_heights[column_bins])
+            pixels[:, columns] = bars
+        return image
+
     def update_data(self, spectrum, bands, volume):
         """Update with new audio data"""
         self.spectrum_data = spectrum
@@ -130,30 +244,8 @@ class FrequencyDisplayWidget(QWidget):
         width = self.width()
         height = self.height()
 
-        # Fill background
-        painter.fillRect(0, 0, width, height, QColor(30, 30, 30))
-
         # Draw spectrum
-        bar_width = width / len(self.spectrum_data)
-        for i, value in enumerate(self.spectrum_data):
-            # Check for NaN and normalize value (with some amplification)
-            if np.isnan(value):
-                norm_value = 0
-            else:
-                norm_value = min(1.0, value * 2)
-            bar_height = int(norm_value * height)
-
-            # Color based on frequency (blue to red gradient)
-            hue = 240 - (i / len(self.spectrum_data) * 240)
-            color = QColor.fromHsv(int(hue), 240, 200)
-
-            painter.fillRect(
-                int(i * bar_width),
-                height - bar_height,
-                max(1, int(bar_width - 1)),
-                bar_height,
-                color
-            )
+        painter.drawImage(0, 0, self._render_spectrum(width, height))
 
         # Draw frequency band indicators
         band_width = width / 3
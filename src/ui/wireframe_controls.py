@@ -48,8 +48,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_size_slider, 4, 1)
         self.wireframe_size_value = QLabel("100")
         layout.addWidget(self.wireframe_size_value, 4, 2)
-        self.wireframe_size_slider.valueChanged.connect(
-            lambda v: self.wireframe_size_value.setText(str(v)))
+        self._bind_value_label(self.wireframe_size_slider, self.wireframe_size_value)
 
         layout.addWidget(QLabel("Rotation Speed:"), 5, 0)
         self.wireframe_rotation_slider = QSlider(Qt.Horizontal)
@@ -58,8 +57,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_rotation_slider, 5, 1)
         self.wireframe_rotation_value = QLabel("1.0")
         layout.addWidget(self.wireframe_rotation_value, 5, 2)
-        self.wireframe_rotation_slider.valueChanged.connect(
-            lambda v: self.wireframe_rotation_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.wireframe_rotation_slider, self.wireframe_rotation_value, "{:.1f}", divisor=100)
 
         group.setLayout(layout)
         return group
@@ -100,8 +98,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_vertex_slider, 4, 1)
         self.wireframe_vertex_value = QLabel("3")
         layout.addWidget(self.wireframe_vertex_value, 4, 2)
-        self.wireframe_vertex_slider.valueChanged.connect(
-            lambda v: self.wireframe_vertex_value.setText(str(v)))
+        self._bind_value_label(self.wireframe_vertex_slider, self.wireframe_vertex_value)
 
         layout.addWidget(QLabel("Edge Glow:"), 5, 0)
         self.wireframe_glow_check = QCheckBox()
@@ -115,8 +112,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_glow_slider, 6, 1)
         self.wireframe_glow_value = QLabel("0.5")
         layout.addWidget(self.wireframe_glow_value, 6, 2)
-        self.wireframe_glow_slider.valueChanged.connect(
-            lambda v: self.wireframe_glow_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.wireframe_glow_slider, self.wireframe_glow_value, "{:.1f}", divisor=100)
 
         group.setLayout(layout)
         return group
@@ -138,8 +134,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_count_slider, 1, 1)
         self.wireframe_count_value = QLabel("3")
         layout.addWidget(self.wireframe_count_value, 1, 2)
-        self.wireframe_count_slider.valueChanged.connect(
-            lambda v: self.wireframe_count_value.setText(str(v)))
+        self._bind_value_label(self.wireframe_count_slider, self.wireframe_count_value)
 
         layout.addWidget(QLabel("Show Echo:"), 2, 0)
         self.wireframe_echo_check = QCheckBox()
@@ -153,8 +148,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_echo_count_slider, 3, 1)
         self.wireframe_echo_count_value = QLabel("3")
         layout.addWidget(self.wireframe_echo_count_value, 3, 2)
-        self.wireframe_echo_count_slider.valueChanged.connect(
-            lambda v: self.wireframe_echo_count_value.setText(str(v)))
+        self._bind_value_label(self.wireframe_echo_count_slider, self.wireframe_echo_count_value)
 
         layout.addWidget(QLabel("Echo Opacity:"), 4, 0)
         self.wireframe_echo_opacity_slider = QSlider(Qt.Horizontal)
@@ -163,8 +157,7 @@ class WireframeControlsMixin:
         layout.addWidget(self.wireframe_echo_opacity_slider, 4, 1)
         self.wireframe_echo_opacity_value = QLabel("0.3")
         layout.addWidget(self.wireframe_echo_opacity_value, 4, 2)
-        self.wireframe_echo_opacity_slider.valueChanged.connect(
-            lambda v: self.wireframe_echo_opacity_value.setText(f"{v/100:.1f}"))
+        self._bind_value_label(self.wireframe_echo_opacity_slider, self.wireframe_echo_opacity_value, "{:.1f}", divisor=100)
 
         layout.addWidget(QLabel("Auto Morph:"), 5, 0)
         self.wireframe_auto_morph_check = QCheckBox()
@@ -183,16 +176,16 @@ class WireframeControlsMixin:
         """Open color dialog for wireframe primary color selection"""
         color = QColorDialog.getColor(QColor(255, 255, 255), self, "Select Wireframe Color")
         if color.isValid():
-            self.wireframe_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.wireframe_color_btn, color)
 
     def _select_wireframe_secondary_color(self):
         """Open color dialog for wireframe secondary color selection"""
         color = QColorDialog.getColor(QColor(0, 200, 255), self, "Select Wireframe Secondary Color")
         if color.isValid():
-            self.wireframe_secondary_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.wireframe_secondary_color_btn, color)
 
     def _select_cube_color(self):
         """Open color dialog for cube color selection"""
         color = QColorDialog.getColor(QColor(255, 255, 255), self, "Select Cube Color")
         if color.isValid():
-            self.cube_color_btn.setStyleSheet(f"background-color: {color.name()}")
+            self._set_button_color(self.cube_color_btn, color)
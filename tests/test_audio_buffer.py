@@ -0,0 +1,62 @@
+"""Tests for the audio ring buffer shared by the stream callback and processor."""
+
+import sys
+import os
+import threading
+import numpy as np
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.audio_buffer import AudioRingBuffer
+
+
+def test_push_pop_wraps_around():
+    """Samples come out in order across the end of the buffer."""
+    ring = AudioRingBuffer(8)
+    out = np.empty(3, dtype=np.int16)
+    ring.push(np.arange(6, dtype=np.int16))
+    assert ring.pop(out)
+    ring.push(np.arange(6, 10, dtype=np.int16))
+
+    assert ring.pop(out)
+    assert list(out) == [3, 4, 5]
+    assert ring.pop(out)
+    assert list(out) == [6, 7, 8]
+    assert ring.available() == 1
+
+
+def test_pop_times_out_without_data():
+    """pop reports a timeout instead of blocking forever."""
+    ring = AudioRingBuffer(8)
+    out = np.zeros(4, dtype=np.int16)
+    assert not ring.pop(out, timeout=0.01)
+    assert not out.any()
+
+
+def test_overrun_skips_to_newest_chunk():
+    """A consumer that falls behind gets the most recent audio."""
+    ring = AudioRingBuffer(8)
+    ring.push(np.arange(20, dtype=np.int16))
+    out = np.empty(4, dtype=np.int16)
+    assert ring.pop(out)
+    assert list(out) == [16, 17, 18, 19]
+
+
+def test_pop_waits_for_producer_thread():
+    """A blocked pop wakes up when another thread pushes."""
+    ring = AudioRingBuffer(16)
+    out = np.empty(4, dtype=np.int16)
+    producer = threading.Timer(0.02, ring.push, args=(np.arange(4, dtype=np.int16),))
+    producer.start()
+    assert ring.pop(out, timeout=1.0)
+    producer.join()
+    assert list(out) == [0, 1, 2, 3]
+
+
+if __name__ == "__main__":
+    test_push_pop_wraps_around()
+    test_pop_times_out_without_data()
+    test_overrun_skips_to_newest_chunk()
+    test_pop_waits_for_producer_thread()
+    print("All audio ring buffer tests passed!")
@@ -5,11 +5,22 @@ Tests the FFT and signal processing math without requiring audio hardware.
 
 import sys
 import os
+import types
 import numpy as np
 
 # Add project root so imports work
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+# AudioProcessor only needs PyAudio's format constants until its stream is
+# opened in run(), which these tests never call; stand in for the module
+# where PyAudio isn't installed
+try:
+    import pyaudio  # noqa: F401
+except ImportError:
+    sys.modules["pyaudio"] = types.SimpleNamespace(paInt16=8, paContinue=0)
+
+from src.core.audio_processing import AudioProcessor
+
 
 def test_fft_output_shape():
     """FFT of a real signal has the expected output length."""
@@ -72,6 +83,115 @@ def test_nan_to_num_safety():
     assert not np.any(np.isinf(cleaned))
 
 
+def test_scaled_hann_keeps_tone_peak():
+    """A mean-normalized Hann window leaves a bin-centred tone's peak unchanged."""
+    chunk_size = 2048
+    t = np.arange(chunk_size)
+    signal = np.sin(2 * np.pi * 40 * t / chunk_size)
+    hann = np.hanning(chunk_size)
+    windowed = np.abs(np.fft.rfft(signal * hann / hann.mean()))
+    plain = np.abs(np.fft.rfft(signal))
+    assert np.argmax(windowed) == np.argmax(plain) == 40
+    assert abs(windowed[40] - plain[40]) / plain[40] < 1e-3
+
+
+def test_hop_smoothing_matches_chunk_smoothing():
+    """Smoothing once per hop decays as fast as smoothing once per chunk."""
+    chunk_size, hop_size, smoothing = 2048, 512, 0.3
+    hop_smoothing = smoothing ** (hop_size / chunk_size)
+    value = 1.0
+    for _ in range(chunk_size // hop_size):
+        value *= hop_smoothing
+    assert abs(value - smoothing) < 1e-9
+
+
+def _tone_hops(processor, freq_hz, hops, amplitude=0.5):
+    """Split a continuous int16 sine tone into hops of the processor's size"""
+    t = np.arange(processor.hop_size * hops) / processor.rate
+    tone = np.rint(np.sin(2 * np.pi * freq_hz * t) * amplitude * 32767).astype(np.int16)
+    return tone.reshape(hops, processor.hop_size)
+
+
+def _run_hops(processor, hops):
+    """Process the hops, asking for data before each; return what was emitted"""
+    emitted = []
+    processor.audio_data.connect(lambda *args: emitted.append(args))
+    for hop in hops:
+        processor.request_data()
+        processor._process(hop)
+    return emitted
+
+
+def test_processor_emits_typed_results():
+    """Each emitted update has the documented dtypes and shapes."""
+    processor = AudioProcessor()
+    fft_data = processor.fft_data
+    emitted = _run_hops(processor, _tone_hops(processor, 440, 4))
+
+    assert len(emitted) == 1
+    spectrum, bands, volume, raw = emitted[-1]
+    assert spectrum.dtype == np.float32 and spectrum.shape == (99,)
+    assert bands.dtype == np.float64 and bands.shape == (3,)
+    assert isinstance(volume, float) and 0 < volume < 1
+    assert raw.dtype == np.float32 and raw.shape == (processor.chunk_size,)
+
+    # The smoothed spectrum is updated in place, and emitted as copies
+    assert processor.fft_data is fft_data and fft_data.dtype == np.float32
+    assert not np.shares_memory(spectrum, fft_data)
+    assert not np.shares_memory(raw, processor._samples)
+
+
+def test_processor_finds_tone_peak():
+    """A 440 Hz tone peaks in its FFT bin of the emitted spectrum."""
+    processor = AudioProcessor()
+    spectrum = _run_hops(processor, _tone_hops(processor, 440, 4))[-1][0]
+    peak_bin = round(440 * processor.chunk_size / processor.rate)
+    assert np.argmax(spectrum) + processor._spectrum_bins.start == peak_bin
+
+
+def test_processor_bands_follow_tone_pitch():
+    """Low, mid and high tones land in the low, mid and high bands."""
+    for band, freq_hz in enumerate((100, 1000, 10000)):
+        processor = AudioProcessor()
+        bands = _run_hops(processor, _tone_hops(processor, freq_hz, 4))[-1][1]
+        assert np.argmax(bands) == band, (freq_hz, bands)
+
+
+def test_processor_silent_input():
+    """Silence gives zero volume, spectrum and bands."""
+    processor = AudioProcessor()
+    hops = np.zeros((4, processor.hop_size), dtype=np.int16)
+    spectrum, bands, volume, raw = _run_hops(processor, hops)[-1]
+    assert volume == 0.0
+    assert not spectrum.any() and not bands.any() and not raw.any()
+
+
+def test_processor_emits_once_per_chunk():
+    """Updates keep the one-per-chunk rate even when requested every hop."""
+    processor = AudioProcessor()
+    hops_per_chunk = processor.chunk_size // processor.hop_size
+    emitted = _run_hops(processor, _tone_hops(processor, 440, hops_per_chunk * 3))
+    assert len(emitted) == 3
+
+
+def test_processor_waits_for_request_data():
+    """After an update, nothing more is emitted until request_data is called."""
+    processor = AudioProcessor()
+    emitted = []
+    processor.audio_data.connect(lambda *args: emitted.append(args))
+    hops_per_chunk = processor.chunk_size // processor.hop_size
+    hops = _tone_hops(processor, 440, hops_per_chunk * 2 + 1)
+
+    for hop in hops[:hops_per_chunk * 2]:
+        processor._process(hop)
+    assert len(emitted) == 1
+
+    # A chunk has already passed, so the next hop is emitted right away
+    processor.request_data()
+    processor._process(hops[-1])
+    assert len(emitted) == 2
+
+
 if __name__ == "__main__":
     test_fft_output_shape()
     test_fft_pure_tone_peak()
@@ -79,4 +199,12 @@ if __name__ == "__main__":
     test_smoothing()
     test_frequency_bands()
     test_nan_to_num_safety()
+    test_scaled_hann_keeps_tone_peak()
+    test_hop_smoothing_matches_chunk_smoothing()
+    test_processor_emits_typed_results()
+    test_processor_finds_tone_peak()
+    test_processor_bands_follow_tone_pitch()
+    test_processor_silent_input()
+    test_processor_emits_once_per_chunk()
+    test_processor_waits_for_request_data()
     print("All kaleidoscope audio processing tests passed!")
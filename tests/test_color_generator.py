@@ -0,0 +1,101 @@
+"""Tests for ColorGenerator's scalar and vectorized color modes."""
+
+import sys
+import os
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtGui import QColor
+
+from src.core.visualization_components import ColorGenerator
+
+
+def test_spectrum_array_matches_scalar_colors():
+    """Vectorized spectrum colors equal the per-point QColor results."""
+    freq_index = np.arange(0, 99, 7)
+    intensity = np.linspace(0.1, 1.0, len(freq_index))
+    alpha = np.linspace(0, 255, len(freq_index)).astype(np.int32)
+
+    packed = ColorGenerator.get_color_array("spectrum", {
+        'freq_index': freq_index,
+        'intensity': intensity,
+        'spectrum_length': 99,
+        'alpha': alpha
+    })
+
+    for i, value in enumerate(packed):
+        expected = ColorGenerator.get_color("spectrum", {
+            'freq_index': int(freq_index[i]),
+            'intensity': float(intensity[i]),
+            'spectrum_length': 99,
+            'alpha': int(alpha[i])
+        })
+        assert QColor.fromRgba(int(value)) == expected
+
+
+def test_spectrum_palette_covers_every_frequency():
+    """Palette lookups match hsv_to_rgb for every frequency index."""
+    rng = np.random.default_rng(3)
+    freq_index = np.arange(100)
+    intensity = rng.random(100)
+    alpha = 255
+
+    packed = ColorGenerator.get_color_array("spectrum", {
+        'freq_index': freq_index,
+        'intensity': intensity,
+        'spectrum_length': 100,
+        'alpha': alpha
+    })
+
+    for i, value in enumerate(packed):
+        expected = ColorGenerator.get_color("spectrum", {
+            'freq_index': int(freq_index[i]),
+            'intensity': float(intensity[i]),
+            'spectrum_length': 100,
+            'alpha': 255
+        })
+        assert QColor.fromRgba(int(value)) == expected
+
+
+def test_gradient_array_matches_scalar_colors():
+    """Vectorized gradient colors equal the per-point QColor results."""
+    base, secondary = QColor(255, 0, 127), QColor(0, 127, 255)
+    ratio = np.linspace(0.0, 1.0, 9)
+
+    packed = ColorGenerator.get_color_array("gradient", {
+        'base_color': base,
+        'secondary_color': secondary,
+        'ratio': ratio,
+        'alpha': 200
+    })
+
+    for i, value in enumerate(packed):
+        expected = ColorGenerator.get_color("gradient", {
+            'base_color': base,
+            'secondary_color': secondary,
+            'ratio': float(ratio[i]),
+            'alpha': 200
+        })
+        assert QColor.fromRgba(int(value)) == expected
+
+
+def test_solid_array_uses_base_color():
+    """Solid mode packs the base color with each alpha."""
+    packed = ColorGenerator.get_color_array("solid", {
+        'base_color': QColor(10, 20, 30),
+        'alpha': np.array([0, 128, 255])
+    })
+    assert [QColor.fromRgba(int(v)).getRgb() for v in packed] == [
+        (10, 20, 30, 0), (10, 20, 30, 128), (10, 20, 30, 255)]
+
+
+if __name__ == "__main__":
+    test_spectrum_array_matches_scalar_colors()
+    test_spectrum_palette_covers_every_frequency()
+    test_gradient_array_matches_scalar_colors()
+    test_solid_array_uses_base_color()
+    print("All color generator tests passed!")
@@ -0,0 +1,153 @@
+"""Tests for pushing ControlPanel settings to the engine.
+
+Uses the offscreen Qt platform, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QColor
+
+app = QApplication.instance() or QApplication([])
+
+from src.core.kaleidoscope_engine import KaleidoscopeEngine
+from src.ui.control_panel import ControlPanel
+
+
+class AudioSettings:
+    """Stands in for AudioProcessor's settings without opening a stream"""
+    def __init__(self):
+        self.sensitivity = None
+        self.smoothing = None
+
+    def set_sensitivity(self, value):
+        self.sensitivity = value
+
+    def set_smoothing(self, value):
+        self.smoothing = value
+
+
+def test_apply_only_pushes_changed_settings():
+    """Re-applying unchanged settings leaves the engine state alone."""
+    panel = ControlPanel()
+    engine = KaleidoscopeEngine(200, 150)
+    audio = AudioSettings()
+
+    panel.apply_to_engine(engine, audio)
+    assert audio.sensitivity == panel.sensitivity_slider.value() / 100
+    particles = engine.particles
+
+    # Nothing changed, so the particles are not recreated
+    panel.apply_to_engine(engine, audio)
+    assert engine.particles is particles
+
+    panel.particles_slider.setValue(panel.particles_slider.value() + 10)
+    panel.apply_to_engine(engine, audio)
+    assert engine.particles is not particles
+    assert engine.max_particles == panel.particles_slider.value()
+
+
+def test_pushed_colors_are_snapshots():
+    """A receiver changing a pushed color doesn't force another push."""
+    panel = ControlPanel()
+    received = []
+
+    def set_color(color):
+        color.setAlpha(30)  # Like the experimental effects' color setters
+        received.append(color)
+
+    panel._push('color', set_color, QColor(10, 20, 30))
+    panel._push('color', set_color, QColor(10, 20, 30))
+    assert len(received) == 1
+    assert panel._last_applied['color'][0][0] == QColor(10, 20, 30)
+
+
+def test_new_engine_gets_every_setting():
+    """Switching engines pushes the full set of settings again."""
+    panel = ControlPanel()
+    audio = AudioSettings()
+    panel.segments_slider.setValue(5)
+    panel.apply_to_engine(KaleidoscopeEngine(200, 150), audio)
+
+    engine = KaleidoscopeEngine(200, 150)
+    panel.apply_to_engine(engine, audio)
+    assert engine.segments == 5
+
+
+def test_button_colors_follow_stylesheet():
+    """Cached button colors track stylesheet changes and are returned as copies."""
+    panel = ControlPanel()
+    assert panel._button_color(panel.base_color_btn) == QColor(255, 0, 127)
+
+    first = panel._button_color(panel.base_color_btn)
+    first.setAlpha(10)
+    assert panel._button_color(panel.base_color_btn).alpha() == 255
+
+    panel.base_color_btn.setStyleSheet("background-color: #102030")
+    engine = KaleidoscopeEngine(200, 150)
+    panel.apply_to_engine(engine, AudioSettings())
+    assert engine.base_color == QColor(16, 32, 48)
+
+
+def test_settings_changed_names_the_control():
+    """Changing a control emits settingsChanged with its attribute name."""
+    panel = ControlPanel()
+    changed = []
+    panel.settingsChanged.connect(changed.append)
+
+    panel.bass_slider.setValue(panel.bass_slider.value() + 1)
+    panel.shape_combo.setCurrentIndex(1)
+    panel.enable_3d_check.toggle()
+    assert changed == ["bass_slider", "shape_combo", "enable_3d_check"]
+
+    panel._set_button_color(panel.waveform_color_btn, QColor(1, 2, 3))
+    assert changed[-1] == "waveform_color_btn"
+    assert panel._button_color(panel.waveform_color_btn) == QColor(1, 2, 3)
+
+
+def test_value_labels_follow_sliders():
+    """Each slider's label shows its value in the slider's format."""
+    panel = ControlPanel()
+    panel.segments_slider.setValue(12)
+    panel.rotation_slider.setValue(57)
+    panel.waveform_rotation_slider.setValue(25)
+    panel.waveform_radius_slider.setValue(64)
+    panel.tunnel_interval_slider.setValue(900)
+
+    assert panel.segments_value.text() == "12"
+    assert panel.rotation_value.text() == "0.57"
+    assert panel.waveform_rotation_value.text() == "0.025"
+    assert panel.waveform_radius_value.text() == "64%"
+    assert panel.tunnel_interval_value.text() == "15.0s"
+
+
+def test_reset_reports_one_change():
+    """Resetting many controls emits settingsChanged once."""
+    panel = ControlPanel()
+    panel.segments_slider.setValue(12)
+    panel.shape_combo.setCurrentIndex(1)
+    panel._set_button_color(panel.base_color_btn, QColor(1, 2, 3))
+
+    changed = []
+    panel.settingsChanged.connect(changed.append)
+    panel.reset_to_defaults()
+    assert changed == [""]
+    # Value labels still follow their sliders
+    assert panel.segments_value.text() == "8"
+
+
+if __name__ == "__main__":
+    test_apply_only_pushes_changed_settings()
+    test_pushed_colors_are_snapshots()
+    test_new_engine_gets_every_setting()
+    test_button_colors_follow_stylesheet()
+    test_settings_changed_names_the_control()
+    test_value_labels_follow_sliders()
+    test_reset_reports_one_change()
+    print("All control panel tests passed!")
@@ -0,0 +1,62 @@
+"""Tests for the batched DebugConsole log.
+
+Uses the offscreen Qt platform, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+from src.ui.debug_console import DebugConsole
+
+
+def test_log_messages_are_batched():
+    """Messages appear once flushed, one line each, in order."""
+    console = DebugConsole()
+    console.log("first")
+    console.log("second")
+    assert console.console.toPlainText() == ""
+
+    console.flush()
+    console.log("third")
+    console.flush()
+    lines = console.console.toPlainText().split("\n")
+    assert [line.split("] ", 1)[1] for line in lines] == ["first", "second", "third"]
+
+
+def test_log_keeps_recent_lines():
+    """The console drops the oldest lines beyond its limit."""
+    console = DebugConsole()
+    for i in range(600):
+        console.log(f"message {i}")
+    console.flush()
+
+    lines = console.console.toPlainText().split("\n")
+    assert len(lines) == 500
+    assert lines[-1].endswith("message 599")
+
+
+def test_hidden_console_waits_until_shown():
+    """Messages logged while hidden are added when the console is shown."""
+    console = DebugConsole()
+    console.log("while hidden")
+    assert not console._flush_timer.isActive()
+
+    console.show()
+    assert console.console.toPlainText().endswith("while hidden")
+    console.hide()
+
+
+if __name__ == "__main__":
+    test_log_messages_are_batched()
+    test_log_keeps_recent_lines()
+    test_hidden_console_waits_until_shown()
+    print("All debug console tests passed!")
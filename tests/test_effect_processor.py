@@ -0,0 +1,129 @@
+"""Tests for the post-processing effects in EffectProcessor.
+
+Runs against plain QImages, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QColor, QPainter
+
+import src.core.visualization_components as visualization_components
+from src.core.visualization_components import EffectProcessor, qimage_array
+
+
+def _make_test_image(width=64, height=48):
+    """Black image with a red block in the middle"""
+    image = QImage(width, height, QImage.Format_ARGB32)
+    image.fill(Qt.black)
+    painter = QPainter(image)
+    painter.fillRect(16, 12, 32, 24, QColor(255, 0, 0))
+    painter.end()
+    return image
+
+
+def test_qimage_array_shares_memory():
+    """Writes through the array view show up in the QImage."""
+    image = QImage(8, 4, QImage.Format_ARGB32)
+    image.fill(Qt.black)
+    pixels = qimage_array(image)
+    assert pixels.shape == (4, 8)
+    pixels[1, 2] = 0xFF00FF00
+    assert image.pixelColor(2, 1) == QColor(0, 255, 0)
+
+
+def test_distortion_zero_amount_is_identity():
+    """No distortion returns the input image untouched."""
+    image = _make_test_image()
+    assert EffectProcessor.apply_distortion(image, 0, 32, 24, 20, 0.0) is image
+
+
+def test_distortion_preserves_size_and_outside_radius():
+    """Pixels outside the distortion radius are copied unchanged."""
+    image = _make_test_image()
+    result = EffectProcessor.apply_distortion(image, 1.0, 32, 24, 10, 0.3)
+    assert result.size() == image.size()
+
+    src = qimage_array(image)
+    dst = qimage_array(result)
+    assert dst[0, 0] == src[0, 0]
+    assert dst[47, 63] == src[47, 63]
+
+
+def test_blur_without_scratch_leaves_input_untouched():
+    """Blurring without scratch buffers returns a new, softened image."""
+    image = _make_test_image()
+    before = qimage_array(image).copy()
+    result = EffectProcessor.apply_blur(image, 2)
+
+    assert result is not image
+    np.testing.assert_array_equal(qimage_array(image), before)
+    # The hard edge of the red block gets softened
+    assert qimage_array(result)[12, 10] != before[12, 10]
+
+
+def test_blur_in_place_keeps_flat_image():
+    """A flat image stays flat when blurred in place with scratch."""
+    image = QImage(64, 48, QImage.Format_ARGB32_Premultiplied)
+    image.fill(QColor(40, 80, 120))
+    scratch = EffectProcessor.create_blur_scratch(64, 48)
+
+    assert EffectProcessor.apply_blur(image, 3, scratch) is image
+    assert image.pixelColor(30, 20) == QColor(40, 80, 120)
+
+
+def test_blur_below_one_is_identity():
+    """Blur amounts under one leave the image untouched, as before."""
+    image = _make_test_image(64, 48).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    before = qimage_array(image).copy()
+    scratch = EffectProcessor.create_blur_scratch(64, 48)
+
+    assert EffectProcessor.apply_blur(image, 0.5) is image
+    assert EffectProcessor.apply_blur(image, 0.9, scratch) is image
+    np.testing.assert_array_equal(qimage_array(image), before)
+
+
+@pytest.mark.skipif(not visualization_components.NUMBA_AVAILABLE, reason="numba not installed")
+def test_distortion_numba_matches_numpy(monkeypatch):
+    """The Numba kernel and the NumPy fallback produce the same image."""
+    image = _make_test_image(80, 60)
+    jit_result = EffectProcessor.apply_distortion(image, 0.8, 40, 30, 35, 1.1)
+
+    monkeypatch.setattr(visualization_components, "NUMBA_AVAILABLE", False)
+    numpy_result = EffectProcessor.apply_distortion(image, 0.8, 40, 30, 35, 1.1)
+
+    # Float rounding may move the odd sample by a pixel
+    matching = np.mean(qimage_array(jit_result) == qimage_array(numpy_result))
+    assert matching > 0.99
+
+
+@pytest.mark.skipif(not visualization_components.NUMBA_AVAILABLE, reason="numba not installed")
+def test_blur_numba_matches_numpy():
+    """The in-place Numba box blur gives exactly the NumPy result."""
+    rng = np.random.default_rng(3)
+    for width, height, radius in ((64, 48, 2), (200, 120, 5), (24, 4, 10)):
+        pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        expected = EffectProcessor._box_blur_rows(pixels, radius)
+        expected = EffectProcessor._box_blur_rows(expected.swapaxes(0, 1), radius).swapaxes(0, 1)
+
+        blurred = pixels.copy()
+        visualization_components._box_blur_kernel(blurred, radius)
+        np.testing.assert_array_equal(blurred, expected)
+
+
+if __name__ == "__main__":
+    test_qimage_array_shares_memory()
+    test_distortion_zero_amount_is_identity()
+    test_distortion_preserves_size_and_outside_radius()
+    test_blur_without_scratch_leaves_input_untouched()
+    test_blur_in_place_keeps_flat_image()
+    test_blur_below_one_is_identity()
+    print("All effect processor tests passed!")
@@ -0,0 +1,57 @@
+"""Tests for the NumPy spectrum bars of FrequencyDisplayWidget.
+
+Uses the offscreen Qt platform, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QImage, QColor, QPainter
+
+app = QApplication.instance() or QApplication([])
+
+from src.ui.widgets import FrequencyDisplayWidget
+from src.core.visualization_components import qimage_array
+
+
+def _reference_bars(spectrum, width, height):
+    """The spectrum bars drawn one fillRect per bin"""
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(QColor(30, 30, 30))
+    painter = QPainter(image)
+    bar_width = width / len(spectrum)
+    for i, value in enumerate(spectrum):
+        norm_value = 0 if np.isnan(value) else min(1.0, value * 2)
+        bar_height = int(norm_value * height)
+        hue = 240 - (i / len(spectrum) * 240)
+        painter.fillRect(int(i * bar_width), height - bar_height,
+                         max(1, int(bar_width - 1)), bar_height,
+                         QColor.fromHsv(int(hue), 240, 200))
+    painter.end()
+    return qimage_array(image).copy()
+
+
+def test_spectrum_bars_match_fill_rects():
+    """Rasterized bars equal the per-bin fillRect drawing."""
+    rng = np.random.default_rng(0)
+    spectrum = rng.random(100) * 0.6
+    spectrum[5] = np.nan
+
+    widget = FrequencyDisplayWidget()
+    widget.spectrum_data = spectrum
+    # Wider than the bins, and narrower so that bars overlap
+    for width in (640, 73):
+        image = widget._render_spectrum(width, 120)
+        np.testing.assert_array_equal(qimage_array(image), _reference_bars(spectrum, width, 120))
+
+
+if __name__ == "__main__":
+    test_spectrum_bars_match_fill_rects()
+    print("All frequency display tests passed!")
@@ -0,0 +1,113 @@
+"""Tests for KaleidoscopeEngine frame rendering.
+
+Renders offscreen with synthetic audio data, so no display or audio
+hardware is required.
+"""
+
+import sys
+import os
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+from src.core.kaleidoscope_engine import KaleidoscopeEngine
+from src.core.visualization_components import qimage_array
+
+
+def _run_frames(engine, frames, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(frames):
+        spectrum = (rng.random(99) * 0.5).astype(np.float32)
+        engine.update(spectrum, np.array([0.6, 0.3, 0.2]), 0.4, None)
+        engine.render()
+
+
+def test_particles_stay_inside_dirty_rect():
+    """Nothing is drawn to the particle buffer outside the tracked rect."""
+    np.random.seed(1)
+    engine = KaleidoscopeEngine(200, 150)
+
+    for shape in ("circle", "star"):
+        engine.set_shape_type(shape)
+        _run_frames(engine, 5)
+
+        rect = engine._dirty_rect
+        assert not rect.isEmpty()
+        pixels = qimage_array(engine.buffer_image).copy()
+        pixels[rect.top():rect.bottom() + 1, rect.left():rect.right() + 1] = 0
+        assert not pixels.any()
+
+
+def test_beat_detection_uses_recent_average():
+    """Beats follow the mean of the last 30 bass values."""
+    engine = KaleidoscopeEngine(200, 150)
+    rng = np.random.default_rng(4)
+    history = []
+    prev_bass = cooldown = 0
+    for bass in rng.random(200) ** 3:
+        engine.bands = np.array([bass, 0.1, 0.1])
+        engine.detect_beat()
+
+        history = (history + [bass])[-30:]
+        expected = (len(history) > 5 and cooldown <= 0 and bass > prev_bass
+                    and bass > sum(history) / len(history) * 1.5)
+        assert engine.is_beat == expected or len(history) <= 5
+        if expected:
+            cooldown = 10
+        cooldown -= cooldown > 0
+        prev_bass = bass
+
+
+def test_unchanged_state_is_not_redrawn():
+    """Rendering again without an update returns the same frame untouched."""
+    engine = KaleidoscopeEngine(200, 150)
+    _run_frames(engine, 3)
+    assert not engine.needs_render
+
+    frame = engine.render()
+    pixels = qimage_array(frame).copy()
+    frame.fill(0)
+    assert engine.render() is frame and not qimage_array(frame).any()
+
+    engine.invalidate()
+    np.testing.assert_array_equal(qimage_array(engine.render()), pixels)
+
+
+def test_unchanged_particle_settings_keep_particles():
+    """Only a real change to the particle settings rebuilds the system."""
+    engine = KaleidoscopeEngine(200, 150)
+    particles = engine.particles
+
+    engine.set_particle_settings(engine.max_particles, engine.particle_size, engine.trail_length)
+    assert engine.particles is particles
+
+    engine.set_particle_settings(50, engine.particle_size, engine.trail_length)
+    assert engine.particles is not particles
+
+
+def test_resize_keeps_buffers_of_same_size():
+    """Buffers are only reallocated when the size actually changes."""
+    engine = KaleidoscopeEngine(200, 150)
+    buffer_image = engine.buffer_image
+
+    engine.resize(200, 150)
+    assert engine.buffer_image is buffer_image
+
+    engine.resize(300, 150)
+    assert engine.buffer_image.width() == 300 and engine.final_image.width() == 300
+
+
+if __name__ == "__main__":
+    test_particles_stay_inside_dirty_rect()
+    test_beat_detection_uses_recent_average()
+    test_unchanged_state_is_not_redrawn()
+    test_unchanged_particle_settings_keep_particles()
+    test_resize_keeps_buffers_of_same_size()
+    print("All kaleidoscope engine tests passed!")
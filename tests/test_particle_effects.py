@@ -0,0 +1,207 @@
+"""Tests for the atmospheric particle effects.
+
+Renders into offscreen QImages, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+import random
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+import src.core.particle_effects as particle_effects
+from src.core.particle_effects import (
+    ColorCache, SparkBurst, FlareEmission, FireworkExplosion, MistCloud, ParticleTunnel
+)
+from src.core.visualization_components import qimage_array
+
+
+def test_dead_particles_are_dropped_from_every_column():
+    """Particles that fade out or reach their lifetime are removed."""
+    effect = SparkBurst(200, 150, 100)
+    effect.start()
+    effect.alpha[:] = 255
+    effect.fade_rate[:] = 1
+    effect.alpha[:3] = 1  # Faded out after this frame
+    effect.max_age[3:5] = 1  # Too old after this frame
+    x = effect.x[5:] + effect.vx[5:]
+    fade_rate = effect.fade_rate[5:].copy()
+
+    effect.update(0, 0, 0, 0)
+
+    assert effect.count == effect.particle_count - 5
+    np.testing.assert_allclose(effect.x, x)
+    np.testing.assert_array_equal(effect.fade_rate, fade_rate)
+    assert np.all(effect.alpha == 254)
+
+
+def test_firework_trails_keep_recent_positions():
+    """Trails hold the positions from before each move, oldest first."""
+    effect = FireworkExplosion(200, 150, 100)
+    effect.explosion_height = 0  # Keep the launch particle flying
+    effect.start()
+    effect.max_age[:] = 1000
+    positions = []
+    for _ in range(12):
+        positions.append(effect.x[0])
+        effect.update(0, 0, 0, 0)
+
+    assert effect.trail_count[0] == 10
+    trail = effect.ordered_trails()[0]
+    np.testing.assert_allclose(trail[:, 0], positions[-10:])
+
+
+def test_firework_trails_fade_toward_their_end():
+    """Trails keep the per-segment alpha ramp, brightest at the newest end."""
+    effect = FireworkExplosion(200, 150, 100)
+    effect.active = True
+    effect._spawn(1, 95, 20, 8)
+    effect.size[:] = 3
+    effect.alpha[:] = 240
+    effect.trail[0, :, 0] = np.arange(-10, 90, 10)
+    effect.trail[0, :, 1] = 20
+    effect.trail_count[:] = 8
+
+    image = QImage(100, 40, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    effect.render(painter)
+    painter.end()
+
+    # Newest segment at 6/8 of the alpha, as drawn segment by segment
+    alphas = [image.pixelColor(x, 20).alpha() for x in (15, 35, 75)]
+    assert alphas[0] < alphas[1] < alphas[2] == int(240 * 6 / 8)
+
+
+def test_tunnel_respawns_particles_beyond_the_view():
+    """Tunnel particles flowing out of view start again with no trail."""
+    effect = ParticleTunnel(200, 150, 100)
+    effect.start()
+    effect.direction[:] = 1
+    effect.trail_length[:] = 5
+    effect.update(0, 0, 0, 0)
+    effect.z[0] = -2000
+
+    effect.update(0, 0, 0, 0)
+
+    assert -100 <= effect.z[0] <= 50
+    assert effect.trail_count[0] == 0 and effect.trail_count[1] == 2
+
+
+def test_glows_out_of_view_are_culled():
+    """Only particles whose glow reaches into the painter's window are kept."""
+    effect = MistCloud(200, 150, 100)
+    effect._alloc(4)
+    effect.x[:] = [-20, -20, 420, 200]
+    effect.size[:] = [10, 30, 10, 10]
+
+    image = QImage(400, 300, QImage.Format_ARGB32_Premultiplied)
+    painter = QPainter(image)
+    shown = effect._on_screen(painter, effect.size)
+    painter.end()
+    np.testing.assert_array_equal(shown, [False, True, False, True])
+
+
+def test_color_cache_reuses_pens():
+    """Pens are made once per color, width and alpha."""
+    pen = ColorCache.pens(10, 20, 30)[2, 50]
+    assert pen is ColorCache.pens(10, 20, 30)[2, 50]
+    assert pen.width() == 2 and pen.color() == QColor(10, 20, 30, 50)
+
+
+def test_color_cache_reuses_gradients():
+    """Glow brushes are made once per color and scale to the shape drawn."""
+    brush = ColorCache.radial_gradient(10, 20, 30, 200, 50)
+    assert brush is ColorCache.radial_gradient(10, 20, 30, 200, 50)
+
+    image = QImage(40, 40, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(brush)
+    painter.drawEllipse(20, 0, 20, 20)
+    painter.end()
+    assert image.pixelColor(30, 10).alpha() > 180 and image.pixelColor(10, 10).alpha() == 0
+
+
+@pytest.mark.skipif(not particle_effects.NUMBA_AVAILABLE, reason="numba not installed")
+def test_step_numba_matches_numpy(monkeypatch):
+    """The Numba step kernel and the NumPy fallback advance alike."""
+    np.random.seed(5)
+    jit_effect = FireworkExplosion(200, 150, 100)
+    jit_effect._spawn(50, 200, 150, 5)
+    jit_effect.alpha[:10] = 3
+    numpy_effect = FireworkExplosion(200, 150, 100)
+    numpy_effect._alloc(50)
+    for name in numpy_effect.columns:
+        getattr(numpy_effect, name)[:] = getattr(jit_effect, name)
+
+    jit_alive = jit_effect._advance(0, 0, 0, 0)
+    monkeypatch.setattr(particle_effects, "NUMBA_AVAILABLE", False)
+    numpy_alive = numpy_effect._advance(0, 0, 0, 0)
+
+    np.testing.assert_array_equal(jit_alive, numpy_alive)
+    for name in numpy_effect.columns:
+        np.testing.assert_allclose(getattr(jit_effect, name), getattr(numpy_effect, name), rtol=1e-5)
+
+
+@pytest.mark.skipif(not particle_effects.NUMBA_AVAILABLE, reason="numba not installed")
+def test_mist_drift_numba_matches_numpy(monkeypatch):
+    """The Numba mist drift kernel and the NumPy fallback agree."""
+    np.random.seed(6)
+    jit_effect = MistCloud(200, 150, 100)
+    jit_effect.start()
+    jit_effect.vx[:5] = 0.49  # Pushed past the speed limit by the noise
+    numpy_effect = MistCloud(200, 150, 100)
+    numpy_effect._alloc(jit_effect.count)
+    for name in numpy_effect.columns:
+        getattr(numpy_effect, name)[:] = getattr(jit_effect, name)
+
+    np.random.seed(7)
+    jit_effect._advance(0, 0, 0, 0)
+    monkeypatch.setattr(particle_effects, "NUMBA_AVAILABLE", False)
+    np.random.seed(7)
+    numpy_effect._advance(0, 0, 0, 0)
+
+    for name in numpy_effect.columns:
+        np.testing.assert_allclose(getattr(jit_effect, name), getattr(numpy_effect, name), rtol=1e-5)
+
+
+@pytest.mark.parametrize("effect_class", [SparkBurst, FlareEmission, FireworkExplosion,
+                                          MistCloud, ParticleTunnel])
+def test_effects_render(effect_class):
+    """Every effect draws its particles after a few frames."""
+    random.seed(3)
+    np.random.seed(3)
+    effect = effect_class(200, 150, 100)
+    effect.start()
+    for _ in range(3):
+        effect.update(0.5, 0.5, 0.5, 0.5)
+
+    image = QImage(400, 300, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    effect.render(painter)
+    painter.end()
+    assert qimage_array(image).any()
+
+
+if __name__ == "__main__":
+    test_dead_particles_are_dropped_from_every_column()
+    test_firework_trails_keep_recent_positions()
+    test_firework_trails_fade_toward_their_end()
+    test_tunnel_respawns_particles_beyond_the_view()
+    test_glows_out_of_view_are_culled()
+    test_color_cache_reuses_pens()
+    test_color_cache_reuses_gradients()
+    for effect_class in (SparkBurst, FlareEmission, FireworkExplosion, MistCloud, ParticleTunnel):
+        test_effects_render(effect_class)
+    print("All particle effect tests passed!")
@@ -0,0 +1,74 @@
+"""Tests for the vectorized kaleidoscope particle system."""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import src.core.visualization_components as visualization_components
+from src.core.visualization_components import ParticleSystem
+
+
+def test_trail_keeps_most_recent_points_in_order():
+    """Trails hold at most trail_length points, oldest first."""
+    particles = ParticleSystem(4, 200, 10, 3)
+    positions = []
+    for _ in range(5):
+        particles.update(1.0, 1.0)
+        positions.append(particles.x.copy())
+
+    assert np.all(particles.trail_count == 3)
+    trails = particles.ordered_trails()
+    np.testing.assert_allclose(trails[:, :, 0], np.stack(positions[-3:], axis=1))
+
+
+def test_respawn_clears_trail_of_escaped_particles():
+    """Particles beyond the limit move back inside and lose their trail."""
+    particles = ParticleSystem(2, 200, 10, 5)
+    particles.update(1.0, 1.0)
+    particles.x[:] = [500.0, 0.0]
+    particles.y[:] = [0.0, 0.0]
+
+    particles.respawn_outside(160, 60)
+
+    assert np.hypot(particles.x[0], particles.y[0]) <= 60
+    assert list(particles.trail_count) == [0, 1]
+
+
+def test_size_follows_size_modifier():
+    """Current size is the base size scaled by the size modifier."""
+    particles = ParticleSystem(8, 200, 10, 5)
+    particles.update(1.0, 2.5)
+    np.testing.assert_allclose(particles.current_size, particles.size * 2.5, rtol=1e-6)
+
+
+@pytest.mark.skipif(not visualization_components.NUMBA_AVAILABLE, reason="numba not installed")
+def test_project_trails_numba_matches_numpy(monkeypatch):
+    """The Numba kernel and the NumPy fallback project the same points."""
+    np.random.seed(3)
+    particles = ParticleSystem(20, 200, 10, 6)
+    for frame in range(9):
+        particles.update(1.0, 1.2, 1.0)
+        if frame == 4:
+            particles.trail_count[::3] = 2
+
+    for rotation in (None, (0.3, -1.1, 2.0)):
+        jit_result = particles.project_trails(rotation, 400)
+        monkeypatch.setattr(visualization_components, "NUMBA_AVAILABLE", False)
+        numpy_result = particles.project_trails(rotation, 400)
+        monkeypatch.setattr(visualization_components, "NUMBA_AVAILABLE", True)
+
+        for jit_values, numpy_values in zip(jit_result, numpy_result):
+            np.testing.assert_allclose(jit_values, numpy_values, rtol=1e-4, atol=1e-3)
+
+
+if __name__ == "__main__":
+    test_trail_keeps_most_recent_points_in_order()
+    test_respawn_clears_trail_of_escaped_particles()
+    test_size_follows_size_modifier()
+    print("All particle system tests passed!")
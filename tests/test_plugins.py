@@ -0,0 +1,38 @@
+"""Tests for the color plugins."""
+
+import sys
+import os
+import colorsys
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtGui import QColor
+
+from src.plugins.plugins import SpectrumColorPlugin
+
+
+def _hsv_color(hue, saturation, value, alpha):
+    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, saturation, value)]
+    return QColor(r, g, b, alpha)
+
+
+def test_spectrum_plugin_matches_hsv():
+    """Palette lookups give the same colors as hsv_to_rgb."""
+    plugin = SpectrumColorPlugin()
+    for saturation in (0.8, 0.35):
+        plugin.saturation = saturation
+        for freq_index in (0, 13, 57, 98, 140, np.int64(31)):
+            for intensity in (0.0, 0.33, 0.9):
+                color = plugin.get_color({'freq_index': freq_index, 'intensity': intensity,
+                                          'spectrum_length': 99, 'alpha': 120})
+                hue = (freq_index % 99) / 99
+                assert color == _hsv_color(hue, saturation, intensity, 120)
+
+
+if __name__ == "__main__":
+    test_spectrum_plugin_matches_hsv()
+    print("All plugin tests passed!")
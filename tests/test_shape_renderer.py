@@ -0,0 +1,84 @@
+"""Tests for ShapeRenderer's batched particle drawing.
+
+Renders into offscreen QImages, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPainter
+
+import src.core.visualization_components as visualization_components
+from src.core.visualization_components import ShapeRenderer, qimage_array
+
+
+@pytest.mark.skipif(not visualization_components.NUMBA_AVAILABLE, reason="numba not installed")
+def test_splat_circles_matches_painted_circles():
+    """Splatted circles look like the ones drawn with QPainter."""
+    rng = np.random.default_rng(2)
+    # One circle per grid cell, so drawing order doesn't matter
+    grid_x, grid_y = np.meshgrid(np.arange(20, 400, 40), np.arange(20, 300, 40))
+    xs = grid_x.ravel() + rng.uniform(-3, 3, grid_x.size)
+    ys = grid_y.ravel() + rng.uniform(-3, 3, grid_y.size)
+    sizes = rng.uniform(1, 16, grid_x.size).astype(np.float32)
+    colors = (rng.integers(1, 256, grid_x.size).astype(np.uint32) << 24) | \
+        rng.integers(0, 1 << 24, grid_x.size).astype(np.uint32)
+
+    painted = QImage(400, 300, QImage.Format_ARGB32_Premultiplied)
+    painted.fill(Qt.transparent)
+    painter = QPainter(painted)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    ShapeRenderer.render_circles(painter, xs, ys, sizes, colors)
+    painter.end()
+
+    splatted = QImage(400, 300, QImage.Format_ARGB32_Premultiplied)
+    splatted.fill(Qt.transparent)
+    ShapeRenderer.splat_circles(splatted, xs, ys, sizes, colors)
+
+    # Only the antialiased edges may differ, and then only slightly
+    channels = (400 * 300, 4)
+    diff = np.abs(qimage_array(painted).view(np.uint8).reshape(channels).astype(int)
+                  - qimage_array(splatted).view(np.uint8).reshape(channels).astype(int))
+    assert diff.mean() < 0.5
+    assert diff.max() < 64
+
+
+@pytest.mark.skipif(not visualization_components.NUMBA_AVAILABLE, reason="numba not installed")
+def test_draw_circles_splats_only_for_plain_painters():
+    """draw_circles splats into the image unless the painter transforms."""
+    xs = np.array([30.0, 70.0])
+    ys = np.array([20.0, 40.0])
+    sizes = np.array([5.0, 9.0])
+    colors = np.array([0x80FF0000, 0xFF00FF00], dtype=np.uint32)
+
+    def draw(method, translate=0):
+        image = QImage(100, 60, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.translate(translate, 0)
+        method(painter, image)
+        painter.end()
+        return qimage_array(image).copy()
+
+    splatted = draw(lambda painter, image: ShapeRenderer.splat_circles(image, xs, ys, sizes, colors))
+    painted = draw(lambda painter, image: ShapeRenderer.render_circles(painter, xs, ys, sizes, colors), 10)
+
+    np.testing.assert_array_equal(
+        draw(lambda painter, image: ShapeRenderer.draw_circles(painter, xs, ys, sizes, colors)), splatted)
+    np.testing.assert_array_equal(
+        draw(lambda painter, image: ShapeRenderer.draw_circles(painter, xs, ys, sizes, colors), 10), painted)
+
+
+if __name__ == "__main__":
+    test_splat_circles_matches_painted_circles()
+    test_draw_circles_splats_only_for_plain_painters()
+    print("All shape renderer tests passed!")
@@ -0,0 +1,104 @@
+"""Tests for SymmetryRenderer.
+
+Renders into offscreen QImages, so no display or audio hardware is required.
+"""
+
+import sys
+import os
+import math
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QImage, QColor, QPainter
+
+from src.core.visualization_components import SymmetryRenderer, content_rect, qimage_array
+
+
+def _make_buffer(width=40, height=30):
+    """Transparent buffer with a translucent block off-centre"""
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.fillRect(3, 5, 12, 8, QColor(200, 40, 90, 160))
+    painter.end()
+    return image
+
+
+def _render(buffer_image, params, mode="mirror"):
+    target = QImage(buffer_image.size(), QImage.Format_ARGB32_Premultiplied)
+    target.fill(Qt.black)
+    painter = QPainter(target)
+    SymmetryRenderer.apply_symmetry(painter, buffer_image, mode, params)
+    painter.end()
+    return qimage_array(target).copy()
+
+
+def test_mirror_matches_flipped_copies():
+    """The tiled mirror mode draws the same image as four flipped copies."""
+    buffer_image = _make_buffer()
+
+    expected = QImage(buffer_image.size(), QImage.Format_ARGB32_Premultiplied)
+    expected.fill(Qt.black)
+    painter = QPainter(expected)
+    painter.drawImage(0, 0, buffer_image)
+    painter.drawImage(0, 0, buffer_image.mirrored(True, False))
+    painter.drawImage(0, 0, buffer_image.mirrored(False, True))
+    painter.drawImage(0, 0, buffer_image.mirrored(True, True))
+    painter.end()
+
+    np.testing.assert_array_equal(_render(buffer_image, {}), qimage_array(expected))
+
+
+def test_mirror_reuses_given_tile():
+    """A preallocated tile gives the same result as a temporary one."""
+    buffer_image = _make_buffer()
+    tile = SymmetryRenderer.create_mirror_tile(40, 30)
+
+    result = _render(buffer_image, {'mirror_tile': tile})
+    np.testing.assert_array_equal(result, _render(buffer_image, {}))
+    # The tile holds the horizontally flipped buffer in its top-right quadrant
+    np.testing.assert_array_equal(qimage_array(tile)[:30, 40:], qimage_array(buffer_image)[:, ::-1])
+
+
+def test_content_rect():
+    """The content rect covers the drawn block plus the margin."""
+    buffer_image = _make_buffer()
+    assert content_rect(buffer_image) == QRect(1, 3, 16, 12)
+
+    buffer_image.fill(Qt.transparent)
+    assert content_rect(buffer_image).isEmpty()
+
+
+def test_radial_matches_full_buffer_draw():
+    """Cropping the rotated copies to the content leaves the image as before."""
+    buffer_image = _make_buffer()
+    params = {'segments': 6, 'rotation': 0.4, 'center_x': 20, 'center_y': 15}
+
+    expected = QImage(buffer_image.size(), QImage.Format_ARGB32_Premultiplied)
+    expected.fill(Qt.black)
+    painter = QPainter(expected)
+    for i in range(6):
+        angle = i * (2 * math.pi / 6) + 0.4
+        painter.save()
+        painter.translate(20, 15)
+        painter.rotate(math.degrees(-angle))
+        painter.drawImage(-20, -15, buffer_image)
+        painter.restore()
+    painter.end()
+
+    # Nearest-neighbour sampling may shift the odd pixel
+    result = _render(buffer_image, params, "radial")
+    assert np.mean(result == qimage_array(expected)) > 0.98
+
+
+if __name__ == "__main__":
+    test_mirror_matches_flipped_copies()
+    test_mirror_reuses_given_tile()
+    test_content_rect()
+    test_radial_matches_full_buffer_draw()
+    print("All symmetry renderer tests passed!")
@@ -0,0 +1,70 @@
+"""Tests for the 3D wireframe shape projection."""
+
+import sys
+import os
+import math
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root so imports work
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPainter
+
+from src.core.visualization_components import (
+    WireframeShape, WireframeCube, rotate_3d, rotation_matrix_3d, qimage_array
+)
+
+
+def _project_point(shape, vertex, size, center_x, center_y, perspective):
+    """One vertex rotated about X, Y, then Z and projected, axis by axis"""
+    x, y, z = (c * size for c in vertex)
+    y, z = (y * math.cos(shape.rotation_x) - z * math.sin(shape.rotation_x),
+            y * math.sin(shape.rotation_x) + z * math.cos(shape.rotation_x))
+    x, z = (x * math.cos(shape.rotation_y) + z * math.sin(shape.rotation_y),
+            -x * math.sin(shape.rotation_y) + z * math.cos(shape.rotation_y))
+    x, y = (x * math.cos(shape.rotation_z) - y * math.sin(shape.rotation_z),
+            x * math.sin(shape.rotation_z) + y * math.cos(shape.rotation_z))
+    scale = perspective / (perspective + z)
+    return center_x + x * scale, center_y + y * scale
+
+
+def test_transform_vertices_matches_per_axis_rotation():
+    """The rotation matrix projects vertices like the per-axis rotations."""
+    shape = WireframeCube(120)
+    shape.rotation_x, shape.rotation_y, shape.rotation_z = 0.4, -1.3, 2.2
+
+    projected = shape._transform_vertices(shape.vertices, 150, 300, 200, 800)
+    expected = [_project_point(shape, v, 150, 300, 200, 800) for v in shape.vertices]
+    np.testing.assert_allclose(projected, expected, rtol=1e-9)
+
+
+def test_rotation_matrix_matches_rotate_3d():
+    """The default axis order is the one rotate_3d applies."""
+    points = np.random.default_rng(2).uniform(-100, 100, (10, 3))
+    angles = (0.7, 1.9, -0.5)
+
+    rotated = points @ rotation_matrix_3d(*angles)
+    np.testing.assert_allclose(rotated.T, rotate_3d(*points.T, *angles), atol=1e-9)
+
+
+def test_shape_without_vertices_draws_nothing():
+    """A shape with no vertices projects to an empty array and renders nothing."""
+    shape = WireframeShape(50)
+    assert shape._transform_vertices(shape.vertices, 50, 100, 100).shape == (0, 2)
+
+    image = QImage(200, 200, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    shape.render(painter, 100, 100)
+    painter.end()
+    assert not qimage_array(image).any()
+
+
+if __name__ == "__main__":
+    test_transform_vertices_matches_per_axis_rotation()
+    test_rotation_matrix_matches_rotate_3d()
+    test_shape_without_vertices_draws_nothing()
+    print("All wireframe shape tests passed!")